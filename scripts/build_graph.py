@@ -0,0 +1,271 @@
+"""
+Dependency-graph scheduler for build stages.
+Runs fetch/transform/write stages as soon as their inputs are ready,
+skips everything downstream of a failure, and reports per-stage timings
+and the critical path.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from scripts.config import logger
+
+
+# Stage statuses
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+# Stage function: receives upstream results keyed by stage name
+StageFunc = Callable[[Dict[str, Any]], Any]
+
+
+class Stage:
+    """
+    A node of the build graph.
+
+    Attributes:
+        name: Unique stage name (e.g., 'transform:homepage')
+        func: Called with {dependency name: result}; its return value is
+            the stage result, an exception marks the stage failed
+        deps: Names of stages that must succeed first
+    """
+
+    def __init__(self, name: str, func: StageFunc, deps: Iterable[str] = ()) -> None:
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+
+    def __repr__(self) -> str:
+        return f"<Stage {self.name} deps={self.deps}>"
+
+
+class BuildReport:
+    """
+    Outcome of a graph run.
+
+    Attributes:
+        graph: Graph name (for logs)
+        results: Result per succeeded stage
+        statuses: 'succeeded', 'failed' or 'skipped' per stage
+        errors: Error message per failed stage
+        timings: (start, end) seconds since the run started, per stage
+            that ran
+        wall_time: Seconds the whole run took
+    """
+
+    def __init__(self, graph: str, stages: Dict[str, Stage]) -> None:
+        self.graph = graph
+        self._stages = stages
+        self.results: Dict[str, Any] = {}
+        self.statuses: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self.wall_time = 0.0
+
+    def succeeded(self, name: str) -> bool:
+        """Check whether a stage ran successfully."""
+        return self.statuses.get(name) == SUCCEEDED
+
+    def duration(self, name: str) -> float:
+        """Seconds a stage ran (0 if it never ran)."""
+        start, end = self.timings.get(name, (0.0, 0.0))
+        return end - start
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        Find the chain of dependent stages with the longest total run time.
+
+        The build cannot finish faster than this chain, however many
+        stages run in parallel.
+
+        Returns:
+            Tuple of (stage names from first to last, summed duration)
+        """
+        longest: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+
+        # Stages are stored in insertion order, which is topological
+        for name, stage in self._stages.items():
+            if name not in self.timings:
+                continue
+            best_dep = max(
+                (dep for dep in stage.deps if dep in longest),
+                key=lambda dep: longest[dep],
+                default=None
+            )
+            longest[name] = self.duration(name) + (longest[best_dep] if best_dep else 0.0)
+            previous[name] = best_dep
+
+        if not longest:
+            return [], 0.0
+
+        node: Optional[str] = max(longest, key=lambda name: longest[name])
+        total = longest[node]
+        path = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+
+        return list(reversed(path)), total
+
+    def log(self) -> None:
+        """Log per-stage timings, the critical path and a summary."""
+        for name in self._stages:
+            status = self.statuses.get(name, SKIPPED)
+            start, _ = self.timings.get(name, (0.0, 0.0))
+            logger.info(
+                f"⏱️ STAGE_TIMING "
+                f"graph={self.graph} "
+                f"stage={name} "
+                f"status={status} "
+                f"start={start:.3f}s "
+                f"duration={self.duration(name):.3f}s"
+            )
+
+        path, total = self.critical_path()
+        logger.info(
+            f"🧭 CRITICAL_PATH "
+            f"graph={self.graph} "
+            f"duration={total:.3f}s "
+            f"path={'>'.join(path)}"
+        )
+
+        counts = {status: 0 for status in (SUCCEEDED, FAILED, SKIPPED)}
+        for status in self.statuses.values():
+            counts[status] += 1
+        logger.info(
+            f"📊 GRAPH_COMPLETE "
+            f"graph={self.graph} "
+            f"stages={len(self._stages)} "
+            f"succeeded={counts[SUCCEEDED]} "
+            f"failed={counts[FAILED]} "
+            f"skipped={counts[SKIPPED]} "
+            f"wall={self.wall_time:.3f}s"
+        )
+
+
+class BuildGraph:
+    """
+    Declared build stages and their dependencies.
+
+    Stages must be added after the stages they depend on, so the graph
+    is acyclic by construction.
+
+    Attributes:
+        name: Graph name (for logs)
+    """
+
+    def __init__(self, name: str = 'build') -> None:
+        self.name = name
+        self._stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: StageFunc, deps: Iterable[str] = ()) -> None:
+        """
+        Declare a stage.
+
+        Args:
+            name: Unique stage name
+            func: Stage function (receives {dependency name: result})
+            deps: Stages whose results this stage needs
+
+        Raises:
+            ValueError: For a duplicate name or an unknown dependency
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        deps = list(deps)
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {dep}")
+        self._stages[name] = Stage(name, func, deps)
+
+    @property
+    def stages(self) -> Dict[str, Stage]:
+        return dict(self._stages)
+
+    def run(self, concurrency: int = 4) -> BuildReport:
+        """
+        Run every stage once its dependencies have succeeded.
+
+        Ready stages run in parallel on a thread pool. When a stage fails,
+        every stage downstream of it is skipped; independent branches
+        keep running.
+
+        Args:
+            concurrency: Stages running at once
+
+        Returns:
+            BuildReport with results, statuses and timings
+        """
+        report = BuildReport(self.name, self._stages)
+        dependents: Dict[str, List[str]] = {name: [] for name in self._stages}
+        waiting: Dict[str, set] = {}
+        for name, stage in self._stages.items():
+            waiting[name] = set(stage.deps)
+            for dep in stage.deps:
+                dependents[dep].append(name)
+
+        started = time.perf_counter()
+        lock = threading.Lock()
+
+        def execute(stage: Stage) -> Any:
+            inputs = {dep: report.results[dep] for dep in stage.deps}
+            begin = time.perf_counter() - started
+            try:
+                return stage.func(inputs)
+            finally:
+                with lock:
+                    report.timings[stage.name] = (begin, time.perf_counter() - started)
+
+        def skip_downstream(name: str) -> None:
+            pending = list(dependents[name])
+            while pending:
+                dependent = pending.pop()
+                if dependent in report.statuses:
+                    continue
+                report.statuses[dependent] = SKIPPED
+                logger.warning(
+                    f"⏭️ STAGE_SKIPPED "
+                    f"graph={self.name} "
+                    f"stage={dependent} "
+                    f"failed_upstream={name}"
+                )
+                pending.extend(dependents[dependent])
+
+        ready = [name for name, deps in waiting.items() if not deps]
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            running = {}
+            while ready or running:
+                for name in ready:
+                    running[executor.submit(execute, self._stages[name])] = name
+                ready = []
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        report.results[name] = future.result()
+                    except Exception as e:
+                        report.statuses[name] = FAILED
+                        report.errors[name] = str(e)
+                        logger.error(
+                            f"❌ STAGE_FAILED "
+                            f"graph={self.name} "
+                            f"stage={name} "
+                            f"error={str(e)}"
+                        )
+                        skip_downstream(name)
+                        continue
+
+                    report.statuses[name] = SUCCEEDED
+                    for dependent in dependents[name]:
+                        waiting[dependent].discard(name)
+                        if not waiting[dependent] and dependent not in report.statuses:
+                            ready.append(dependent)
+
+        report.wall_time = time.perf_counter() - started
+        return report
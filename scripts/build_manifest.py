@@ -0,0 +1,449 @@
+"""
+Incremental build manifest.
+Records, per output, the versions of the entries it was built from and a
+hash of the code that built it, so unchanged outputs can be skipped.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Set
+
+from scripts.config import logger
+from scripts.contentful_client.raw_resources import collect_linked, resource_raw
+from scripts.writers.content_hash import content_digest
+
+
+MANIFEST_VERSION = 1
+
+# Write stage result for an output skipped because its inputs have not changed
+UP_TO_DATE = 'up_to_date'
+
+# Modules between the API and every transformer (fetching, entry building,
+# stage wiring); editing them can change any output
+ORCHESTRATION_MODULES = ('scripts.contentful_to_jekyll', 'scripts.contentful_client.client')
+
+
+def resource_version(raw: Dict[str, Any]) -> str:
+    """
+    Get the version marker of a raw entry or asset.
+
+    Args:
+        raw: Raw JSON item
+
+    Returns:
+        '<revision>@<updatedAt>' (Delivery API items carry `revision`,
+        management-shaped items `version`)
+    """
+    sys_data = raw.get('sys', {})
+    version = sys_data.get('revision', sys_data.get('version', ''))
+    return f"{version}@{sys_data.get('updatedAt', '')}"
+
+
+def source_versions(entries: List[Any], depth: int) -> Dict[str, str]:
+    """
+    Get the versions of entries and everything they link to.
+
+    Args:
+        entries: SDK or raw-JSON entries an output is built from
+        depth: Link levels the transformer reads
+
+    Returns:
+        Version marker keyed by '<type>:<id>'
+    """
+    raws = [raw for raw in (resource_raw(entry) for entry in entries) if raw is not None]
+    raws.extend(collect_linked(entries, depth))
+    return {
+        f"{raw['sys']['type']}:{raw['sys']['id']}": resource_version(raw)
+        for raw in raws
+    }
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Hash a file's content.
+
+    Args:
+        path: File path
+
+    Returns:
+        SHA-256 hex digest, or None if the file cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            return content_digest(f.read())
+    except OSError:
+        return None
+
+
+def _with_imports(module: ModuleType) -> Set[ModuleType]:
+    """Get a project module plus the project modules it imports from."""
+    modules = {module}
+    for value in vars(module).values():
+        source = getattr(value, '__module__', None)
+        if isinstance(source, str) and source.startswith('scripts.') and source in sys.modules:
+            modules.add(sys.modules[source])
+    return modules
+
+
+def code_files(*classes: type) -> List[str]:
+    """
+    List the project source files an output's code hash covers.
+
+    Covers the modules of every project class in each class's MRO, the
+    orchestration modules, and the project modules those import from
+    (converters, config, ...). The orchestration modules are located by
+    import spec, since the build script itself runs as __main__.
+
+    Args:
+        classes: Transformer and writer classes an output depends on
+
+    Returns:
+        Sorted absolute file paths
+    """
+    modules: Set[ModuleType] = set()
+    for cls in classes:
+        for base in cls.__mro__:
+            module = sys.modules.get(base.__module__)
+            if module is not None and module.__name__.startswith('scripts.'):
+                modules |= _with_imports(module)
+
+    paths = set()
+    main = sys.modules.get('__main__')
+    main_path = os.path.realpath(getattr(main, '__file__', '') or '')
+    for name in ORCHESTRATION_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec is None or not spec.origin:
+            continue
+        path = os.path.realpath(spec.origin)
+        paths.add(path)
+        module = sys.modules.get(name) or (main if path == main_path else None)
+        if module is not None:
+            modules |= _with_imports(module)
+
+    for module in modules:
+        path = inspect.getsourcefile(module)
+        if path:
+            paths.add(os.path.realpath(path))
+    return sorted(paths)
+
+
+@lru_cache(maxsize=None)
+def code_hash(*classes: type) -> str:
+    """
+    Hash the source of the project code behind an output.
+
+    Editing any file listed by code_files() rebuilds the output.
+
+    Args:
+        classes: Transformer and writer classes an output depends on
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for path in code_files(*classes):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """
+    JSON manifest of the inputs every generated file was built from.
+
+    In incremental mode an output is skipped when its record has the
+    same source versions and code hash as the current run and its files
+    still hold what that build wrote (a checkout or cache restore may
+    have replaced them). The records double as a reverse dependency index (entry
+    or asset ID → outputs built from it) for targeted rebuilds. State is
+    scoped to space, environment and mode like the sync snapshot; a
+    mismatch starts an empty manifest (full rebuild).
+
+    Attributes:
+        path: Manifest file
+        space_id: Contentful space identifier
+        environment: Contentful environment
+        mode: 'production' or 'preview'
+        incremental: Whether skip() may skip outputs (records are kept
+            either way)
+        records: Record per output key ('<locale>:post:<entry id>',
+            '<locale>:data:<name>')
+    """
+
+    def __init__(
+        self,
+        path: str,
+        space_id: str,
+        mode: str = 'production',
+        environment: str = 'master',
+        incremental: bool = True
+    ) -> None:
+        """
+        Initialize build manifest.
+
+        Args:
+            path: Manifest file (its folder is created on save)
+            space_id: Contentful space ID
+            mode: 'production' or 'preview'
+            environment: Contentful environment ID
+            incremental: Skip unchanged outputs (False = only record)
+        """
+        self.path = path
+        self.space_id = space_id
+        self.mode = mode
+        self.environment = environment
+        self.incremental = incremental
+
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stats = {'skipped': 0, 'rebuilt': 0}
+
+    def load(self) -> bool:
+        """
+        Load the manifest from disk.
+
+        Returns:
+            True if a usable manifest was loaded, False otherwise
+        """
+        if not os.path.exists(self.path):
+            logger.info(f"📭 BUILD_MANIFEST_MISSING path={self.path}")
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"⚠️ BUILD_MANIFEST_UNREADABLE "
+                f"path={self.path} "
+                f"error={str(e)}"
+            )
+            return False
+
+        scope = (
+            state.get('version'),
+            state.get('space_id'),
+            state.get('environment'),
+            state.get('mode')
+        )
+        expected = (MANIFEST_VERSION, self.space_id, self.environment, self.mode)
+
+        if scope != expected:
+            logger.warning(
+                f"⚠️ BUILD_MANIFEST_MISMATCH "
+                f"path={self.path} "
+                f"action=full_rebuild"
+            )
+            return False
+
+        self.records = state.get('records', {})
+
+        logger.info(
+            f"✅ BUILD_MANIFEST_LOADED "
+            f"outputs={len(self.records)}"
+        )
+
+        return True
+
+    def save(self) -> None:
+        """
+        Atomically write the manifest to disk.
+
+        Raises:
+            IOError: If the manifest cannot be written
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._lock:
+            state = {
+                'version': MANIFEST_VERSION,
+                'space_id': self.space_id,
+                'environment': self.environment,
+                'mode': self.mode,
+                'records': dict(self.records)
+            }
+
+        tmp_path = f"{self.path}.tmp"
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(
+                f"❌ BUILD_MANIFEST_WRITE_FAILED "
+                f"path={self.path} "
+                f"error={str(e)}"
+            )
+            raise IOError(f"Failed to write build manifest: {str(e)}")
+
+        logger.info(
+            f"💾 BUILD_MANIFEST_SAVED "
+            f"path={self.path} "
+            f"outputs={len(state['records'])}"
+        )
+
+    def skip(self, key: str, sources: Dict[str, str], code: str) -> bool:
+        """
+        Check whether an output is up to date, counting it as skipped if so.
+
+        Args:
+            key: Output key
+            sources: Current source versions (from source_versions())
+            code: Current code hash (from code_hash())
+
+        Returns:
+            True if incremental and the output was built from the same
+            sources and code and its files are unchanged since
+        """
+        if not self.incremental:
+            return False
+
+        with self._lock:
+            record = self.records.get(key)
+
+        if (
+            record is None
+            or record.get('sources') != sources
+            or record.get('code') != code
+            or not record.get('outputs')
+            or any(
+                file_digest(path) != record.get('digests', {}).get(path)
+                for path in record['outputs']
+            )
+        ):
+            return False
+
+        with self._lock:
+            self._stats['skipped'] += 1
+        return True
+
+    def record(
+        self,
+        key: str,
+        locale: str,
+        sources: Dict[str, str],
+        code: str,
+        outputs: List[str]
+    ) -> List[str]:
+        """
+        Record a rebuilt output.
+
+        Args:
+            key: Output key
+            locale: Contentful locale code
+            sources: Source versions it was built from
+            code: Code hash it was built with
+            outputs: Files written (hashed now, to detect later edits)
+
+        Returns:
+            Files the previous build of this output wrote that it no
+            longer does (e.g., a post whose slug changed)
+        """
+        digests = {path: file_digest(path) for path in outputs}
+        with self._lock:
+            previous = self.records.get(key, {}).get('outputs', [])
+            self.records[key] = {
+                'locale': locale,
+                'sources': sources,
+                'code': code,
+                'outputs': outputs,
+                'digests': digests
+            }
+            self._stats['rebuilt'] += 1
+        return [path for path in previous if path not in outputs]
+
+    def keys(self, prefix: str = '') -> List[str]:
+        """
+        Get recorded output keys.
+
+        Args:
+            prefix: Only keys starting with this (e.g., 'en-US:post:')
+
+        Returns:
+            Matching output keys
+        """
+        with self._lock:
+            return [key for key in self.records if key.startswith(prefix)]
+
+    def drop(self, keys: List[str]) -> List[str]:
+        """
+        Forget outputs that are no longer generated.
+
+        Args:
+            keys: Output keys to forget
+
+        Returns:
+            Files those outputs had written
+        """
+        paths = []
+        with self._lock:
+            for key in keys:
+                record = self.records.pop(key, None)
+                if record is not None:
+                    paths.extend(record.get('outputs', []))
+        return paths
+
+    def reverse_index(self) -> Dict[str, List[str]]:
+        """
+        Map every source entry or asset to the outputs built from it.
+
+        Returns:
+            Output keys keyed by entry or asset ID
+        """
+        index: Dict[str, List[str]] = {}
+        with self._lock:
+            for key, record in self.records.items():
+                for source in record.get('sources', {}):
+                    item_id = source.split(':', 1)[1]
+                    index.setdefault(item_id, []).append(key)
+        return index
+
+    def affected_outputs(self, item_ids: List[str]) -> Set[str]:
+        """
+        Get the outputs built from any of some entries or assets.
+
+        Args:
+            item_ids: Changed entry or asset IDs
+
+        Returns:
+            Output keys (empty for IDs no recorded output uses)
+        """
+        index = self.reverse_index()
+        return {key for item_id in item_ids for key in index.get(item_id, [])}
+
+    def missing_outputs(self) -> List[str]:
+        """
+        Get recorded output files that no longer exist.
+
+        Returns:
+            Missing paths
+        """
+        with self._lock:
+            paths = [path for record in self.records.values() for path in record.get('outputs', [])]
+        return [path for path in paths if not os.path.exists(path)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get skip statistics for this run.
+
+        Returns:
+            Dictionary with 'skipped' and 'rebuilt' output counts
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def output_key(locale: str, kind: str, name: str) -> str:
+    """Build a manifest key (e.g., 'en-US:post:<entry id>')."""
+    return f"{locale}:{kind}:{name}"
+
@@ -32,6 +32,88 @@ LOCALE_MAPPING: dict[str, str] = {
     'es': 'es'      # Spanish stays the same
 }
 
+# Space default locale (non-localized fields are only stored under this code)
+DEFAULT_LOCALE: str = 'en-US'
+
+# Locale fallback chain (mirrors the fallbacks configured in Contentful)
+LOCALE_FALLBACKS: dict[str, str] = {
+    'es': 'en-US'
+}
+
+# Fetch each collection once with locale='*' and split locales locally
+CONTENTFUL_MULTI_LOCALE: bool = os.getenv('CONTENTFUL_MULTI_LOCALE', 'false').lower() == 'true'
+
+# Lightweight raw-JSON entries with lazy link resolution instead of SDK hydration
+CONTENTFUL_RAW_ENTRIES: bool = os.getenv('CONTENTFUL_RAW_ENTRIES', 'false').lower() == 'true'
+
+# Stream blog posts page by page (fetch → transform → write) instead of loading the collection
+CONTENTFUL_STREAM_POSTS: bool = os.getenv('CONTENTFUL_STREAM_POSTS', 'false').lower() == 'true'
+
+# Build manifest of the entries behind every output (off by default; needed for --changed-entry
+# and for pruning posts whose entries are gone) and incremental builds that skip outputs whose
+# source entries and transformer code are unchanged
+CONTENTFUL_BUILD_MANIFEST: str = os.getenv('CONTENTFUL_BUILD_MANIFEST', '')
+CONTENTFUL_INCREMENTAL: bool = os.getenv('CONTENTFUL_INCREMENTAL', 'false').lower() == 'true'
+
+# JSON summary of the files a build added, modified or removed ('' disables), and the exit
+# code for a successful build that changed nothing (0 = same as success) so CI can skip Jekyll
+CONTENTFUL_CHANGE_SUMMARY: str = os.getenv('CONTENTFUL_CHANGE_SUMMARY', '.contentful-build/changes.json')
+CONTENTFUL_NO_CHANGES_EXIT_CODE: int = int(os.getenv('CONTENTFUL_NO_CHANGES_EXIT_CODE', '0'))
+
+# Scoped Jekyll regeneration (scripts/jekyll_regenerate.py): state of the last site build and the
+# pages that list posts (regenerated whenever a post changes; Jekyll does not track site.posts)
+JEKYLL_BUILD_STATE: str = os.getenv('JEKYLL_BUILD_STATE', '.contentful-build/jekyll-state.json')
+JEKYLL_LISTING_PAGES: list[str] = [
+    page.strip()
+    for page in os.getenv('JEKYLL_LISTING_PAGES', 'index.html,es/index.html,blog/index.html,es/blog/index.html').split(',')
+    if page.strip()
+]
+
+# Sync API delta mode: persist nextSyncToken + entry/asset snapshot on disk
+CONTENTFUL_SYNC_ENABLED: bool = os.getenv('CONTENTFUL_SYNC', 'false').lower() == 'true'
+CONTENTFUL_SYNC_DIR: str = os.getenv('CONTENTFUL_SYNC_DIR', '.contentful-sync')
+
+# Collection pagination: page size and parallel page requests per collection
+CONTENTFUL_PAGE_SIZE: int = int(os.getenv('CONTENTFUL_PAGE_SIZE', '100'))
+CONTENTFUL_PAGE_CONCURRENCY: int = int(os.getenv('CONTENTFUL_PAGE_CONCURRENCY', '4'))
+
+# Concurrent fetch stage: planned collection fetches in flight across content types and locales
+CONTENTFUL_FETCH_CONCURRENCY: int = int(os.getenv('CONTENTFUL_FETCH_CONCURRENCY', '8'))
+
+# Locales transformed and written in parallel (1 = one after another)
+CONTENTFUL_LOCALE_CONCURRENCY: int = int(os.getenv('CONTENTFUL_LOCALE_CONCURRENCY', '1'))
+
+# Build stages (fetch/transform/write per output) run in parallel once their inputs are ready
+CONTENTFUL_STAGE_CONCURRENCY: int = int(os.getenv('CONTENTFUL_STAGE_CONCURRENCY', '4'))
+
+# Parallel blog post transform: worker processes (0 = serial) and posts per worker task
+CONTENTFUL_TRANSFORM_WORKERS: int = int(os.getenv('CONTENTFUL_TRANSFORM_WORKERS', '0'))
+CONTENTFUL_TRANSFORM_CHUNK_SIZE: int = int(os.getenv('CONTENTFUL_TRANSFORM_CHUNK_SIZE', '25'))
+
+# Fetch every planned collection at the deepest include any transformer needs
+CONTENTFUL_PREFETCH_MAX_DEPTH: bool = os.getenv('CONTENTFUL_PREFETCH_MAX_DEPTH', 'false').lower() == 'true'
+
+# Request scheduler: token bucket rate (req/s), max requests in flight, retries for 429/5xx
+CONTENTFUL_RATE_LIMIT: float = float(os.getenv('CONTENTFUL_RATE_LIMIT', '50'))
+CONTENTFUL_MAX_IN_FLIGHT: int = int(os.getenv('CONTENTFUL_MAX_IN_FLIGHT', '8'))
+CONTENTFUL_MAX_RETRIES: int = int(os.getenv('CONTENTFUL_MAX_RETRIES', '5'))
+
+# In-memory response cache: byte budget per cache (LRU eviction, 0 = unbounded) and background TTL sweep interval
+CONTENTFUL_CACHE_MAX_BYTES: int = int(os.getenv('CONTENTFUL_CACHE_MAX_BYTES', str(256 * 1024 * 1024)))
+CONTENTFUL_CACHE_SWEEP_INTERVAL: float = float(os.getenv('CONTENTFUL_CACHE_SWEEP_INTERVAL', '60'))
+
+# Persistent HTTP cache: response bodies + ETags for conditional requests
+CONTENTFUL_HTTP_CACHE_ENABLED: bool = os.getenv('CONTENTFUL_HTTP_CACHE', 'false').lower() == 'true'
+CONTENTFUL_HTTP_CACHE_DIR: str = os.getenv('CONTENTFUL_HTTP_CACHE_DIR', '.contentful-cache')
+
+# API base URL override (e.g., http://127.0.0.1:8765 for scripts/stand_in_server.py)
+CONTENTFUL_API_URL: str = os.getenv('CONTENTFUL_API_URL', '')
+
+# Record/replay cassette (gzip JSON): 'record' saves every API response, 'replay' runs offline from it
+CONTENTFUL_CASSETTE: str = os.getenv('CONTENTFUL_CASSETTE', '')
+CONTENTFUL_CASSETTE_MODE: str = os.getenv('CONTENTFUL_CASSETTE_MODE', 'replay')
+CONTENTFUL_CASSETTE_LATENCY: float = float(os.getenv('CONTENTFUL_CASSETTE_LATENCY', '0'))
+
 # Content type IDs (must match Contentful exactly)
 CONTENT_TYPE_BLOG_POST: str = 'blogPage'
 CONTENT_TYPE_PROFILE: str = 'profile'
@@ -98,12 +180,13 @@ def validate_config() -> None:
     if not CONTENTFUL_SPACE_ID:
         missing_vars.append('CONTENTFUL_SPACE_ID')
     
-    # Check tokens based on mode
+    # Check tokens based on mode (a replayed cassette never sends one)
+    replaying = bool(CONTENTFUL_CASSETTE) and CONTENTFUL_CASSETTE_MODE == 'replay'
     if CONTENTFUL_MODE == 'production':
-        if not CONTENTFUL_ACCESS_TOKEN:
+        if not CONTENTFUL_ACCESS_TOKEN and not replaying:
             missing_vars.append('CONTENTFUL_ACCESS_TOKEN')
     elif CONTENTFUL_MODE == 'preview':
-        if not CONTENTFUL_PREVIEW_TOKEN:
+        if not CONTENTFUL_PREVIEW_TOKEN and not replaying:
             missing_vars.append('CONTENTFUL_PREVIEW_TOKEN')
     else:
         logger.warning(
@@ -0,0 +1,309 @@
+"""
+Thread-safe in-memory TTL cache for Contentful responses.
+Shared by concurrent fetch workers; bounded by an LRU byte budget.
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from scripts.config import logger
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value, in bytes.
+
+    SDK resources are measured by their raw JSON payload (linked entries
+    are shared between responses and counted where they are items), raw
+    bodies by their serialized size. This is an approximation meant for
+    budgeting, not an exact accounting of Python object overhead.
+
+    Args:
+        value: Cached value (entry list, raw body, ...)
+
+    Returns:
+        Estimated size in bytes
+    """
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+
+    raw = getattr(value, 'raw', None)
+    if isinstance(raw, dict):
+        value = raw
+
+    if isinstance(value, (dict, str)):
+        try:
+            return len(json.dumps(value, default=str, ensure_ascii=False).encode('utf-8'))
+        except (TypeError, ValueError):
+            pass
+
+    return sys.getsizeof(value)
+
+
+class ResponseCache:
+    """
+    Lock-protected key/value store with per-entry expiry and LRU eviction.
+
+    Every read and write goes through one lock, so fetch workers running on
+    separate threads can populate and read the cache at the same time.
+    Each value's size is estimated when stored; once the total exceeds
+    ``max_bytes`` the least recently used values are evicted. An optional
+    background sweeper drops expired values that are never read again.
+
+    Attributes:
+        ttl: Time-to-live in seconds for each stored value
+        max_bytes: Byte budget (0 = unbounded)
+    """
+
+    def __init__(
+        self,
+        ttl: int = 300,
+        max_bytes: int = 0,
+        sizeof: Callable[[Any], int] = estimate_size
+    ) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            ttl: Time-to-live in seconds
+            max_bytes: Byte budget for stored values (0 = unbounded)
+            sizeof: Size estimator for stored values
+        """
+        self.ttl = ttl
+        self.max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof
+
+        # {key: (value, timestamp, size)}, least recently used first
+        self._data: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._resident_bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+
+    def _is_valid(self, timestamp: float) -> bool:
+        """Check whether a value stored at `timestamp` is still fresh."""
+        return (time.time() - timestamp) < self.ttl
+
+    def _remove(self, key: str) -> None:
+        """Remove a key and its size (caller holds the lock)."""
+        _, _, size = self._data.pop(key)
+        self._resident_bytes -= size
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a fresh value and mark it recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        with self._lock:
+            cached = self._data.get(key)
+            if cached is None:
+                return None
+            value, timestamp, _ = cached
+            if not self._is_valid(timestamp):
+                self._remove(key)
+                self._expirations += 1
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a value, replacing any previous one, and enforce the budget.
+
+        Values larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Known size in bytes (e.g., of the response bodies the
+                value was built from); estimated when omitted
+        """
+        if size is None:
+            size = self._sizeof(value)
+
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(
+                f"⚠️ CACHE_VALUE_TOO_LARGE "
+                f"key={key} "
+                f"size={size} "
+                f"max_bytes={self.max_bytes}"
+            )
+            with self._lock:
+                if key in self._data:
+                    self._remove(key)
+            return
+
+        evicted = 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.time(), size)
+            self._resident_bytes += size
+
+            while self.max_bytes and self._resident_bytes > self.max_bytes:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                evicted += 1
+            self._evictions += evicted
+
+        if evicted:
+            logger.info(
+                f"♻️ CACHE_EVICTED "
+                f"count={evicted} "
+                f"resident_bytes={self._resident_bytes} "
+                f"max_bytes={self.max_bytes}"
+            )
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired value.
+
+        Returns:
+            Number of values removed
+        """
+        with self._lock:
+            expired = [
+                key for key, (_, timestamp, _) in self._data.items()
+                if not self._is_valid(timestamp)
+            ]
+            for key in expired:
+                self._remove(key)
+            self._expirations += len(expired)
+            return len(expired)
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        Start a daemon thread that purges expired values periodically.
+
+        Args:
+            interval: Seconds between sweeps (<= 0 disables the sweeper)
+        """
+        if interval <= 0 or self._sweeper is not None:
+            return
+
+        def sweep() -> None:
+            while not self._stop_sweeper.wait(interval):
+                self.purge_expired()
+
+        self._stop_sweeper.clear()
+        self._sweeper = threading.Thread(target=sweep, name='response-cache-sweeper', daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the background sweeper, if running."""
+        if self._sweeper is None:
+            return
+        self._stop_sweeper.set()
+        self._sweeper.join()
+        self._sweeper = None
+
+    def clear(self) -> int:
+        """
+        Remove every value.
+
+        Returns:
+            Number of values removed
+        """
+        with self._lock:
+            removed = len(self._data)
+            self._data.clear()
+            self._resident_bytes = 0
+            return removed
+
+    def values(self) -> List[Any]:
+        """Get a snapshot of all stored values (fresh or not)."""
+        with self._lock:
+            return [value for value, _, _ in self._data.values()]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with resident bytes, evictions and expirations
+        """
+        with self._lock:
+            return {
+                'resident_bytes': self._resident_bytes,
+                'evictions': self._evictions,
+                'expirations': self._expirations
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class _Call:
+    """An in-flight call whose result is shared with waiting callers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait and receive the same result (or exception).
+    Nothing is remembered once the call completes; caching is left to
+    ResponseCache.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Request identity
+            fn: Function producing the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True if this caller
+            waited on another caller's execution
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,240 @@
+"""
+Record/replay cassette for Contentful API requests.
+Stores every response body in one gzip-compressed JSON file so builds
+can be replayed offline with deterministic (optionally simulated) latency.
+"""
+
+import copy
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from scripts.config import logger
+
+
+CASSETTE_VERSION = 1
+
+# Cassette modes
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+
+class Cassette:
+    """
+    Recorded Contentful responses keyed by API path and query.
+
+    In record mode, responses are added as the client receives them and
+    written out by save(). In replay mode, the file is loaded up front and
+    play() answers requests from it, sleeping ``latency`` seconds per
+    request to stand in for the network.
+
+    Attributes:
+        path: Cassette file (.json.gz)
+        mode: 'record' or 'replay'
+        latency: Simulated seconds per replayed request
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = REPLAY,
+        latency: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Initialize cassette.
+
+        Args:
+            path: Cassette file path
+            mode: 'record' or 'replay'
+            latency: Simulated seconds per replayed request
+            sleep: Sleep function (injectable for tests)
+
+        Raises:
+            ValueError: For an unknown mode
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.latency = max(0.0, latency)
+        self._sleep = sleep
+
+        # {key: {'path': ..., 'query': ..., 'body': ...}}
+        self._interactions: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._played = 0
+        self._misses = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    def make_key(self, path: str, query: Dict[str, Any]) -> str:
+        """
+        Build the lookup key for a request (order-independent query).
+
+        Args:
+            path: API path (e.g., '/entries')
+            query: Query parameters
+
+        Returns:
+            Readable request key
+        """
+        normalized = '&'.join(f"{k}={query[k]}" for k in sorted(query))
+        return f"{path}?{normalized}"
+
+    def load(self) -> int:
+        """
+        Load recorded interactions from disk.
+
+        Returns:
+            Number of interactions loaded
+
+        Raises:
+            OSError, ValueError: If the file is missing or unreadable
+                (replay cannot proceed without it)
+        """
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {data.get('version')} in {self.path}"
+            )
+
+        with self._lock:
+            self._interactions = {
+                self.make_key(i['path'], i['query']): i
+                for i in data.get('interactions', [])
+            }
+
+        logger.info(
+            f"📼 CASSETTE_LOADED "
+            f"path={self.path} "
+            f"interactions={len(self._interactions)} "
+            f"latency={self.latency}s"
+        )
+
+        return len(self._interactions)
+
+    def record(self, path: str, query: Dict[str, Any], body: Dict[str, Any]) -> None:
+        """
+        Add a response (a later response for the same request replaces it).
+
+        The body is copied: the SDK's resource builder hydrates the
+        caller's copy in place afterwards.
+
+        Args:
+            path: API path
+            query: Query parameters
+            body: Parsed JSON response body
+        """
+        interaction = {
+            'path': path,
+            'query': {k: str(v) for k, v in query.items()},
+            'body': copy.deepcopy(body)
+        }
+        with self._lock:
+            self._interactions[self.make_key(path, interaction['query'])] = interaction
+
+    def play(self, path: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer a request from the recording.
+
+        Args:
+            path: API path
+            query: Query parameters
+
+        Returns:
+            Copy of the recorded JSON response body (callers may
+            hydrate it in place)
+
+        Raises:
+            CassetteMissError: If the request was not recorded
+        """
+        key = self.make_key(path, {k: str(v) for k, v in query.items()})
+
+        with self._lock:
+            interaction = self._interactions.get(key)
+            if interaction is None:
+                self._misses += 1
+            else:
+                self._played += 1
+
+        if interaction is None:
+            logger.error(
+                f"❌ CASSETTE_MISS "
+                f"request={key}"
+            )
+            raise CassetteMissError(f"Request not in cassette: {key}")
+
+        if self.latency:
+            self._sleep(self.latency)
+
+        return copy.deepcopy(interaction['body'])
+
+    def save(self) -> None:
+        """
+        Write recorded interactions to disk (atomic replace).
+
+        Write (or serialization) failures are logged and ignored.
+        """
+        if not self.recording:
+            return
+
+        with self._lock:
+            interactions = [self._interactions[key] for key in sorted(self._interactions)]
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(
+                    {'version': CASSETTE_VERSION, 'interactions': interactions},
+                    f,
+                    ensure_ascii=False
+                )
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(
+                f"⚠️ CASSETTE_WRITE_FAILED "
+                f"path={self.path} "
+                f"error={str(e)}"
+            )
+            return
+
+        logger.info(
+            f"📼 CASSETTE_SAVED "
+            f"path={self.path} "
+            f"interactions={len(interactions)} "
+            f"bytes={os.path.getsize(self.path)}"
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cassette statistics.
+
+        Returns:
+            Dictionary with interactions stored, replayed and missed
+        """
+        with self._lock:
+            return {
+                'interactions': len(self._interactions),
+                'played': self._played,
+                'misses': self._misses
+            }
@@ -3,12 +3,43 @@ Dual-mode Contentful API client with in-memory caching.
 Supports both Delivery API (production) and Preview API (draft content).
 """
 
-import time
-from typing import List, Optional, Dict, Any
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Dict, Any
+from urllib.parse import parse_qs, urlparse
+import requests
 from contentful import Client as ContentfulSDKClient
+from contentful.content_type_cache import ContentTypeCache
 from contentful.entry import Entry
+from contentful.errors import get_error
+from contentful.resource_builder import ResourceBuilder
 
 from scripts.config import logger, CONTENTFUL_MODE
+from scripts.contentful_client.cache import ResponseCache, SingleFlight
+from scripts.contentful_client.cassette import Cassette
+from scripts.contentful_client.http_cache import HttpCache
+from scripts.contentful_client.localization import localize_item
+from scripts.contentful_client.rate_limiter import RateLimiter, get_rate_limiter
+from scripts.contentful_client.raw_resources import build_raw_entries
+from scripts.contentful_client.sync_store import SyncStore
+
+
+# API hosts per mode
+DELIVERY_API_HOST = 'cdn.contentful.com'
+PREVIEW_API_HOST = 'preview.contentful.com'
+
+# Link resolution depth for hydrated responses (SDK default: 2x max include)
+MAX_INCLUDE_RESOLUTION_DEPTH = 20
+
+# Per-request socket timeout in seconds
+REQUEST_TIMEOUT = 10
+
+# Contentful caps the include parameter at 10 levels
+MAX_INCLUDE_DEPTH = 10
+
+# IDs per sys.id[in] request (keeps the query string well under URL limits)
+IDS_PER_REQUEST = 100
 
 
 class ContentfulClient:
@@ -20,6 +51,24 @@ class ContentfulClient:
         access_token: API access token (Delivery or Preview)
         mode: 'production' (Delivery API) or 'preview' (Preview API)
         cache_ttl: Cache time-to-live in seconds (default: 300)
+        sync_store: Optional SyncStore; when set, entries are served
+            from the local snapshot maintained by sync()
+        page_size: Entries requested per collection page (max 1000)
+        page_concurrency: Max pages fetched in parallel after the first
+        http_cache: Optional HttpCache for ETag revalidation across builds
+        environment: Contentful environment ID (default: 'master')
+        multi_locale: Fetch each collection once with locale='*' and
+            split it into per-locale views locally
+        rate_limiter: Request scheduler (token bucket, adaptive
+            concurrency, retries); shared per space by default
+        cache_max_bytes: Byte budget per in-memory cache (0 = unbounded);
+            least recently used responses are evicted beyond it
+        raw_entries: Return lightweight raw-JSON entries (lazy link
+            resolution) instead of hydrated SDK entries
+        cassette: Optional Cassette; records every API response, or in
+            replay mode answers every request from the recording
+        api_url: Optional API base URL overriding the Contentful host
+            (e.g., 'http://127.0.0.1:8765' for a local stand-in server)
     """
     
     def __init__(
@@ -27,7 +76,19 @@ class ContentfulClient:
         space_id: str,
         access_token: str,
         mode: str = 'production',
-        cache_ttl: int = 300
+        cache_ttl: int = 300,
+        sync_store: Optional[SyncStore] = None,
+        page_size: int = 100,
+        page_concurrency: int = 4,
+        http_cache: Optional[HttpCache] = None,
+        environment: str = 'master',
+        multi_locale: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_max_bytes: int = 0,
+        cache_sweep_interval: float = 0,
+        raw_entries: bool = False,
+        cassette: Optional[Cassette] = None,
+        api_url: Optional[str] = None
     ) -> None:
         """
         Initialize Contentful client with dual-mode support.
@@ -37,23 +98,87 @@ class ContentfulClient:
             access_token: Delivery or Preview API token
             mode: 'production' or 'preview'
             cache_ttl: Cache time-to-live in seconds
+            sync_store: Snapshot store for Sync API delta mode
+            page_size: Collection page size (Contentful caps this at 1000)
+            page_concurrency: Parallel page requests per collection
+            http_cache: Disk cache for conditional (If-None-Match) requests
+            environment: Contentful environment ID
+            multi_locale: Share one locale='*' request across all locales
+            rate_limiter: Request scheduler (default: the space's shared one)
+            cache_max_bytes: Byte budget per in-memory cache (0 = unbounded)
+            cache_sweep_interval: Seconds between background purges of
+                expired cache entries (0 = no background sweeping)
+            raw_entries: Skip SDK hydration and resolve links lazily
+            cassette: Record/replay cassette for offline runs
+            api_url: Base URL replacing https://<Delivery/Preview host>
         """
         self.space_id = space_id
         self.access_token = access_token
         self.mode = mode
         self.cache_ttl = cache_ttl
+        self.sync_store = sync_store
+        self.page_size = max(1, min(page_size, 1000))
+        self.page_concurrency = max(1, page_concurrency)
+        self.http_cache = http_cache
+        self.environment = environment
+        self.multi_locale = multi_locale
+        self.rate_limiter = rate_limiter or get_rate_limiter(space_id)
+        self.cache_max_bytes = cache_max_bytes
+        self.raw_entries = raw_entries
+        self.cassette = cassette
+        self.api_url = api_url.rstrip('/') if api_url else None
+        
+        # In-memory caches (thread-safe; shared by concurrent fetch workers)
+        self._cache = ResponseCache(cache_ttl, max_bytes=cache_max_bytes)
         
-        # In-memory cache: {cache_key: (entries, timestamp)}
-        self._cache: Dict[str, tuple[List[Entry], float]] = {}
+        # Raw locale='*' pages, keyed like _cache with locale '*'
+        self._all_locale_pages = ResponseCache(cache_ttl, max_bytes=cache_max_bytes)
+        
+        # Expired entries are otherwise only dropped when read again
+        self._cache.start_sweeper(cache_sweep_interval)
+        self._all_locale_pages.start_sweeper(cache_sweep_interval)
+        
+        # Top-level fields to select per content type: {content_type: [field_id]}
+        self._field_projections: Dict[str, List[str]] = {}
+        self._projection_lock = threading.Lock()
+        
+        # Identical concurrent requests share one in-flight fetch
+        self._inflight = SingleFlight()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._coalesced = 0
+        
+        # HTTP round trips made against Contentful (pages run on worker threads)
+        self._api_calls = 0
+        self._not_modified = 0
+        self._stats_lock = threading.Lock()
+        
+        # Pooled HTTP connections for collection requests
+        self._session = requests.Session()
+        
+        # Per-locale views of the sync snapshot: {locale: (entries, assets)}
+        self._snapshot_views: Dict[str, tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+        self._snapshot_lock = threading.Lock()
         
         # Initialize Contentful SDK client
         self._client = self._initialize_client()
         
+        # With a cassette, content types go through _get_json like every
+        # other request instead of the SDK's own startup call
+        if cassette is not None:
+            self._load_content_types()
+        
         logger.info(
             f"✅ CLIENT_INITIALIZED "
             f"space_id={space_id} "
             f"mode={mode} "
-            f"cache_ttl={cache_ttl}s"
+            f"cache_ttl={cache_ttl}s "
+            f"sync={sync_store is not None} "
+            f"http_cache={http_cache is not None} "
+            f"multi_locale={multi_locale} "
+            f"raw_entries={raw_entries} "
+            f"cassette={cassette.mode if cassette else None} "
+            f"api_url={self.api_url or 'default'}"
         )
     
     def _initialize_client(self) -> ContentfulSDKClient:
@@ -63,25 +188,63 @@ class ContentfulClient:
         Returns:
             Configured Contentful SDK client
         """
-        if self.mode == 'preview':
+        # The SDK fetches content types on startup unless told not to
+        content_type_cache = self.cassette is None
+        
+        if self.api_url:
+            # Custom endpoint (e.g., local stand-in server)
+            endpoint = urlparse(self.api_url)
+            return ContentfulSDKClient(
+                space_id=self.space_id,
+                access_token=self.access_token,
+                api_url=endpoint.netloc,
+                https=endpoint.scheme == 'https',
+                environment=self.environment,
+                content_type_cache=content_type_cache
+            )
+        elif self.mode == 'preview':
             # Preview API for draft content
             return ContentfulSDKClient(
                 space_id=self.space_id,
                 access_token=self.access_token,
-                api_url='preview.contentful.com'
+                api_url=PREVIEW_API_HOST,
+                environment=self.environment,
+                content_type_cache=content_type_cache
             )
         else:
             # Delivery API for published content (default)
             return ContentfulSDKClient(
                 space_id=self.space_id,
-                access_token=self.access_token
+                access_token=self.access_token,
+                environment=self.environment,
+                content_type_cache=content_type_cache
+            )
+    
+    def _load_content_types(self) -> None:
+        """
+        Fill the SDK's content type cache (used to coerce entry fields).
+        
+        Failures are logged; entries then hydrate without field coercion.
+        """
+        try:
+            body = self._get_json('/content_types', {'limit': 1000})
+            ContentTypeCache.__CACHE__ = ResourceBuilder(
+                self._client.default_locale,
+                False,
+                body
+            ).build()
+        except Exception as e:
+            logger.warning(
+                f"⚠️ CONTENT_TYPES_UNAVAILABLE "
+                f"error={str(e)}"
             )
     
     def _generate_cache_key(
         self,
         content_type: str,
         locale: str,
-        include: int
+        include: int,
+        filters: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate cache key for request.
@@ -90,55 +253,256 @@ class ContentfulClient:
             content_type: Content type ID
             locale: Locale code
             include: Include depth
+            filters: Extra query filters (order-independent)
         
         Returns:
             Cache key string
         """
-        return f"{content_type}:{locale}:{include}"
+        key = f"{content_type}:{locale}:{include}"
+        if filters:
+            key += ':' + '&'.join(f"{k}={filters[k]}" for k in sorted(filters))
+        return key
     
-    def _is_cache_valid(self, timestamp: float) -> bool:
+    def get_entries(
+        self,
+        content_type: str,
+        locale: str = 'en',
+        include: int = 2,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Entry]:
         """
-        Check if cached data is still valid.
+        Fetch entries from Contentful with caching.
+        
+        A cached response fetched at a greater or equal include depth
+        (same content type, locale and filters) satisfies the request.
+        Concurrent calls with the same arguments are coalesced: one caller
+        performs the fetch and the others receive its result.
         
         Args:
-            timestamp: Cache timestamp
+            content_type: Content type ID
+            locale: Locale code (default: 'en')
+            include: Reference include depth (default: 2)
+            filters: Extra Delivery API query parameters
+                (e.g., {'fields.url': 'my-post'})
         
         Returns:
-            True if cache is valid, False if expired
+            List of Contentful entries
         """
-        return (time.time() - timestamp) < self.cache_ttl
+        cache_key = self._generate_cache_key(content_type, locale, include, filters)
+        
+        # Check cache first (exact key, then any deeper include)
+        cached_entries = self._find_cached(content_type, locale, include, filters)
+        if cached_entries is not None:
+            self._count_cache_hit(content_type, locale, cached_entries)
+            return cached_entries
+        
+        entries_list, shared = self._inflight.do(
+            cache_key,
+            lambda: self._load_entries(cache_key, content_type, locale, include, filters)
+        )
+        
+        if shared:
+            with self._stats_lock:
+                self._coalesced += 1
+            logger.info(
+                f"🔗 REQUEST_COALESCED "
+                f"content_type={content_type} "
+                f"locale={locale} "
+                f"count={len(entries_list)}"
+            )
+        
+        return entries_list
     
-    def get_entries(
+    def iter_entry_pages(
         self,
         content_type: str,
         locale: str = 'en',
-        include: int = 2
-    ) -> List[Entry]:
+        include: int = 2,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[List[Entry]]:
         """
-        Fetch entries from Contentful with caching.
+        Stream a collection page by page without caching it.
+        
+        Pages are requested ahead of the consumer (at most
+        page_concurrency in flight) and yielded in skip order, so only
+        a bounded number of pages is held at once however large the
+        collection is. Cached collections, the sync snapshot and
+        multi-locale views already hold every entry; they are served
+        through get_entries() and yielded in page_size chunks.
         
         Args:
             content_type: Content type ID
             locale: Locale code (default: 'en')
             include: Reference include depth (default: 2)
+            filters: Extra Delivery API query parameters
+        
+        Yields:
+            Lists of entries, one per collection page
+        """
+        in_memory = (
+            self._find_cached(content_type, locale, include, filters) is not None
+            or (self.sync_store is not None and not filters)
+            or (self.multi_locale and locale != '*')
+        )
+        if in_memory:
+            entries_list = self.get_entries(content_type, locale, include, filters)
+            for start in range(0, len(entries_list), self.page_size):
+                yield entries_list[start:start + self.page_size]
+            return
+        
+        with self._stats_lock:
+            self._cache_misses += 1
+        
+        logger.info(
+            f"📡 API_STREAM "
+            f"content_type={content_type} "
+            f"locale={locale} "
+            f"include={include}"
+        )
+        
+        query = self._collection_query({
+            **(filters or {}),
+            'content_type': content_type,
+            'locale': locale,
+            'include': include
+        })
+        localized = locale == '*'
+        
+        first_page = self._fetch_page(query, 0)
+        total = first_page.get('total', len(first_page.get('items', [])))
+        remaining_skips = deque(range(self.page_size, total, self.page_size))
+        
+        yield self._build_entries([first_page], localized=localized, locale=locale)
+        del first_page
+        
+        if not remaining_skips:
+            return
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.page_concurrency, len(remaining_skips))
+        ) as executor:
+            pending = deque()
+            while remaining_skips or pending:
+                # Keep the read-ahead window full, then hand over the oldest page
+                while remaining_skips and len(pending) < self.page_concurrency:
+                    pending.append(executor.submit(self._fetch_page, query, remaining_skips.popleft()))
+                body = pending.popleft().result()
+                yield self._build_entries([body], localized=localized, locale=locale)
+    
+    def _find_cached(
+        self,
+        content_type: str,
+        locale: str,
+        include: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Entry]]:
+        """
+        Find cached entries at the requested or a deeper include depth.
+        
+        A deeper include response resolves every link a shallower one
+        would, so it can stand in for it.
+        
+        Args:
+            content_type: Content type ID
+            locale: Locale code
+            include: Minimum include depth required
+            filters: Extra query filters (must match exactly)
+        
+        Returns:
+            Cached entries, or None if no fresh superset is cached
+        """
+        for depth in range(include, max(include, MAX_INCLUDE_DEPTH) + 1):
+            cache_key = self._generate_cache_key(content_type, locale, depth, filters)
+            cached_entries = self._cache.get(cache_key)
+            if cached_entries is not None:
+                if depth != include:
+                    logger.info(
+                        f"🔼 CACHE_SUPERSET "
+                        f"content_type={content_type} "
+                        f"locale={locale} "
+                        f"requested_include={include} "
+                        f"cached_include={depth}"
+                    )
+                return cached_entries
+        return None
+    
+    def _count_cache_hit(
+        self,
+        content_type: str,
+        locale: str,
+        entries: List[Entry]
+    ) -> None:
+        """Record and log a cache hit."""
+        with self._stats_lock:
+            self._cache_hits += 1
+        
+        logger.info(
+            f"✅ CACHE_HIT "
+            f"content_type={content_type} "
+            f"locale={locale} "
+            f"count={len(entries)}"
+        )
+    
+    def _load_entries(
+        self,
+        cache_key: str,
+        content_type: str,
+        locale: str,
+        include: int,
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Entry]:
+        """
+        Load entries on a cache miss (runs once per in-flight cache key).
+        
+        Args:
+            cache_key: Key from _generate_cache_key()
+            content_type: Content type ID
+            locale: Locale code
+            include: Reference include depth
+            filters: Extra query filters
         
         Returns:
             List of Contentful entries
         """
-        cache_key = self._generate_cache_key(content_type, locale, include)
+        # A previous leader may have filled the cache after our check
+        cached_entries = self._find_cached(content_type, locale, include, filters)
+        if cached_entries is not None:
+            self._count_cache_hit(content_type, locale, cached_entries)
+            return cached_entries
         
-        # Check cache first
-        if cache_key in self._cache:
-            cached_entries, cached_time = self._cache[cache_key]
+        with self._stats_lock:
+            self._cache_misses += 1
+        
+        # Sync mode - serve from the local snapshot instead of the API
+        # (filtered queries still go to the API; the snapshot is unfiltered)
+        if self.sync_store is not None and not filters:
+            entries_list = self._entries_from_snapshot(content_type, locale, include)
+            self._cache.set(cache_key, entries_list)
             
-            if self._is_cache_valid(cached_time):
-                logger.info(
-                    f"✅ CACHE_HIT "
-                    f"content_type={content_type} "
-                    f"locale={locale} "
-                    f"count={len(cached_entries)}"
-                )
-                return cached_entries
+            logger.info(
+                f"✅ SNAPSHOT_READ "
+                f"content_type={content_type} "
+                f"locale={locale} "
+                f"count={len(entries_list)}"
+            )
+            
+            return entries_list
+        
+        # Multi-locale mode - one locale='*' fetch shared by every locale
+        if self.multi_locale and locale != '*':
+            entries_list = self._entries_from_all_locales(
+                content_type, locale, include, filters
+            )
+            self._cache.set(cache_key, entries_list)
+            
+            logger.info(
+                f"✅ LOCALE_DEMUX "
+                f"content_type={content_type} "
+                f"locale={locale} "
+                f"count={len(entries_list)}"
+            )
+            
+            return entries_list
         
         # Cache miss or expired - fetch from API
         logger.info(
@@ -149,18 +513,18 @@ class ContentfulClient:
         )
         
         try:
-            # Fetch entries from Contentful
-            entries = self._client.entries({
+            # Fetch every page of the collection from Contentful
+            sizes: List[Optional[int]] = []
+            entries_list = self._fetch_all_pages({
+                **(filters or {}),
                 'content_type': content_type,
                 'locale': locale,
                 'include': include
-            })
-            
-            # Convert to list
-            entries_list = list(entries)
+            }, sizes)
             
-            # Cache the results
-            self._cache[cache_key] = (entries_list, time.time())
+            # Cache the results, sized by the response bodies when known
+            size = None if None in sizes else sum(sizes)
+            self._cache.set(cache_key, entries_list, size)
             
             logger.info(
                 f"✅ API_SUCCESS "
@@ -180,6 +544,673 @@ class ContentfulClient:
             )
             raise
     
+    def _count_api_call(self) -> None:
+        """Increment the API call counter (thread-safe)."""
+        with self._stats_lock:
+            self._api_calls += 1
+    
+    def _api_url(self, path: str) -> str:
+        """
+        Build the full API URL for an environment-scoped path.
+        
+        Args:
+            path: API path (e.g., '/entries')
+        
+        Returns:
+            Absolute URL
+        """
+        if self.api_url:
+            base = self.api_url
+        else:
+            host = PREVIEW_API_HOST if self.mode == 'preview' else DELIVERY_API_HOST
+            base = f"https://{host}"
+        return (
+            f"{base}/spaces/{self.space_id}"
+            f"/environments/{self.environment}{path}"
+        )
+    
+    def _get_json(
+        self,
+        path: str,
+        query: Dict[str, Any],
+        sizes: Optional[List[Optional[int]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform a GET request and return the parsed JSON body.
+        
+        With an HTTP cache configured, the stored ETag is sent as
+        If-None-Match and a 304 response is answered from disk.
+        Requests go through the rate limiter, which paces them, adapts
+        concurrency and retries 429/5xx responses with backoff.
+        A recording cassette stores every body; a replaying one answers
+        the request without touching the network.
+        
+        Args:
+            path: API path (e.g., '/entries')
+            query: Query parameters
+            sizes: Optional list the body's size in bytes is appended to
+                (None when unknown: replayed or 304 responses), so
+                callers can size cache entries without re-serializing
+        
+        Returns:
+            Parsed JSON response body
+        
+        Raises:
+            contentful.errors.HTTPError: For non-successful responses
+            CassetteMissError: If a replayed request was never recorded
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            self._count_api_call()
+            if sizes is not None:
+                sizes.append(None)
+            return self.cassette.play(path, query)
+        
+        headers = {
+            'Authorization': f"Bearer {self.access_token}",
+            'Accept-Encoding': 'gzip'
+        }
+        
+        cache_key = None
+        cached = None
+        if self.http_cache is not None:
+            cache_key = self.http_cache.make_key(path, query)
+            cached = self.http_cache.get(cache_key)
+            if cached:
+                headers['If-None-Match'] = cached['etag']
+        
+        def send() -> requests.Response:
+            self._count_api_call()
+            return self._session.get(
+                self._api_url(path),
+                params=query,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
+            )
+        
+        response = self.rate_limiter.request(send, description=path)
+        
+        size = None
+        if response.status_code == 304 and cached:
+            with self._stats_lock:
+                self._not_modified += 1
+            body = cached['body']
+        elif response.status_code != 200:
+            raise get_error(response)
+        else:
+            body = response.json()
+            if isinstance(response.content, bytes):
+                size = len(response.content)
+            if self.http_cache is not None:
+                self.http_cache.put(cache_key, response.headers.get('ETag'), body)
+        
+        if sizes is not None:
+            sizes.append(size)
+        
+        if self.cassette is not None:
+            self.cassette.record(path, query, body)
+        
+        return body
+    
+    def _fetch_page(
+        self,
+        query: Dict[str, Any],
+        skip: int,
+        sizes: Optional[List[Optional[int]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a single collection page.
+        
+        Args:
+            query: Base query parameters
+            skip: Number of entries to skip
+            sizes: Optional list the page's size is appended to
+        
+        Returns:
+            Raw JSON body of the requested page
+        """
+        page_query = dict(query)
+        page_query['skip'] = skip
+        page_query['limit'] = self.page_size
+        
+        return self._get_json('/entries', page_query, sizes)
+    
+    def _build_entries(
+        self,
+        bodies: List[Dict[str, Any]],
+        localized: bool = False,
+        locale: Optional[str] = None
+    ) -> List[Entry]:
+        """
+        Hydrate raw collection pages into SDK entries.
+        
+        In raw mode the pages are wrapped as RawEntry objects instead;
+        links beyond the include depth are then batch-fetched on access.
+        
+        Args:
+            bodies: Raw JSON page bodies
+            localized: True for locale='*' payloads
+            locale: Locale the pages hold (for fetching unresolved links)
+        
+        Returns:
+            Entries from all pages, in page order
+        """
+        if self.raw_entries:
+            return build_raw_entries(
+                bodies,
+                self._client.default_locale,
+                localized,
+                fetch_linked=self._fetch_linked,
+                locale=locale
+            )
+        
+        entries_list: List[Entry] = []
+        for body in bodies:
+            entries_list.extend(ResourceBuilder(
+                self._client.default_locale,
+                localized,
+                body,
+                max_depth=MAX_INCLUDE_RESOLUTION_DEPTH
+            ).build())
+        return entries_list
+    
+    def _fetch_all_pages(
+        self,
+        query: Dict[str, Any],
+        sizes: Optional[List[Optional[int]]] = None
+    ) -> List[Entry]:
+        """
+        Fetch a complete collection as SDK entries.
+        
+        Args:
+            query: Base query parameters (content_type, locale, include)
+            sizes: Optional list every page's size is appended to
+        
+        Returns:
+            All entries of the collection
+        """
+        return self._build_entries(
+            self._fetch_raw_pages(query, sizes),
+            localized=query.get('locale') == '*',
+            locale=query.get('locale')
+        )
+    
+    def _fetch_id_chunks(
+        self,
+        path: str,
+        ids: List[str],
+        query: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch items by ID, split into concurrent sys.id[in] requests.
+        
+        Args:
+            path: API path ('/entries' or '/assets')
+            ids: Item IDs
+            query: Extra query parameters (locale, include, ...)
+        
+        Returns:
+            Raw JSON bodies, one per chunk, in chunk order
+        """
+        chunks = [
+            ids[start:start + IDS_PER_REQUEST]
+            for start in range(0, len(ids), IDS_PER_REQUEST)
+        ]
+        
+        def fetch(chunk: List[str]) -> Dict[str, Any]:
+            return self._get_json(path, {
+                **query,
+                'sys.id[in]': ','.join(chunk),
+                'limit': len(chunk)
+            })
+        
+        if len(chunks) <= 1:
+            return [fetch(chunk) for chunk in chunks]
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.page_concurrency, len(chunks))
+        ) as executor:
+            return list(executor.map(fetch, chunks))
+    
+    def _fetch_linked(
+        self,
+        link_type: str,
+        ids: List[str],
+        locale: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch raw entries or assets by ID with sys.id[in] queries.
+        
+        Used by raw mode to resolve links beyond the include depth.
+        
+        Args:
+            link_type: 'Entry' or 'Asset'
+            ids: Item IDs
+            locale: Locale code ('*' for all locales)
+        
+        Returns:
+            Raw items found (missing IDs are simply absent)
+        """
+        if link_type == 'Entry':
+            # Deeper links are fetched lazily in the next round
+            bodies = self._fetch_id_chunks('/entries', ids, {'locale': locale, 'include': 0})
+        else:
+            bodies = self._fetch_id_chunks('/assets', ids, {'locale': locale})
+        
+        return [item for body in bodies for item in body.get('items', [])]
+    
+    def set_field_projection(self, content_type: str, fields: List[str]) -> None:
+        """
+        Restrict collection fetches of a content type to some fields.
+        
+        Later calls for the same content type widen the selection (union),
+        so several readers of one type each get what they need. Register
+        projections before the first fetch of the type: cached responses
+        are not re-fetched when the selection grows. Included (linked)
+        entries are never projected by the API.
+        
+        Args:
+            content_type: Content type ID
+            fields: Top-level field IDs to download
+        """
+        with self._projection_lock:
+            selected = self._field_projections.setdefault(content_type, [])
+            for field in fields:
+                if field not in selected:
+                    selected.append(field)
+    
+    def get_raw_page(
+        self,
+        content_type: str,
+        locale: str = 'en',
+        include: int = 2,
+        projected: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Fetch the first collection page of a content type as raw JSON.
+        
+        Not cached; used to measure what a fetch downloads.
+        
+        Args:
+            content_type: Content type ID
+            locale: Locale code (default: 'en')
+            include: Reference include depth (default: 2)
+            projected: Apply the registered field projection (`select`)
+        
+        Returns:
+            Raw JSON body of the page
+        """
+        query: Dict[str, Any] = {'content_type': content_type, 'locale': locale, 'include': include}
+        select = self._select_param(content_type) if projected else None
+        if select:
+            query['select'] = select
+        return self._fetch_page(query, 0)
+    
+    def _select_param(self, content_type: Optional[str]) -> Optional[str]:
+        """
+        Build the `select` query parameter for a content type.
+        
+        Args:
+            content_type: Content type ID
+        
+        Returns:
+            'sys,fields.a,...' or None when every field is fetched
+        """
+        with self._projection_lock:
+            fields = self._field_projections.get(content_type)
+            if not fields:
+                return None
+            return ','.join(['sys'] + [f"fields.{field}" for field in fields])
+    
+    def _collection_query(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add the stable order and field projection to a collection query.
+        
+        Args:
+            query: Base query parameters (content_type, locale, include)
+        
+        Returns:
+            New query dictionary ready for paging
+        """
+        query = dict(query)
+        query.setdefault('order', 'sys.id')
+        
+        select = self._select_param(query.get('content_type'))
+        if select and 'select' not in query:
+            query['select'] = select
+        
+        return query
+    
+    def _fetch_raw_pages(
+        self,
+        query: Dict[str, Any],
+        sizes: Optional[List[Optional[int]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch a complete collection, following skip/limit pagination.
+        
+        The first page reports ``total``; the remaining pages are then
+        requested concurrently (bounded by page_concurrency) and
+        returned in skip order. A stable ``order`` keeps pages from
+        overlapping while they are fetched in parallel.
+        
+        Args:
+            query: Base query parameters (content_type, locale, include)
+            sizes: Optional list every page's size is appended to
+        
+        Returns:
+            Raw JSON bodies of every page
+        """
+        query = self._collection_query(query)
+        
+        first_page = self._fetch_page(query, 0, sizes)
+        bodies = [first_page]
+        
+        total = first_page.get('total', len(first_page.get('items', [])))
+        remaining_skips = list(range(self.page_size, total, self.page_size))
+        
+        if not remaining_skips:
+            return bodies
+        
+        logger.info(
+            f"📑 PAGINATION "
+            f"content_type={query.get('content_type')} "
+            f"total={total} "
+            f"pages={len(remaining_skips) + 1} "
+            f"concurrency={min(self.page_concurrency, len(remaining_skips))}"
+        )
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.page_concurrency, len(remaining_skips))
+        ) as executor:
+            # map() preserves skip order regardless of completion order
+            bodies.extend(executor.map(
+                lambda skip: self._fetch_page(query, skip, sizes),
+                remaining_skips
+            ))
+        
+        return bodies
+    
+    def _entries_from_all_locales(
+        self,
+        content_type: str,
+        locale: str,
+        include: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Entry]:
+        """
+        Serve one locale from a shared locale='*' collection fetch.
+        
+        The all-locale pages are fetched once per content type and include
+        depth; each locale is then demultiplexed locally with the
+        configured fallback chain, so extra locales cost no API calls.
+        
+        Args:
+            content_type: Content type ID
+            locale: Locale code
+            include: Reference include depth
+            filters: Extra query filters
+        
+        Returns:
+            List of Contentful entries for the locale
+        """
+        pages_key = self._generate_cache_key(content_type, '*', include, filters)
+        
+        # Separate key space from get_entries(locale='*') results
+        bodies, _ = self._inflight.do(
+            f"pages:{pages_key}",
+            lambda: self._all_locale_bodies(pages_key, content_type, include, filters)
+        )
+        
+        return self._build_entries(
+            [self._localize_body(body, locale) for body in bodies],
+            locale=locale
+        )
+    
+    def _all_locale_bodies(
+        self,
+        pages_key: str,
+        content_type: str,
+        include: int,
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the raw locale='*' pages for a collection, fetching on a miss.
+        
+        Args:
+            pages_key: Cache key with locale '*'
+            content_type: Content type ID
+            include: Reference include depth
+            filters: Extra query filters
+        
+        Returns:
+            Raw JSON page bodies
+        """
+        bodies = self._all_locale_pages.get(pages_key)
+        if bodies is None:
+            logger.info(
+                f"📡 API_CALL "
+                f"content_type={content_type} "
+                f"locale=* "
+                f"include={include}"
+            )
+            try:
+                bodies = self._fetch_raw_pages({
+                    **(filters or {}),
+                    'content_type': content_type,
+                    'locale': '*',
+                    'include': include
+                })
+            except Exception as e:
+                logger.error(
+                    f"❌ API_FAILED "
+                    f"content_type={content_type} "
+                    f"locale=* "
+                    f"error={str(e)}"
+                )
+                raise
+            self._all_locale_pages.set(pages_key, bodies)
+        
+        return bodies
+    
+    def _localize_body(self, body: Dict[str, Any], locale: str) -> Dict[str, Any]:
+        """
+        Project an all-locale collection page onto a single locale.
+        
+        Args:
+            body: Raw locale='*' page body
+            locale: Target locale code
+        
+        Returns:
+            Page body shaped like a single-locale response
+        """
+        includes = body.get('includes', {})
+        
+        localized = dict(body)
+        localized['items'] = [localize_item(item, locale) for item in body.get('items', [])]
+        localized['includes'] = {
+            link_type: [localize_item(item, locale) for item in items]
+            for link_type, items in includes.items()
+        }
+        
+        return localized
+    
+    def sync(self) -> Dict[str, int]:
+        """
+        Bring the local snapshot up to date through the Sync API.
+        
+        Uses the stored nextSyncToken for a delta sync, or runs an initial
+        sync when no token exists. The Preview API only supports initial
+        syncs, so preview mode always starts from scratch.
+        
+        Returns:
+            Sync statistics (pages, upserted, deleted)
+        
+        Raises:
+            ValueError: If the client has no sync store
+        """
+        if self.sync_store is None:
+            raise ValueError("sync() requires a SyncStore")
+        
+        store = self.sync_store
+        
+        if self.mode == 'preview':
+            store.reset()
+        
+        initial = store.next_sync_token is None
+        query: Dict[str, Any] = (
+            {'initial': True} if initial
+            else {'sync_token': store.next_sync_token}
+        )
+        
+        logger.info(
+            f"🔄 SYNC_START "
+            f"type={'initial' if initial else 'delta'} "
+            f"mode={self.mode}"
+        )
+        
+        items: List[Dict[str, Any]] = []
+        pages = 0
+        
+        try:
+            while True:
+                page_items, next_page_url, next_sync_token = self._sync_page(query)
+                pages += 1
+                items.extend(page_items)
+                
+                # nextPageUrl means more pages; nextSyncUrl ends the sync
+                if not next_page_url:
+                    break
+                query = {'sync_token': next_sync_token}
+        except Exception as e:
+            logger.error(
+                f"❌ SYNC_FAILED "
+                f"pages={pages} "
+                f"error={str(e)}"
+            )
+            raise
+        
+        counts = store.apply(items, next_sync_token)
+        with self._snapshot_lock:
+            self._snapshot_views.clear()
+        self._cache.clear()
+        
+        stats = {
+            'pages': pages,
+            'upserted': counts['upserted'],
+            'deleted': counts['deleted']
+        }
+        
+        logger.info(
+            f"✅ SYNC_COMPLETE "
+            f"type={'initial' if initial else 'delta'} "
+            f"pages={pages} "
+            f"upserted={counts['upserted']} "
+            f"deleted={counts['deleted']} "
+            f"entries={len(store.entries)} "
+            f"assets={len(store.assets)}"
+        )
+        
+        return stats
+    
+    def _sync_page(
+        self,
+        query: Dict[str, Any]
+    ) -> tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        Fetch one Sync API page.
+        
+        Goes through _get_json rather than the SDK: the SDK hydrates the
+        response in place (rich-text link targets become Link objects),
+        so its raw items could no longer be saved as JSON. Sync pages are
+        also recorded and replayed by a cassette like everything else.
+        
+        Args:
+            query: {'initial': True} or {'sync_token': ...}
+        
+        Returns:
+            Tuple of (raw items, nextPageUrl or None, sync token from
+            nextPageUrl/nextSyncUrl)
+        """
+        body = self._get_json('/sync', {
+            k: ('true' if v is True else v) for k, v in query.items()
+        })
+        next_url = body.get('nextPageUrl') or body.get('nextSyncUrl') or ''
+        token = parse_qs(urlparse(next_url).query).get('sync_token', [None])[0]
+        return body.get('items', []), body.get('nextPageUrl'), token
+    
+    def _snapshot_view(
+        self,
+        locale: str
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Get the snapshot projected onto a single locale (memoized).
+        
+        Args:
+            locale: Locale code
+        
+        Returns:
+            Tuple of (localized raw entries, localized raw assets)
+        """
+        with self._snapshot_lock:
+            if locale not in self._snapshot_views:
+                store = self.sync_store
+                self._snapshot_views[locale] = (
+                    [localize_item(e, locale) for e in store.entries.values()],
+                    [localize_item(a, locale) for a in store.assets.values()]
+                )
+            return self._snapshot_views[locale]
+    
+    def _entries_from_snapshot(
+        self,
+        content_type: str,
+        locale: str,
+        include: int
+    ) -> List[Entry]:
+        """
+        Build SDK entries for a content type from the sync snapshot.
+        
+        The snapshot is shaped like a Delivery API collection response
+        (items + includes) so links resolve exactly as they would for a
+        live request with the same include depth.
+        
+        Args:
+            content_type: Content type ID
+            locale: Locale code
+            include: Reference include depth
+        
+        Returns:
+            List of Contentful entries
+        """
+        entries, assets = self._snapshot_view(locale)
+        
+        items = []
+        linked = []
+        for raw in entries:
+            if raw['sys'].get('contentType', {}).get('sys', {}).get('id') == content_type:
+                items.append(raw)
+            else:
+                linked.append(raw)
+        
+        payload = {
+            'sys': {'type': 'Array'},
+            'total': len(items),
+            'skip': 0,
+            'limit': len(items),
+            'items': items,
+            'includes': {'Entry': linked, 'Asset': assets}
+        }
+        
+        if self.raw_entries:
+            # The snapshot holds every published item; nothing to fetch
+            return build_raw_entries([payload], self._client.default_locale)
+        
+        return list(ResourceBuilder(
+            self._client.default_locale,
+            False,
+            payload,
+            max_depth=include
+        ).build())
+    
     def get_entry(
         self,
         entry_id: str,
@@ -193,19 +1224,10 @@ class ContentfulClient:
             locale: Locale code
         
         Returns:
-            Entry or None if not found
+            Entry or None if not found or the request failed
         """
         try:
-            entry = self._client.entry(entry_id, {'locale': locale})
-            
-            logger.info(
-                f"✅ ENTRY_FETCHED "
-                f"entry_id={entry_id} "
-                f"locale={locale}"
-            )
-            
-            return entry
-            
+            return self.get_entries_by_ids([entry_id], locale)[entry_id]
         except Exception as e:
             logger.error(
                 f"❌ ENTRY_FAILED "
@@ -215,19 +1237,150 @@ class ContentfulClient:
             )
             return None
     
+    def _entry_cache_key(self, entry_id: str, locale: str, include: int) -> str:
+        """Generate the cache key for an entry fetched by ID."""
+        return f"id:{entry_id}:{locale}:{include}"
+    
+    def _find_cached_entry(
+        self,
+        entry_id: str,
+        locale: str,
+        include: int
+    ) -> Optional[Entry]:
+        """
+        Find an entry fetched by ID at the requested or a deeper include.
+        
+        Args:
+            entry_id: Entry identifier
+            locale: Locale code
+            include: Minimum include depth required
+        
+        Returns:
+            Cached entry, or None if not cached
+        """
+        for depth in range(include, max(include, MAX_INCLUDE_DEPTH) + 1):
+            cached = self._cache.get(self._entry_cache_key(entry_id, locale, depth))
+            if cached is not None:
+                return cached[0]
+        return None
+    
+    def get_entries_by_ids(
+        self,
+        entry_ids: List[str],
+        locale: str = 'en',
+        include: int = 2,
+        content_type: Optional[str] = None
+    ) -> Dict[str, Optional[Entry]]:
+        """
+        Fetch several entries by ID, batching the uncached ones.
+        
+        Cached entries are served from the shared response cache: entries
+        fetched by ID and, when content_type is given, a cached unfiltered
+        collection of that type (filtered collections are not searched).
+        The rest are requested with sys.id[in] queries of up to
+        IDS_PER_REQUEST IDs, sent concurrently (bounded by
+        page_concurrency). Fetched entries are cached for later calls.
+        
+        Args:
+            entry_ids: Entry identifiers (duplicates are fetched once)
+            locale: Locale code
+            include: Reference include depth
+            content_type: Content type of the entries, to also look them
+                up in a cached collection
+        
+        Returns:
+            Dictionary of entry ID to entry, with None for IDs that do
+            not exist (unpublished or deleted)
+        
+        Raises:
+            Exception: If a request fails; no ID is reported missing then
+        """
+        requested = list(dict.fromkeys(entry_ids))
+        results: Dict[str, Optional[Entry]] = {}
+        missing: List[str] = []
+        
+        collection: Dict[str, Entry] = {}
+        if content_type is not None:
+            cached_collection = self._find_cached(content_type, locale, include)
+            if cached_collection is not None:
+                collection = {entry.id: entry for entry in cached_collection}
+        
+        for entry_id in requested:
+            cached = collection.get(entry_id) or self._find_cached_entry(entry_id, locale, include)
+            if cached is not None:
+                results[entry_id] = cached
+            else:
+                missing.append(entry_id)
+        
+        with self._stats_lock:
+            self._cache_hits += len(results)
+            self._cache_misses += len(missing)
+        
+        if missing:
+            logger.info(
+                f"📡 API_CALL "
+                f"entry_ids={len(missing)} "
+                f"locale={locale} "
+                f"include={include} "
+                f"requests={-(-len(missing) // IDS_PER_REQUEST)}"
+            )
+            
+            try:
+                bodies = self._fetch_id_chunks(
+                    '/entries',
+                    missing,
+                    {'locale': locale, 'include': include}
+                )
+                for entry in self._build_entries(bodies, locale=locale):
+                    results[entry.id] = entry
+                    self._cache.set(self._entry_cache_key(entry.id, locale, include), [entry])
+            except Exception as e:
+                logger.error(
+                    f"❌ ENTRIES_BY_ID_FAILED "
+                    f"count={len(missing)} "
+                    f"locale={locale} "
+                    f"error={str(e)}"
+                )
+                raise
+        
+        not_found = [entry_id for entry_id in missing if entry_id not in results]
+        
+        logger.info(
+            f"✅ ENTRIES_BY_ID "
+            f"requested={len(requested)} "
+            f"cached={len(requested) - len(missing)} "
+            f"fetched={len(missing) - len(not_found)} "
+            f"missing={len(not_found)} "
+            f"locale={locale}"
+        )
+        
+        return {entry_id: results.get(entry_id) for entry_id in requested}
+    
     def clear_cache(self) -> None:
         """
         Clear the in-memory cache.
         Useful for testing or when fresh data is required.
         """
-        cache_size = len(self._cache)
-        self._cache.clear()
+        cache_size = self._cache.clear()
+        self._all_locale_pages.clear()
         
         logger.info(
             f"🗑️ CACHE_CLEARED "
             f"entries_removed={cache_size}"
         )
     
+    def close(self) -> None:
+        """
+        Stop background cache sweepers, release pooled connections and
+        save a recording cassette.
+        """
+        self._cache.stop_sweeper()
+        self._all_locale_pages.stop_sweeper()
+        self._session.close()
+        
+        if self.cassette is not None:
+            self.cassette.save()
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -236,11 +1389,23 @@ class ContentfulClient:
             Dictionary with cache stats
         """
         total_entries = sum(
-            len(entries) for entries, _ in self._cache.values()
+            len(entries) for entries in self._cache.values()
         )
+        entry_cache = self._cache.get_stats()
+        page_cache = self._all_locale_pages.get_stats()
         
         return {
             'cached_requests': len(self._cache),
             'total_cached_entries': total_entries,
-            'cache_ttl': self.cache_ttl
+            'cache_ttl': self.cache_ttl,
+            'api_calls': self._api_calls,
+            'not_modified': self._not_modified,
+            'cache_hits': self._cache_hits,
+            'cache_misses': self._cache_misses,
+            'coalesced_requests': self._coalesced,
+            'resident_bytes': entry_cache['resident_bytes'] + page_cache['resident_bytes'],
+            'cache_max_bytes': self.cache_max_bytes,
+            'evictions': entry_cache['evictions'] + page_cache['evictions'],
+            'expirations': entry_cache['expirations'] + page_cache['expirations'],
+            **self.rate_limiter.get_stats()
         }
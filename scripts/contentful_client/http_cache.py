@@ -0,0 +1,144 @@
+"""
+Persistent on-disk HTTP response cache for Contentful collection requests.
+Stores response bodies with their ETag so later builds can revalidate (304).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Any, Optional
+
+from scripts.config import logger
+
+
+class HttpCache:
+    """
+    Disk-backed ETag cache, one JSON file per request.
+
+    Files are keyed by space, environment, mode and the full query, so the
+    directory can be shared between production and preview builds and
+    restored wholesale with ``actions/cache``.
+
+    Attributes:
+        directory: Cache folder
+        space_id: Contentful space identifier
+        environment: Contentful environment
+        mode: 'production' or 'preview'
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        space_id: str,
+        mode: str = 'production',
+        environment: str = 'master'
+    ) -> None:
+        """
+        Initialize HTTP cache.
+
+        Args:
+            directory: Cache folder (created on first write)
+            space_id: Contentful space ID
+            mode: 'production' or 'preview'
+            environment: Contentful environment ID
+        """
+        self.directory = directory
+        self.space_id = space_id
+        self.mode = mode
+        self.environment = environment
+
+    def make_key(self, path: str, query: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            path: API path (e.g., '/entries')
+            query: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        normalized = '&'.join(f"{k}={query[k]}" for k in sorted(query))
+        raw_key = f"{self.space_id}:{self.environment}:{self.mode}:{path}?{normalized}"
+        return hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        """Get the file path for a cache key."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Record with 'etag' and 'body', or None if missing/unreadable
+        """
+        path = self._path_for(key)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"⚠️ HTTP_CACHE_UNREADABLE "
+                f"path={path} "
+                f"error={str(e)}"
+            )
+            return None
+
+    def put(
+        self,
+        key: str,
+        etag: Optional[str],
+        body: Dict[str, Any]
+    ) -> None:
+        """
+        Store a response body with its ETag.
+
+        Responses without an ETag are not cached (nothing to revalidate).
+        Write failures are logged and ignored; the cache is best-effort.
+
+        Args:
+            key: Cache key from make_key()
+            etag: ETag response header
+            body: Parsed JSON response body
+        """
+        if not etag:
+            return
+
+        path = self._path_for(key)
+        tmp_path = None
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Unique temp name: parallel fetches of the same key must not
+            # write into one shared partial file
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.directory, suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(
+                    {'etag': etag, 'stored_at': time.time(), 'body': body},
+                    f,
+                    ensure_ascii=False
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            logger.warning(
+                f"⚠️ HTTP_CACHE_WRITE_FAILED "
+                f"path={path} "
+                f"error={str(e)}"
+            )
@@ -0,0 +1,91 @@
+"""
+Locale demultiplexing for raw Contentful payloads.
+Turns all-locale items (Sync API / locale='*') into single-locale items.
+"""
+
+from typing import Dict, Any, List, Optional
+
+from scripts.config import DEFAULT_LOCALE, LOCALE_FALLBACKS
+
+
+def get_fallback_chain(
+    locale: str,
+    fallbacks: Optional[Dict[str, str]] = None,
+    default_locale: str = DEFAULT_LOCALE
+) -> List[str]:
+    """
+    Build the ordered list of locales to try for a field value.
+
+    Args:
+        locale: Requested locale code
+        fallbacks: Locale → fallback locale mapping
+        default_locale: Space default locale (always tried last)
+
+    Returns:
+        Locale codes in lookup order, without duplicates
+
+    Examples:
+        >>> get_fallback_chain('es', {'es': 'en-US'})
+        ['es', 'en-US']
+    """
+    if fallbacks is None:
+        fallbacks = LOCALE_FALLBACKS
+
+    chain: List[str] = []
+    current: Optional[str] = locale
+
+    # Follow fallbacks, guarding against cycles in the mapping
+    while current and current not in chain:
+        chain.append(current)
+        current = fallbacks.get(current)
+
+    if default_locale not in chain:
+        chain.append(default_locale)
+
+    return chain
+
+
+def localize_item(
+    item: Dict[str, Any],
+    locale: str,
+    fallbacks: Optional[Dict[str, str]] = None,
+    default_locale: str = DEFAULT_LOCALE
+) -> Dict[str, Any]:
+    """
+    Project an all-locale entry/asset payload onto a single locale.
+
+    Fields shaped as ``{field: {locale: value}}`` are flattened to
+    ``{field: value}`` using the fallback chain, which is the same shape
+    the Delivery API returns for a single-locale request.
+
+    Args:
+        item: Raw item with all-locale fields
+        locale: Target locale code
+        fallbacks: Locale → fallback locale mapping
+        default_locale: Space default locale
+
+    Returns:
+        New raw item with single-locale fields and sys.locale set
+    """
+    chain = get_fallback_chain(locale, fallbacks, default_locale)
+
+    localized_fields: Dict[str, Any] = {}
+    for field_name, values in item.get('fields', {}).items():
+        if not isinstance(values, dict):
+            # Already single-locale
+            localized_fields[field_name] = values
+            continue
+
+        for candidate in chain:
+            if candidate in values:
+                localized_fields[field_name] = values[candidate]
+                break
+
+    sys_data = dict(item.get('sys', {}))
+    sys_data['locale'] = locale
+
+    localized = dict(item)
+    localized['sys'] = sys_data
+    localized['fields'] = localized_fields
+
+    return localized
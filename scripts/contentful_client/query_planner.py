@@ -0,0 +1,249 @@
+"""
+Query planner for Contentful fetches.
+Collects every transformer's data needs up front and merges them into the
+smallest set of get_entries() calls before transformation starts.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from scripts.config import logger
+
+
+class DataNeed:
+    """
+    A single data requirement declared by a transformer.
+
+    Attributes:
+        content_type: Content type ID
+        include: Reference include depth the transformer relies on
+        filters: Extra query filters (part of the request identity)
+        requested_by: Name of the declaring transformer (for reporting)
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+        include: int = 2,
+        filters: Optional[Dict[str, Any]] = None,
+        requested_by: str = ''
+    ) -> None:
+        self.content_type = content_type
+        self.include = include
+        self.filters = dict(filters or {})
+        self.requested_by = requested_by
+
+    def filters_key(self) -> Tuple[Tuple[str, str], ...]:
+        """Get a hashable, order-independent view of the filters."""
+        return tuple(sorted((k, str(v)) for k, v in self.filters.items()))
+
+    def __repr__(self) -> str:
+        return (
+            f"DataNeed({self.content_type}, include={self.include}, "
+            f"by={self.requested_by or '?'})"
+        )
+
+
+class PlannedFetch:
+    """
+    One get_entries() call that serves one or more data needs.
+
+    Attributes:
+        content_type: Content type ID
+        include: Merged include depth (max of all served needs)
+        filters: Query filters shared by all served needs
+        needs: Needs answered by this fetch
+    """
+
+    def __init__(self, content_type: str, filters: Dict[str, Any]) -> None:
+        self.content_type = content_type
+        self.include = 0
+        self.filters = dict(filters)
+        self.needs: List[DataNeed] = []
+
+    def add(self, need: DataNeed) -> None:
+        """Serve a need, raising the include depth if required."""
+        self.needs.append(need)
+        self.include = max(self.include, need.include)
+
+
+class QueryPlan:
+    """
+    Result of planning: the fetches to run and how each need is served.
+
+    Attributes:
+        fetches: Planned get_entries() calls
+        needs: Every need that was planned
+    """
+
+    def __init__(self, fetches: List[PlannedFetch], needs: List[DataNeed]) -> None:
+        self.fetches = fetches
+        self.needs = needs
+
+    def execute(
+        self,
+        client: Any,
+        locale: str,
+        max_workers: int = 1
+    ) -> Dict[str, int]:
+        """
+        Run the planned fetches, filling the client cache for every need.
+
+        Transformers keep calling client.get_entries() as before; each
+        call then hits the cache entry filled here (shallower needs through
+        the client's superset lookup). A failed fetch is
+        logged and skipped so the transformer can retry and report it.
+
+        Args:
+            client: ContentfulClient instance
+            locale: Locale code
+            max_workers: Fetches run in parallel
+
+        Returns:
+            Statistics with executed and failed fetch counts
+        """
+        return execute_plans(client, {locale: self}, max_workers)
+
+    def run_fetch(self, client: Any, locale: str, fetch: PlannedFetch) -> bool:
+        """
+        Run one planned fetch, filling the cache for the needs it serves.
+
+        Args:
+            client: ContentfulClient instance
+            locale: Locale code
+            fetch: Fetch from this plan
+
+        Returns:
+            True on success, False if the fetch failed
+        """
+        try:
+            client.get_entries(
+                content_type=fetch.content_type,
+                locale=locale,
+                include=fetch.include,
+                filters=fetch.filters or None
+            )
+        except Exception as e:
+            logger.warning(
+                f"⚠️ PLANNED_FETCH_FAILED "
+                f"content_type={fetch.content_type} "
+                f"locale={locale} "
+                f"error={str(e)}"
+            )
+            return False
+
+        return True
+
+    def log_report(self, locale: str) -> None:
+        """Log the plan summary."""
+        logger.info(
+            f"🧭 QUERY_PLAN "
+            f"locale={locale} "
+            f"needs={len(self.needs)} "
+            f"fetches={len(self.fetches)}"
+        )
+
+
+class QueryPlanner:
+    """
+    Merges data needs into a minimal set of get_entries() calls.
+
+    Rules:
+    - Needs for the same content type and filters share one fetch at the
+      deepest include any of them requires.
+    - With ``uniform_depth``, every fetch is raised to the deepest include
+      any need requires, so later ad-hoc get_entries() calls at any
+      shallower depth are served from the cache.
+
+    Attributes:
+        uniform_depth: Fetch every collection at the plan's maximum depth
+    """
+
+    def __init__(self, uniform_depth: bool = False) -> None:
+        self.uniform_depth = uniform_depth
+
+    def plan(self, needs: List[DataNeed]) -> QueryPlan:
+        """
+        Build a query plan.
+
+        Args:
+            needs: Data needs from all transformers
+
+        Returns:
+            QueryPlan describing the fetches to run
+        """
+        fetches: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], PlannedFetch] = {}
+
+        for need in needs:
+            key = (need.content_type, need.filters_key())
+            if key not in fetches:
+                fetches[key] = PlannedFetch(need.content_type, need.filters)
+            fetches[key].add(need)
+
+        if self.uniform_depth and fetches:
+            max_depth = max(fetch.include for fetch in fetches.values())
+            for fetch in fetches.values():
+                fetch.include = max_depth
+
+        return QueryPlan(list(fetches.values()), list(needs))
+
+
+def execute_plans(
+    client: Any,
+    plans: Dict[str, QueryPlan],
+    max_workers: int = 1
+) -> Dict[str, int]:
+    """
+    Run the fetches of several locale plans concurrently.
+
+    Every planned fetch is independent, so all of them (across content
+    types and locales) are sent at once, bounded by max_workers. The
+    client's caches are thread-safe, so workers fill them directly.
+    Wall time approaches the slowest single fetch instead of the sum.
+
+    Args:
+        client: ContentfulClient instance
+        plans: Query plan per locale code
+        max_workers: Maximum fetches in flight
+
+    Returns:
+        Statistics with executed and failed fetch counts
+    """
+    tasks = [
+        (plan, locale, fetch)
+        for locale, plan in plans.items()
+        for fetch in plan.fetches
+    ]
+    stats = {'executed': 0, 'failed': 0}
+
+    if not tasks:
+        return stats
+
+    def timed_fetch(task: Tuple[QueryPlan, str, PlannedFetch]) -> Tuple[bool, float]:
+        plan, locale, fetch = task
+        started = time.time()
+        ok = plan.run_fetch(client, locale, fetch)
+        return ok, time.time() - started
+
+    start_time = time.time()
+    workers = max(1, min(max_workers, len(tasks)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(timed_fetch, tasks))
+
+    for ok, _ in results:
+        stats['executed' if ok else 'failed'] += 1
+
+    durations = [duration for _, duration in results]
+    logger.info(
+        f"⚡ PREFETCH_COMPLETE "
+        f"fetches={len(tasks)} "
+        f"failed={stats['failed']} "
+        f"workers={workers} "
+        f"wall={time.time() - start_time:.2f}s "
+        f"slowest={max(durations):.2f}s "
+        f"serial={sum(durations):.2f}s"
+    )
+
+    return stats
@@ -0,0 +1,290 @@
+"""
+Rate-limit-aware request scheduler for Contentful API calls.
+Token bucket per space, adaptive concurrency and jittered retries.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from scripts.config import logger
+
+
+# Status codes worth retrying (rate limited or transient server errors)
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Contentful rate limit headers
+HEADER_RESET = 'X-Contentful-RateLimit-Reset'
+HEADER_SECOND_LIMIT = 'X-Contentful-RateLimit-Second-Limit'
+HEADER_SECOND_REMAINING = 'X-Contentful-RateLimit-Second-Remaining'
+
+
+class RateLimiter:
+    """
+    Schedules HTTP requests against one Contentful space.
+
+    - Token bucket: requests start no faster than ``rate`` per second
+      (bursts up to ``burst``); the rate is lowered to the space's
+      advertised per-second limit when the API reports one.
+    - Adaptive concurrency: in-flight requests are capped by a limit that
+      halves on 429 responses, shrinks when the remaining per-second
+      budget runs low and grows by one after each healthy response.
+    - Retries: 429/5xx responses and connection errors are retried with
+      full-jitter exponential backoff, never sooner than the API's reset.
+
+    Time spent waiting for tokens or backing off is recorded as throttle
+    time, separate from request latency.
+
+    Attributes:
+        rate: Requests per second allowed by the token bucket
+        burst: Token bucket capacity
+        max_concurrency: Upper bound for the adaptive concurrency limit
+        max_retries: Retries per request before giving up
+        base_delay: First backoff delay in seconds
+        max_delay: Backoff ceiling in seconds
+    """
+
+    def __init__(
+        self,
+        rate: float = 50.0,
+        burst: Optional[int] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (default: one second of requests)
+            max_concurrency: Maximum requests in flight
+            max_retries: Retries for retryable failures
+            base_delay: Initial backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = max(rate, 0.1)
+        self.burst = burst or max(1, int(self.rate))
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+        # Token bucket state
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        # Adaptive concurrency state
+        self._limit = self.max_concurrency
+        self._in_flight = 0
+        self._slots = threading.Condition()
+
+        # Metrics
+        self._stats_lock = threading.Lock()
+        self._throttle_time = 0.0
+        self._throttled = 0
+        self._retries = 0
+
+    def _take_token(self) -> float:
+        """
+        Reserve a token, returning how long the caller must wait for it.
+
+        Tokens may go negative; each reservation waits for its own refill,
+        so concurrent callers are spaced out fairly.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _acquire_slot(self) -> None:
+        """Block until the number of requests in flight is under the limit."""
+        with self._slots:
+            while self._in_flight >= self._limit:
+                self._slots.wait()
+            self._in_flight += 1
+
+    def _release_slot(self) -> None:
+        """Release an in-flight slot and wake waiting requests."""
+        with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        """Change the concurrency limit (caller holds no locks)."""
+        with self._slots:
+            limit = max(1, min(self.max_concurrency, limit))
+            if limit == self._limit:
+                return
+            previous = self._limit
+            self._limit = limit
+            self._slots.notify_all()
+
+        if limit < previous:
+            logger.info(
+                f"🐢 CONCURRENCY_REDUCED "
+                f"from={previous} "
+                f"to={limit} "
+                f"reason={reason}"
+            )
+
+    def _wait(self, seconds: float) -> None:
+        """Sleep and record the time as throttle time."""
+        if seconds <= 0:
+            return
+        with self._stats_lock:
+            self._throttle_time += seconds
+        self._sleep(seconds)
+
+    def _backoff_delay(self, attempt: int, response: Optional[Any]) -> float:
+        """
+        Compute the delay before a retry.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            response: Failed response (None for connection errors)
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+
+        if response is not None:
+            reset = _header_number(response, HEADER_RESET)
+            if reset is not None:
+                delay = max(delay, reset)
+
+        return delay
+
+    def _observe(self, response: Any) -> None:
+        """Adapt rate and concurrency from a successful response's headers."""
+        second_limit = _header_number(response, HEADER_SECOND_LIMIT)
+        if second_limit and second_limit < self.rate:
+            with self._bucket_lock:
+                self.rate = second_limit
+                self.burst = min(self.burst, max(1, int(second_limit)))
+
+        remaining = _header_number(response, HEADER_SECOND_REMAINING)
+        if remaining is not None and remaining < self._in_flight:
+            self._set_limit(self._limit - 1, 'low_remaining')
+        elif self._limit < self.max_concurrency:
+            self._set_limit(self._limit + 1, 'healthy')
+
+    def request(self, send: Callable[[], Any], description: str = '') -> Any:
+        """
+        Send a request through the scheduler.
+
+        Args:
+            send: Callable performing one HTTP attempt and returning the
+                response (must expose status_code and headers)
+            description: Short label for log lines (e.g., the API path)
+
+        Returns:
+            The final response (possibly a non-retryable error response,
+            or the last retryable one once retries are exhausted)
+
+        Raises:
+            requests.RequestException: If the last attempt failed to connect
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait(self._take_token())
+
+            self._acquire_slot()
+            try:
+                response = send()
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response = None
+                error = e
+            finally:
+                self._release_slot()
+
+            status = response.status_code if response is not None else None
+            if error is None and status not in RETRYABLE_STATUS_CODES:
+                self._observe(response)
+                return response
+
+            if status == 429:
+                with self._stats_lock:
+                    self._throttled += 1
+                self._set_limit(self._limit // 2, 'rate_limited')
+
+            if attempt == self.max_retries:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self._backoff_delay(attempt, response)
+            with self._stats_lock:
+                self._retries += 1
+
+            logger.warning(
+                f"⚠️ {'RATE_LIMITED' if status == 429 else 'REQUEST_RETRY'} "
+                f"path={description} "
+                f"status={status or 'connection_error'} "
+                f"attempt={attempt + 1} "
+                f"retry_in={delay:.2f}s"
+            )
+            self._wait(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with throttle time, throttled and retried request
+            counts, and the current concurrency limit
+        """
+        with self._stats_lock:
+            return {
+                'throttle_time': round(self._throttle_time, 3),
+                'throttled_requests': self._throttled,
+                'retries': self._retries,
+                'concurrency_limit': self._limit
+            }
+
+
+def _header_number(response: Any, name: str) -> Optional[float]:
+    """Read a numeric response header, or None if absent/invalid."""
+    value = response.headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# One limiter per space: every client and thread hitting the same space
+# shares its token bucket
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(space_id: str, **kwargs: Any) -> RateLimiter:
+    """
+    Get the shared rate limiter for a space, creating it on first use.
+
+    Args:
+        space_id: Contentful space ID
+        **kwargs: RateLimiter options (only used on creation)
+
+    Returns:
+        RateLimiter shared by all clients of the space
+    """
+    with _limiters_lock:
+        if space_id not in _limiters:
+            _limiters[space_id] = RateLimiter(**kwargs)
+        return _limiters[space_id]
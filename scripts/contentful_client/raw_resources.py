@@ -0,0 +1,492 @@
+"""
+Lightweight entries and assets backed by raw Delivery API JSON.
+Links are resolved lazily through id indexes instead of SDK hydration.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from contentful.utils import snake_case
+
+from scripts.config import logger
+
+
+# Resource types that can be linked to
+LINK_TYPES = ('Entry', 'Asset')
+
+# Fetches raw items by ID: (link_type, ids, locale) -> raw items found
+FetchLinked = Callable[[str, List[str], str], List[Dict[str, Any]]]
+
+
+def _link_target(value: Any) -> Optional[tuple[str, str]]:
+    """Get (link_type, id) for a raw link value, or None if it is not a link."""
+    if not isinstance(value, dict):
+        return None
+    sys = value.get('sys')
+    if not isinstance(sys, dict) or sys.get('type') != 'Link':
+        return None
+    if sys.get('linkType') not in LINK_TYPES:
+        return None
+    return sys['linkType'], sys.get('id')
+
+
+def _is_rich_text(value: Any) -> bool:
+    """Check whether a raw field value is a rich text document."""
+    return isinstance(value, dict) and value.get('nodeType') == 'document'
+
+
+def _rich_text_targets(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Collect the `data.target` values of every node in a rich text tree."""
+    targets = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        data = current.get('data')
+        if isinstance(data, dict) and 'target' in data:
+            targets.append(data['target'])
+        stack.extend(child for child in current.get('content', []) if isinstance(child, dict))
+    return targets
+
+
+def resource_raw(value: Any) -> Optional[Dict[str, Any]]:
+    """Get the raw JSON of an entry or asset (SDK or raw-JSON), else None."""
+    raw = getattr(value, 'raw', None) if hasattr(value, 'fields') else None
+    if isinstance(raw, dict) and raw.get('sys', {}).get('type') in LINK_TYPES:
+        return raw
+    return None
+
+
+def collect_linked(resources: List[Any], depth: int) -> List[Dict[str, Any]]:
+    """
+    Collect the raw JSON of everything resources link to.
+
+    Walks the resolved fields (SDK or raw-JSON resources) up to ``depth``
+    link levels.
+
+    Args:
+        resources: Entries or assets to start from (not included)
+        depth: Link levels to follow
+
+    Returns:
+        Raw linked entries and assets in discovery order
+    """
+    collected: List[Dict[str, Any]] = []
+    seen = {id(resource) for resource in resources}
+    level = list(resources)
+
+    for _ in range(depth):
+        linked = []
+        stack: List[Any] = [resource.fields() for resource in level]
+        while stack:
+            value = stack.pop()
+            raw = resource_raw(value)
+            if raw is not None:
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    collected.append(raw)
+                    linked.append(value)
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+        if not linked:
+            break
+        level = linked
+
+    return collected
+
+
+class ContentTypeRef:
+    """Content type reference exposing `id` like the SDK's Link."""
+
+    def __init__(self, content_type_id: str) -> None:
+        self.id = content_type_id
+
+    def __repr__(self) -> str:
+        return f"<ContentType id='{self.id}'>"
+
+
+class RawResource:
+    """
+    Entry or asset view over a raw JSON item.
+
+    Mirrors the part of the SDK resource interface the transformers use:
+    `id`, `fields(locale, fallback_locale)` with snake_case keys and
+    attribute access to fields. Field dictionaries are built on first
+    access per locale; link values are resolved at that point, so
+    resources that are never read cost nothing beyond their raw JSON.
+
+    Attributes:
+        raw: Raw JSON item (shared with the response, never modified)
+        sys: Raw `sys` block
+        default_locale: Locale used when no locale is requested
+    """
+
+    def __init__(
+        self,
+        raw: Dict[str, Any],
+        resolver: 'LinkResolver',
+        default_locale: str = 'en-US',
+        localized: bool = False
+    ) -> None:
+        self.raw = raw
+        self.sys = raw.get('sys', {})
+        self.default_locale = default_locale
+        self._resolver = resolver
+        self._localized = localized
+        self._fields: Dict[tuple[str, Optional[str]], Dict[str, Any]] = {}
+
+    @property
+    def id(self) -> str:
+        return self.sys.get('id')
+
+    @property
+    def locale(self) -> Optional[str]:
+        return self.sys.get('locale')
+
+    def fields(
+        self,
+        locale: Optional[str] = None,
+        fallback_locale: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get fields for a locale, resolving links on first access.
+
+        Args:
+            locale: Locale to read (default: the item's or default locale)
+            fallback_locale: Locale read for fields missing in `locale`
+                (all-locale payloads only; single-locale payloads come
+                with the API's fallbacks applied)
+
+        Returns:
+            Field values keyed by snake_case field ID
+        """
+        if locale is None:
+            locale = self.locale or self.default_locale
+        if not self._localized:
+            fallback_locale = None
+
+        key = (locale, fallback_locale)
+        fields = self._fields.get(key)
+        if fields is None:
+            fields = {}
+            for field_id, value in self.raw.get('fields', {}).items():
+                if self._localized:
+                    if not isinstance(value, dict):
+                        continue
+                    if locale in value:
+                        value = value[locale]
+                    elif fallback_locale in value:
+                        value = value[fallback_locale]
+                    else:
+                        continue
+                fields[snake_case(field_id)] = self._resolver.coerce(value)
+            self._fields[key] = fields
+
+        return fields
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes; guard against recursion
+        # before __init__ has run (e.g., while unpickling)
+        if name.startswith('_') or 'raw' not in self.__dict__:
+            raise AttributeError(name)
+        fields = self.fields()
+        if name in fields:
+            return fields[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+
+class RawEntry(RawResource):
+    """Raw-JSON entry."""
+
+    @property
+    def content_type(self) -> ContentTypeRef:
+        return ContentTypeRef(self.sys.get('contentType', {}).get('sys', {}).get('id', ''))
+
+    def __repr__(self) -> str:
+        return f"<RawEntry[{self.content_type.id}] id='{self.id}'>"
+
+
+class RawAsset(RawResource):
+    """Raw-JSON asset."""
+
+    def url(self, **kwargs: Any) -> str:
+        """
+        Get the asset file URL, with optional image API parameters.
+
+        Args:
+            **kwargs: Query parameters appended to the URL (e.g., w=120)
+
+        Returns:
+            URL string, or empty string if the asset has no file
+        """
+        file = self.fields().get('file')
+        if not file:
+            return ''
+
+        url = file['url']
+        args = [f"{k}={v}" for k, v in kwargs.items()]
+        if args:
+            url += f"?{'&'.join(args)}"
+        return url
+
+    def __repr__(self) -> str:
+        return f"<RawAsset id='{self.id}'>"
+
+
+class LinkResolver:
+    """
+    Id → item indexes for the raw responses of one collection.
+
+    Items and `includes` of every page are indexed by link type and ID.
+    Resources are created once per ID and only when a link to them is
+    read. Links missing from the indexes (beyond the include depth) are
+    fetched through `fetch_linked` in one batch per link type: the first
+    miss collects every unresolved link in the indexed items, so a
+    collection needs one extra round trip per link level, not per link.
+    IDs the API does not return resolve to None, like the SDK's
+    unresolvable links.
+
+    Attributes:
+        default_locale: Space default locale
+        locale: Locale of the indexed payloads ('*' for all-locale payloads)
+    """
+
+    def __init__(
+        self,
+        default_locale: str = 'en-US',
+        locale: Optional[str] = None,
+        fetch_linked: Optional[FetchLinked] = None
+    ) -> None:
+        """
+        Initialize link resolver.
+
+        Args:
+            default_locale: Space default locale
+            locale: Locale of the payloads (None = single-locale, as returned)
+            fetch_linked: Batch fetcher for unresolved links (None = leave
+                them unresolved)
+        """
+        self.default_locale = default_locale
+        self.locale = locale
+        self._fetch_linked = fetch_linked
+
+        # {link_type: {id: raw item}}
+        self._items: Dict[str, Dict[str, Dict[str, Any]]] = {t: {} for t in LINK_TYPES}
+        self._resources: Dict[tuple[str, str], RawResource] = {}
+        self._missing: Set[tuple[str, str]] = set()
+        self._unscanned: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def localized(self) -> bool:
+        return self.locale == '*'
+
+    def add_items(self, link_type: str, items: Iterable[Dict[str, Any]]) -> None:
+        """Index raw items of one link type (later duplicates are ignored)."""
+        with self._lock:
+            index = self._items[link_type]
+            for item in items:
+                item_id = item.get('sys', {}).get('id')
+                if item_id is not None and item_id not in index:
+                    index[item_id] = item
+                    self._unscanned.append(item)
+
+    def add_body(self, body: Dict[str, Any]) -> List[RawEntry]:
+        """
+        Index a collection response body.
+
+        Args:
+            body: Raw JSON body (items + includes)
+
+        Returns:
+            Entries for the body's items, in response order
+        """
+        items = body.get('items', [])
+        self.add_items('Entry', items)
+        for link_type in LINK_TYPES:
+            self.add_items(link_type, body.get('includes', {}).get(link_type, []))
+        return [self.resource('Entry', item['sys']['id']) for item in items]
+
+    def resource(self, link_type: str, item_id: str) -> Optional[RawResource]:
+        """
+        Get the resource for an indexed or fetchable ID.
+
+        Args:
+            link_type: 'Entry' or 'Asset'
+            item_id: Item ID
+
+        Returns:
+            RawEntry/RawAsset, or None if the item cannot be found
+        """
+        key = (link_type, item_id)
+        resource = self._resources.get(key)
+        if resource is not None:
+            return resource
+
+        with self._lock:
+            if key in self._resources:
+                return self._resources[key]
+
+            raw = self._items[link_type].get(item_id)
+            if raw is None and key not in self._missing:
+                self._fetch_unresolved()
+                raw = self._items[link_type].get(item_id)
+            if raw is None:
+                self._missing.add(key)
+                return None
+
+            resource_class = RawEntry if link_type == 'Entry' else RawAsset
+            resource = resource_class(raw, self, self.default_locale, self.localized)
+            self._resources[key] = resource
+            return resource
+
+    def coerce(self, value: Any) -> Any:
+        """
+        Convert a raw field value: links to resources, link arrays to
+        lists of resolvable resources, rich text to a copy with its
+        `data.target` links resolved, anything else as is.
+        """
+        target = _link_target(value)
+        if target is not None:
+            return self.resource(*target)
+
+        if _is_rich_text(value):
+            return self._resolve_rich_text(value)
+
+        if isinstance(value, list) and value and _link_target(value[0]) is not None:
+            resolved = []
+            for link in value:
+                target = _link_target(link)
+                resource = self.resource(*target) if target is not None else None
+                if resource is not None:
+                    resolved.append(resource)
+            return resolved
+
+        return value
+
+    def _resolve_rich_text(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a rich text node with embedded entry/asset links resolved.
+
+        Like the SDK, nodes whose target cannot be resolved are dropped.
+        The raw JSON is left untouched.
+        """
+        resolved = dict(node)
+        content = node.get('content')
+        if not isinstance(content, list):
+            return resolved
+
+        children = []
+        for child in content:
+            if isinstance(child, dict):
+                data = child.get('data')
+                target = _link_target(data.get('target')) if isinstance(data, dict) else None
+                if target is not None:
+                    resource = self.resource(*target)
+                    if resource is None:
+                        continue
+                    child = dict(child, data=dict(data, target=resource))
+                child = self._resolve_rich_text(child)
+            children.append(child)
+        resolved['content'] = children
+        return resolved
+
+    def _unresolved_links(self) -> Dict[str, List[str]]:
+        """Collect link targets of newly indexed items that are not indexed."""
+        unresolved: Dict[str, List[str]] = {t: [] for t in LINK_TYPES}
+        seen: Set[tuple[str, str]] = set()
+
+        items, self._unscanned = self._unscanned, []
+        for item in items:
+            for value in item.get('fields', {}).values():
+                candidates = value.values() if self.localized and isinstance(value, dict) else [value]
+                for candidate in candidates:
+                    if _is_rich_text(candidate):
+                        links = _rich_text_targets(candidate)
+                    elif isinstance(candidate, list):
+                        links = candidate
+                    else:
+                        links = [candidate]
+                    for link in links:
+                        target = _link_target(link)
+                        if (
+                            target is None
+                            or target in seen
+                            or target in self._missing
+                            or target[1] in self._items[target[0]]
+                        ):
+                            continue
+                        seen.add(target)
+                        unresolved[target[0]].append(target[1])
+
+        return unresolved
+
+    def _fetch_unresolved(self) -> None:
+        """Batch-fetch every currently unresolved link (caller holds the lock)."""
+        if self._fetch_linked is None:
+            return
+
+        for link_type, ids in self._unresolved_links().items():
+            if not ids:
+                continue
+            try:
+                found = self._fetch_linked(link_type, ids, self.locale or self.default_locale)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ LINKS_FETCH_FAILED "
+                    f"link_type={link_type} "
+                    f"count={len(ids)} "
+                    f"error={str(e)}"
+                )
+                self._missing.update((link_type, item_id) for item_id in ids)
+                continue
+
+            self.add_items(link_type, found)
+            fetched = {item.get('sys', {}).get('id') for item in found}
+            self._missing.update(
+                (link_type, item_id) for item_id in ids if item_id not in fetched
+            )
+
+            logger.info(
+                f"🔗 LINKS_FETCHED "
+                f"link_type={link_type} "
+                f"requested={len(ids)} "
+                f"found={len(fetched)}"
+            )
+
+
+def build_raw_entries(
+    bodies: List[Dict[str, Any]],
+    default_locale: str = 'en-US',
+    localized: bool = False,
+    fetch_linked: Optional[FetchLinked] = None,
+    locale: Optional[str] = None
+) -> List[RawEntry]:
+    """
+    Wrap raw collection pages as lazily resolved entries.
+
+    All pages share one resolver, so a link on one page can resolve
+    against an item included with another.
+
+    Args:
+        bodies: Raw JSON page bodies
+        default_locale: Space default locale
+        localized: True for locale='*' payloads
+        fetch_linked: Batch fetcher for links beyond the include depth
+        locale: Locale the pages were requested in (for batch fetches)
+
+    Returns:
+        Entries from all pages, in page order
+    """
+    resolver = LinkResolver(
+        default_locale,
+        '*' if localized else locale,
+        fetch_linked
+    )
+    entries: List[RawEntry] = []
+    for body in bodies:
+        entries.extend(resolver.add_body(body))
+    return entries
@@ -0,0 +1,274 @@
+"""
+Schema-derived field projection for Contentful fetches.
+Computes the `select` list and minimal include depth for a content type
+from the JSON definitions in contentful-schemas/ and the field paths a
+transformer reads.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+from scripts.config import logger
+
+
+# Repository-level folder with one JSON definition per content type
+DEFAULT_SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'contentful-schemas'
+)
+
+# Live content type IDs whose schema file declares a different ID.
+# blogpage.json and homepage.json carry the template IDs (sys.id
+# blogTemplate/pageTemplate), while the space serves these types as
+# blogPage/homePage (CONTENT_TYPE_BLOG_POST/CONTENT_TYPE_HOMEPAGE). This
+# assumes the two are the same model under different IDs. A field the
+# schema file lacks makes project() fetch every field; other drift (e.g.,
+# changed link targets) is not detected and can skew the include depth.
+SCHEMA_ID_ALIASES: Dict[str, str] = {
+    'blogPage': 'blogTemplate',
+    'homePage': 'pageTemplate'
+}
+
+# Link target marker for asset links
+ASSET = 'Asset'
+
+
+class SchemaRegistry:
+    """
+    Content type definitions loaded from contentful-schemas/.
+
+    Attributes:
+        directory: Folder containing the schema JSON files
+        content_types: Field definitions per schema ID
+            ({content_type: {field_id: field}})
+    """
+
+    def __init__(self, directory: str = DEFAULT_SCHEMA_DIR) -> None:
+        """
+        Load every schema file in a folder.
+
+        Unreadable files are logged and skipped.
+
+        Args:
+            directory: Folder containing the schema JSON files
+        """
+        self.directory = directory
+        self.content_types: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        if not os.path.isdir(directory):
+            logger.warning(
+                f"⚠️ SCHEMA_DIR_MISSING "
+                f"path={directory}"
+            )
+            return
+
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    definition = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"⚠️ SCHEMA_UNREADABLE "
+                    f"path={path} "
+                    f"error={str(e)}"
+                )
+                continue
+
+            content_type = definition.get('id') or definition.get('sys', {}).get('id')
+            if content_type and isinstance(definition.get('fields'), list):
+                self.content_types[content_type] = {
+                    field['id']: field for field in definition['fields']
+                }
+
+    def resolve_id(self, content_type: str) -> str:
+        """Map a live content type ID to its schema ID."""
+        return SCHEMA_ID_ALIASES.get(content_type, content_type)
+
+    def has(self, content_type: str) -> bool:
+        """Check whether a content type has a schema definition."""
+        return self.resolve_id(content_type) in self.content_types
+
+    def field(self, content_type: str, field_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a field definition.
+
+        Args:
+            content_type: Content type ID (live or schema ID)
+            field_id: Contentful field ID
+
+        Returns:
+            Field definition, or None if unknown
+        """
+        return self.content_types.get(self.resolve_id(content_type), {}).get(field_id)
+
+    def link_targets(self, field: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Get the content types a link field can point to.
+
+        Args:
+            field: Field definition
+
+        Returns:
+            None for non-link fields, [ASSET] for asset links, the allowed
+            content types for validated entry links, or every known
+            content type for unrestricted entry links
+        """
+        definition = field.get('items', {}) if field.get('type') == 'Array' else field
+
+        if definition.get('type') != 'Link':
+            return None
+
+        if definition.get('linkType') == 'Asset':
+            return [ASSET]
+
+        for validation in definition.get('validations', []):
+            if 'linkContentType' in validation:
+                return list(validation['linkContentType'])
+
+        return list(self.content_types)
+
+
+class FieldProjection:
+    """
+    The part of a content type a transformer actually reads.
+
+    Attributes:
+        content_type: Content type ID
+        fields: Top-level field IDs to request (select=fields.<id>)
+        include: Minimal include depth that resolves every read path
+    """
+
+    def __init__(self, content_type: str, fields: List[str], include: int) -> None:
+        self.content_type = content_type
+        self.fields = fields
+        self.include = include
+
+    def __repr__(self) -> str:
+        return (
+            f"FieldProjection({self.content_type}, fields={self.fields}, "
+            f"include={self.include})"
+        )
+
+
+def _path_depth(
+    registry: SchemaRegistry,
+    content_type: str,
+    segments: List[str],
+    unknown: List[str]
+) -> int:
+    """
+    Count the link levels a field path crosses.
+
+    Every link field on the path (including a final one, which must be
+    resolved to be usable) needs one include level. Rich text counts as a
+    link because embedded entries/assets resolve through includes.
+    Segments the schema does not define are treated as plain fields and
+    reported through `unknown`.
+
+    Args:
+        registry: Schema registry
+        content_type: Content type the path starts from
+        segments: Field IDs (e.g., ['seo', 'ogImage'])
+        unknown: Collects unresolvable segments ('type.field')
+
+    Returns:
+        Include levels needed
+    """
+    field = registry.field(content_type, segments[0])
+    if field is None:
+        unknown.append(f"{content_type}.{segments[0]}")
+        return 0
+
+    rest = segments[1:]
+    targets = registry.link_targets(field)
+
+    if targets is None:
+        return 1 if field.get('type') == 'RichText' else 0
+
+    if not rest or targets == [ASSET]:
+        # Asset fields (url, title, ...) come with the asset itself
+        return 1
+
+    candidates = [
+        target for target in targets
+        if registry.has(target) and registry.field(target, rest[0]) is not None
+    ]
+
+    if not candidates:
+        unknown.append(f"{'|'.join(targets)}.{rest[0]}")
+        return 1
+
+    return 1 + max(
+        _path_depth(registry, target, rest, unknown) for target in candidates
+    )
+
+
+def project(
+    content_type: str,
+    field_paths: List[str],
+    registry: Optional[SchemaRegistry] = None
+) -> Optional[FieldProjection]:
+    """
+    Compute the projection for a content type and the paths read from it.
+
+    Paths are dotted Contentful field IDs, following links
+    (e.g., 'seo.ogImage', 'blocks.cards.image'). For multi-type links
+    the next segment is resolved against every allowed type that has it.
+
+    Args:
+        content_type: Root content type ID
+        field_paths: Field paths the transformer reads
+        registry: Schema registry (default: the repository schemas)
+
+    Returns:
+        FieldProjection, or None if the schema is missing or a top-level
+        field is unknown (selecting it away could drop live data, so the
+        caller should fetch every field)
+    """
+    registry = registry or get_schema_registry()
+
+    if not field_paths or not registry.has(content_type):
+        return None
+
+    fields: List[str] = []
+    include = 0
+
+    for path in field_paths:
+        segments = path.split('.')
+
+        if registry.field(content_type, segments[0]) is None:
+            logger.warning(
+                f"⚠️ SCHEMA_PROJECTION_UNKNOWN_FIELD "
+                f"content_type={content_type} "
+                f"path={path} "
+                f"action=fetch_all_fields"
+            )
+            return None
+
+        unknown: List[str] = []
+        include = max(include, _path_depth(registry, content_type, segments, unknown))
+
+        for segment in unknown:
+            logger.warning(
+                f"⚠️ SCHEMA_PROJECTION_UNKNOWN_FIELD "
+                f"content_type={content_type} "
+                f"path={path} "
+                f"field={segment} "
+                f"action=assume_plain_field"
+            )
+
+        if segments[0] not in fields:
+            fields.append(segments[0])
+
+    return FieldProjection(content_type, fields, include)
+
+
+@lru_cache(maxsize=None)
+def get_schema_registry(directory: str = DEFAULT_SCHEMA_DIR) -> SchemaRegistry:
+    """Get the (memoized) schema registry for a folder."""
+    return SchemaRegistry(directory)
@@ -0,0 +1,213 @@
+"""
+On-disk snapshot for Contentful Sync API delta mode.
+Persists nextSyncToken plus every synced entry and asset as raw JSON.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Any, List, Optional
+
+from scripts.config import logger
+
+
+SYNC_STATE_FILENAME = 'sync-state.json'
+SYNC_STATE_VERSION = 1
+
+
+class SyncStore:
+    """
+    Local mirror of a Contentful space maintained through the Sync API.
+
+    The snapshot keeps items in the all-locale shape returned by the
+    Sync API (``fields: {name: {locale: value}}``). State is scoped to
+    space, environment and mode; a mismatch discards the snapshot and
+    forces an initial sync.
+
+    Attributes:
+        directory: Folder holding the state file
+        space_id: Contentful space identifier
+        environment: Contentful environment
+        mode: 'production' or 'preview'
+        next_sync_token: Token for the next delta sync (None = initial)
+        entries: Raw entries keyed by ID
+        assets: Raw assets keyed by ID
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        space_id: str,
+        mode: str = 'production',
+        environment: str = 'master'
+    ) -> None:
+        """
+        Initialize sync store.
+
+        Args:
+            directory: Folder for the state file (created on save)
+            space_id: Contentful space ID
+            mode: 'production' or 'preview'
+            environment: Contentful environment ID
+        """
+        self.directory = directory
+        self.space_id = space_id
+        self.mode = mode
+        self.environment = environment
+        self.path = os.path.join(directory, SYNC_STATE_FILENAME)
+
+        self.next_sync_token: Optional[str] = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.assets: Dict[str, Dict[str, Any]] = {}
+        self.synced_at: Optional[float] = None
+
+    def load(self) -> bool:
+        """
+        Load persisted state from disk.
+
+        Returns:
+            True if a usable snapshot was loaded, False otherwise
+        """
+        if not os.path.exists(self.path):
+            logger.info(f"📭 SYNC_STATE_MISSING path={self.path}")
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"⚠️ SYNC_STATE_UNREADABLE "
+                f"path={self.path} "
+                f"error={str(e)}"
+            )
+            return False
+
+        scope = (
+            state.get('version'),
+            state.get('space_id'),
+            state.get('environment'),
+            state.get('mode')
+        )
+        expected = (SYNC_STATE_VERSION, self.space_id, self.environment, self.mode)
+
+        if scope != expected:
+            logger.warning(
+                f"⚠️ SYNC_STATE_MISMATCH "
+                f"path={self.path} "
+                f"action=initial_sync"
+            )
+            return False
+
+        self.next_sync_token = state.get('next_sync_token')
+        self.entries = state.get('entries', {})
+        self.assets = state.get('assets', {})
+        self.synced_at = state.get('synced_at')
+
+        logger.info(
+            f"✅ SYNC_STATE_LOADED "
+            f"entries={len(self.entries)} "
+            f"assets={len(self.assets)}"
+        )
+
+        return True
+
+    def save(self) -> None:
+        """
+        Atomically write state to disk.
+
+        Raises:
+            IOError: If the state file cannot be written or the snapshot
+                is not JSON-serializable
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        state = {
+            'version': SYNC_STATE_VERSION,
+            'space_id': self.space_id,
+            'environment': self.environment,
+            'mode': self.mode,
+            'next_sync_token': self.next_sync_token,
+            'synced_at': self.synced_at,
+            'entries': self.entries,
+            'assets': self.assets
+        }
+
+        tmp_path = None
+
+        try:
+            # Unique temp name: concurrent builds sharing the directory must
+            # not write into one shared partial file
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.directory, suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            logger.error(
+                f"❌ SYNC_STATE_WRITE_FAILED "
+                f"path={self.path} "
+                f"error={str(e)}"
+            )
+            raise IOError(f"Failed to write sync state: {str(e)}")
+
+        logger.info(
+            f"💾 SYNC_STATE_SAVED "
+            f"path={self.path} "
+            f"entries={len(self.entries)} "
+            f"assets={len(self.assets)}"
+        )
+
+    def reset(self) -> None:
+        """Drop the snapshot and token so the next sync is an initial one."""
+        self.next_sync_token = None
+        self.entries = {}
+        self.assets = {}
+        self.synced_at = None
+
+    def apply(
+        self,
+        items: List[Dict[str, Any]],
+        next_sync_token: str
+    ) -> Dict[str, int]:
+        """
+        Merge a batch of sync items into the snapshot.
+
+        Args:
+            items: Raw sync items (Entry, Asset, DeletedEntry, DeletedAsset)
+            next_sync_token: Token returned with the final sync page
+
+        Returns:
+            Counts of upserted and deleted items
+        """
+        counts = {'upserted': 0, 'deleted': 0}
+
+        for item in items:
+            sys_data = item.get('sys', {})
+            item_type = sys_data.get('type')
+            item_id = sys_data.get('id')
+
+            if item_type == 'Entry':
+                self.entries[item_id] = item
+                counts['upserted'] += 1
+            elif item_type == 'Asset':
+                self.assets[item_id] = item
+                counts['upserted'] += 1
+            elif item_type == 'DeletedEntry':
+                if self.entries.pop(item_id, None) is not None:
+                    counts['deleted'] += 1
+            elif item_type == 'DeletedAsset':
+                if self.assets.pop(item_id, None) is not None:
+                    counts['deleted'] += 1
+
+        self.next_sync_token = next_sync_token
+        self.synced_at = time.time()
+
+        return counts
@@ -6,9 +6,11 @@ Fetches content from Contentful, transforms to Jekyll format, and writes files.
 Supports dual-mode operation (production/preview).
 """
 
+import argparse
 import sys
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
 
 # Import configuration and clients
 from scripts.config import (
@@ -16,31 +18,82 @@ from scripts.config import (
     CONTENTFUL_SPACE_ID,
     CONTENTFUL_MODE,
     SUPPORTED_LOCALES,
+    CONTENTFUL_SYNC_ENABLED,
+    CONTENTFUL_SYNC_DIR,
+    CONTENTFUL_PAGE_SIZE,
+    CONTENTFUL_PAGE_CONCURRENCY,
+    CONTENTFUL_FETCH_CONCURRENCY,
+    CONTENTFUL_LOCALE_CONCURRENCY,
+    CONTENTFUL_STAGE_CONCURRENCY,
+    CONTENTFUL_TRANSFORM_WORKERS,
+    CONTENTFUL_TRANSFORM_CHUNK_SIZE,
+    CONTENTFUL_PREFETCH_MAX_DEPTH,
+    CONTENTFUL_RATE_LIMIT,
+    CONTENTFUL_MAX_IN_FLIGHT,
+    CONTENTFUL_MAX_RETRIES,
+    CONTENTFUL_CACHE_MAX_BYTES,
+    CONTENTFUL_CACHE_SWEEP_INTERVAL,
+    CONTENTFUL_HTTP_CACHE_ENABLED,
+    CONTENTFUL_HTTP_CACHE_DIR,
+    CONTENTFUL_MULTI_LOCALE,
+    CONTENTFUL_RAW_ENTRIES,
+    CONTENTFUL_STREAM_POSTS,
+    CONTENTFUL_INCREMENTAL,
+    CONTENTFUL_BUILD_MANIFEST,
+    CONTENTFUL_CHANGE_SUMMARY,
+    CONTENTFUL_NO_CHANGES_EXIT_CODE,
+    CONTENTFUL_CASSETTE,
+    CONTENTFUL_CASSETTE_MODE,
+    CONTENTFUL_CASSETTE_LATENCY,
+    CONTENTFUL_API_URL,
     get_active_token,
     get_jekyll_locale
 )
+from scripts.build_graph import BuildGraph
+from scripts.build_manifest import UP_TO_DATE, BuildManifest, code_hash, output_key, source_versions
+from scripts.contentful_client.cassette import Cassette
 from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_client.http_cache import HttpCache
+from scripts.contentful_client.query_planner import QueryPlanner, QueryPlan, execute_plans
+from scripts.contentful_client.rate_limiter import get_rate_limiter
+from scripts.contentful_client.sync_store import SyncStore
 
 # Import transformers
+from scripts.transformers.base_transformer import BaseTransformer
 from scripts.transformers.blog_post_transformer import BlogPostTransformer
 from scripts.transformers.blog_listing_page_transformer import BlogListingPageTransformer
 from scripts.transformers.profile_transformer import ProfileTransformer
-from scripts.transformers.header_transformer import HeaderTransformer
-from scripts.transformers.footer_transformer import FooterTransformer
 from scripts.transformers.homepage_transformer import HomepageTransformer
+from scripts.transformers.parallel import shutdown_transform_executor
 
 # Import writers
 from scripts.writers.file_writer import FileWriter
 from scripts.writers.data_writer import DataWriter
+from scripts.writers.change_set import ChangeSet
+from scripts.writers.content_hash import REMOVED
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for transformation script.
     
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
     Returns:
-        Exit code (0 = success, 1 = failure)
+        Exit code (0 = success, 1 = failure, CONTENTFUL_NO_CHANGES_EXIT_CODE
+        = success without any file change when set)
     """
+    parser = argparse.ArgumentParser(description='Transform Contentful content into Jekyll posts and data files.')
+    parser.add_argument(
+        '--changed-entry',
+        action='append',
+        default=[],
+        metavar='ID',
+        help='Only rebuild the outputs built from this entry or asset (repeatable)'
+    )
+    args = parser.parse_args(argv)
+    
     start_time = time.time()
     
     logger.info("🚀 BUILD_START")
@@ -51,69 +104,195 @@ def main() -> int:
         f"locales={SUPPORTED_LOCALES}"
     )
     
+    # Record/replay cassette (replay runs fully offline)
+    cassette = None
+    if CONTENTFUL_CASSETTE:
+        try:
+            cassette = Cassette(
+                CONTENTFUL_CASSETTE,
+                mode=CONTENTFUL_CASSETTE_MODE,
+                latency=CONTENTFUL_CASSETTE_LATENCY
+            )
+            if cassette.replaying:
+                cassette.load()
+        except Exception as e:
+            logger.error(f"❌ CASSETTE_ERROR: {str(e)}")
+            return 1
+    
     # Get active token based on mode
     try:
         access_token = get_active_token()
     except Exception as e:
-        logger.error(f"❌ CONFIG_ERROR: {str(e)}")
-        return 1
+        if cassette is None or not cassette.replaying:
+            logger.error(f"❌ CONFIG_ERROR: {str(e)}")
+            return 1
+        # Replay never sends the token
+        access_token = 'offline'
+    
+    # Load sync snapshot (delta mode)
+    sync_store = None
+    if CONTENTFUL_SYNC_ENABLED:
+        sync_store = SyncStore(
+            CONTENTFUL_SYNC_DIR,
+            space_id=CONTENTFUL_SPACE_ID,
+            mode=CONTENTFUL_MODE
+        )
+        sync_store.load()
+    
+    # Persistent ETag cache (restored between CI runs)
+    http_cache = None
+    if CONTENTFUL_HTTP_CACHE_ENABLED:
+        http_cache = HttpCache(
+            CONTENTFUL_HTTP_CACHE_DIR,
+            space_id=CONTENTFUL_SPACE_ID,
+            mode=CONTENTFUL_MODE
+        )
     
     # Initialize Contentful client
     try:
         client = ContentfulClient(
             space_id=CONTENTFUL_SPACE_ID,
             access_token=access_token,
-            mode=CONTENTFUL_MODE
+            mode=CONTENTFUL_MODE,
+            sync_store=sync_store,
+            page_size=CONTENTFUL_PAGE_SIZE,
+            page_concurrency=CONTENTFUL_PAGE_CONCURRENCY,
+            http_cache=http_cache,
+            multi_locale=CONTENTFUL_MULTI_LOCALE,
+            rate_limiter=get_rate_limiter(
+                CONTENTFUL_SPACE_ID,
+                rate=CONTENTFUL_RATE_LIMIT,
+                max_concurrency=CONTENTFUL_MAX_IN_FLIGHT,
+                max_retries=CONTENTFUL_MAX_RETRIES
+            ),
+            cache_max_bytes=CONTENTFUL_CACHE_MAX_BYTES,
+            cache_sweep_interval=CONTENTFUL_CACHE_SWEEP_INTERVAL,
+            raw_entries=CONTENTFUL_RAW_ENTRIES,
+            cassette=cassette,
+            api_url=CONTENTFUL_API_URL or None
         )
     except Exception as e:
         logger.error(f"❌ CLIENT_INIT_FAILED: {str(e)}")
         return 1
     
-    # Initialize writers
-    file_writer = FileWriter()
-    data_writer = DataWriter()
+    # Pull created/updated/deleted items since the last run
+    if sync_store is not None:
+        try:
+            client.sync()
+            sync_store.save()
+        except Exception as e:
+            # Graceful degradation: fall back to full collection fetches
+            logger.warning(
+                f"⚠️ SYNC_UNAVAILABLE "
+                f"error={str(e)} "
+                f"action=full_fetch"
+            )
+            client.sync_store = None
+    
+    # Build manifest: sources of every output (skips unchanged outputs
+    # when incremental, maps changed entries to outputs)
+    manifest = None
+    if CONTENTFUL_BUILD_MANIFEST:
+        manifest = BuildManifest(
+            CONTENTFUL_BUILD_MANIFEST,
+            space_id=CONTENTFUL_SPACE_ID,
+            mode=CONTENTFUL_MODE,
+            incremental=CONTENTFUL_INCREMENTAL
+        )
+        manifest.load()
+    
+    # Targeted rebuild of the outputs a changed entry flows into
+    targets = None
+    if args.changed_entry:
+        targets = resolve_targets(manifest, args.changed_entry)
+    
+    # Initialize writers (sharing a record of every file they touch)
+    changes = ChangeSet()
+    file_writer = FileWriter(changes=changes)
+    data_writer = DataWriter(changes=changes)
     
     # Track statistics
     stats: Dict[str, Any] = {
         'total_entries': 0,
         'successful_transformations': 0,
         'failed_transformations': 0,
+        'files_written': 0,
+        'files_unchanged': 0,
         'locales_processed': []
     }
     
-    # Process each locale
-    for locale in SUPPORTED_LOCALES:
-        logger.info(f"\n📍 LOCALE_START locale={locale}")
+    # Plan every locale's fetches, then send them all concurrently; the
+    # per-locale transforms below are served from the primed cache
+    locale_transformers = {
+        locale: create_transformers(client, locale)
+        for locale in SUPPORTED_LOCALES
+    }
+    
+    # Targeted rebuilds fetch only what their outputs need, in their stages
+    if targets is None:
+        plans = {
+            locale: plan_locale(planned_transformers(transformers), locale)
+            for locale, transformers in locale_transformers.items()
+        }
         
         try:
-            # Process locale
-            locale_stats = process_locale(
-                client,
-                locale,
-                file_writer,
-                data_writer
-            )
-            
-            # Aggregate statistics
-            stats['total_entries'] += locale_stats['total_entries']
-            stats['successful_transformations'] += locale_stats['successful']
-            stats['failed_transformations'] += locale_stats['failed']
-            stats['locales_processed'].append(locale)
-            
-            logger.info(
-                f"✅ LOCALE_COMPLETE "
-                f"locale={locale} "
-                f"success={locale_stats['successful']} "
-                f"failed={locale_stats['failed']}"
-            )
-            
+            execute_plans(client, plans, CONTENTFUL_FETCH_CONCURRENCY)
         except Exception as e:
-            logger.error(
-                f"❌ LOCALE_FAILED "
-                f"locale={locale} "
-                f"error={str(e)}"
+            # Graceful degradation: transformers fetch on their own
+            logger.warning(
+                f"⚠️ PREFETCH_FAILED "
+                f"error={str(e)} "
+                f"action=sequential_fetch"
             )
+    
+    # Process each locale (concurrently when CONTENTFUL_LOCALE_CONCURRENCY > 1)
+    locale_results = run_locales(
+        client,
+        SUPPORTED_LOCALES,
+        file_writer,
+        data_writer,
+        locale_transformers,
+        CONTENTFUL_LOCALE_CONCURRENCY,
+        manifest,
+        targets
+    )
+    
+    # Aggregate statistics (in SUPPORTED_LOCALES order)
+    for locale, locale_stats in locale_results.items():
+        if locale_stats is None:
             stats['failed_transformations'] += 1
+            continue
+        stats['total_entries'] += locale_stats['total_entries']
+        stats['successful_transformations'] += locale_stats['successful']
+        stats['failed_transformations'] += locale_stats['failed']
+        stats['files_written'] += locale_stats['written']
+        stats['files_unchanged'] += locale_stats['unchanged']
+        stats['locales_processed'].append(locale)
+    
+    build_stats = {'skipped': 0, 'rebuilt': 0}
+    if manifest is not None:
+        build_stats = manifest.get_stats()
+        try:
+            manifest.save()
+        except IOError as e:
+            # Graceful degradation: the next build rebuilds everything
+            logger.warning(
+                f"⚠️ BUILD_MANIFEST_NOT_SAVED "
+                f"error={str(e)} "
+                f"action=full_rebuild_next_run"
+            )
+    
+    # Change summary: lets CI skip the Jekyll build and deploy
+    if CONTENTFUL_CHANGE_SUMMARY:
+        try:
+            changes.save(CONTENTFUL_CHANGE_SUMMARY, [file_writer.posts_dir, data_writer.data_dir])
+        except IOError as e:
+            # Graceful degradation: CI treats a missing summary as changed
+            logger.warning(
+                f"⚠️ CHANGE_SUMMARY_NOT_SAVED "
+                f"error={str(e)} "
+                f"action=full_deploy"
+            )
     
     # Calculate build duration
     duration = time.time() - start_time
@@ -134,131 +313,609 @@ def main() -> int:
         )
     
     # Final summary
+    client_stats = client.get_cache_stats()
+    change_counts = changes.counts()
     logger.info(
         f"\n📊 BUILD_COMPLETE "
         f"duration={duration:.1f}s "
+        f"api_calls={client_stats['api_calls']} "
+        f"not_modified={client_stats['not_modified']} "
+        f"cache_hits={client_stats['cache_hits']} "
+        f"coalesced={client_stats['coalesced_requests']} "
+        f"cache_bytes={client_stats['resident_bytes']} "
+        f"evictions={client_stats['evictions']} "
+        f"throttle_time={client_stats['throttle_time']:.1f}s "
+        f"throttled={client_stats['throttled_requests']} "
+        f"retries={client_stats['retries']} "
         f"total_entries={stats['total_entries']} "
         f"successful={stats['successful_transformations']} "
         f"failed={stats['failed_transformations']} "
+        f"skipped={build_stats['skipped']} "
+        f"rebuilt={build_stats['rebuilt']} "
+        f"written={stats['files_written']} "
+        f"unchanged={stats['files_unchanged']} "
+        f"removed={change_counts[REMOVED]} "
         f"locales={stats['locales_processed']}"
     )
     
+    client.close()
+    shutdown_transform_executor()
+    
     # Determine exit code based on failure threshold
     exit_code = calculate_exit_code(stats)
     
+    if exit_code == 0 and CONTENTFUL_NO_CHANGES_EXIT_CODE and not changes.changed:
+        logger.info(
+            f"💤 NO_CHANGES "
+            f"exit_code={CONTENTFUL_NO_CHANGES_EXIT_CODE}"
+        )
+        return CONTENTFUL_NO_CHANGES_EXIT_CODE
+    
     return exit_code
 
 
+def resolve_targets(
+    manifest: Optional[BuildManifest],
+    changed_ids: List[str]
+) -> Optional[Set[str]]:
+    """
+    Map changed entries to the outputs to rebuild.
+    
+    Falls back to a full build (None) when the mapping cannot be
+    trusted: no manifest from an earlier build, recorded outputs missing
+    on disk (a targeted build would deploy an incomplete site), or IDs no
+    recorded output uses (e.g., a newly published post).
+    
+    Args:
+        manifest: Loaded build manifest, if any
+        changed_ids: Changed entry or asset IDs
+    
+    Returns:
+        Output keys to rebuild, or None for a full build
+    """
+    if manifest is None or not manifest.records:
+        logger.warning(
+            f"⚠️ TARGETED_BUILD_UNAVAILABLE "
+            f"reason=no_manifest "
+            f"action=full_build"
+        )
+        return None
+    
+    missing = manifest.missing_outputs()
+    if missing:
+        logger.warning(
+            f"⚠️ TARGETED_BUILD_UNAVAILABLE "
+            f"reason=outputs_missing "
+            f"missing={len(missing)} "
+            f"action=full_build"
+        )
+        return None
+    
+    targets = manifest.affected_outputs(changed_ids)
+    if not targets:
+        logger.warning(
+            f"⚠️ CHANGED_ENTRY_UNKNOWN "
+            f"ids={','.join(changed_ids)} "
+            f"action=full_build"
+        )
+        return None
+    
+    logger.info(
+        f"🎯 TARGETED_BUILD "
+        f"ids={','.join(changed_ids)} "
+        f"outputs={len(targets)}"
+    )
+    return targets
+
+
+def create_transformers(
+    client: ContentfulClient,
+    locale: str
+) -> Dict[str, BaseTransformer]:
+    """
+    Initialize every transformer for a locale.
+    
+    Header and footer data come from the homepage entry's references
+    (HomepageTransformer.extract_header/extract_footer), so their own
+    transformers are not created: their fetches would never be read.
+    
+    Args:
+        client: Contentful client instance
+        locale: Contentful locale code (e.g., 'en-US')
+    
+    Returns:
+        Transformers keyed by role
+    """
+    return {
+        'blog': BlogPostTransformer(
+            client,
+            locale,
+            workers=CONTENTFUL_TRANSFORM_WORKERS,
+            chunk_size=CONTENTFUL_TRANSFORM_CHUNK_SIZE
+        ),
+        'blog_listing': BlogListingPageTransformer(client, locale),
+        'profile': ProfileTransformer(client, locale),
+        'homepage': HomepageTransformer(client, locale)
+    }
+
+
+def planned_transformers(transformers: Dict[str, BaseTransformer]) -> List[BaseTransformer]:
+    """
+    Get the transformers whose fetches are planned and prefetched.
+    
+    Streamed blog posts are left out: prefetching would cache the whole
+    collection, which streaming exists to avoid.
+    
+    Args:
+        transformers: Transformers from create_transformers()
+    
+    Returns:
+        Transformers to plan
+    """
+    return [
+        transformer for role, transformer in transformers.items()
+        if not (role == 'blog' and CONTENTFUL_STREAM_POSTS)
+    ]
+
+
+def plan_locale(transformers: List[BaseTransformer], locale: str) -> QueryPlan:
+    """
+    Merge the data needs of a locale's transformers into a query plan.
+    
+    Args:
+        transformers: Transformers for the locale
+        locale: Contentful locale code (for the report)
+    
+    Returns:
+        Query plan whose fetches serve every transformer
+    """
+    needs = []
+    for transformer in transformers:
+        needs.extend(transformer.get_data_needs())
+    
+    plan = QueryPlanner(uniform_depth=CONTENTFUL_PREFETCH_MAX_DEPTH).plan(needs)
+    plan.log_report(locale)
+    return plan
+
+
+def run_locales(
+    client: ContentfulClient,
+    locales: List[str],
+    file_writer: FileWriter,
+    data_writer: DataWriter,
+    locale_transformers: Dict[str, Dict[str, BaseTransformer]],
+    concurrency: int = 1,
+    manifest: Optional[BuildManifest] = None,
+    targets: Optional[Set[str]] = None
+) -> Dict[str, Optional[Dict[str, int]]]:
+    """
+    Run process_locale() for every locale.
+    
+    Locales share only the (thread-safe) client and write to separate
+    files, so with concurrency > 1 they run on a thread pool.
+    
+    Args:
+        client: Contentful client instance
+        locales: Contentful locale codes
+        file_writer: File writer instance
+        data_writer: Data writer instance
+        locale_transformers: Transformers per locale from create_transformers()
+        concurrency: Locales processed at once
+        manifest: Optional build manifest (skips and records outputs)
+        targets: Output keys to rebuild (None = every output)
+    
+    Returns:
+        Statistics per locale in locales order (None for a failed locale)
+    """
+    def run(locale: str) -> Optional[Dict[str, int]]:
+        logger.info(f"\n📍 LOCALE_START locale={locale}")
+        
+        try:
+            locale_stats = process_locale(
+                client,
+                locale,
+                file_writer,
+                data_writer,
+                locale_transformers.get(locale),
+                manifest,
+                targets
+            )
+        except Exception as e:
+            logger.error(
+                f"❌ LOCALE_FAILED "
+                f"locale={locale} "
+                f"error={str(e)}"
+            )
+            return None
+        
+        logger.info(
+            f"✅ LOCALE_COMPLETE "
+            f"locale={locale} "
+            f"success={locale_stats['successful']} "
+            f"failed={locale_stats['failed']} "
+            f"written={locale_stats['written']} "
+            f"unchanged={locale_stats['unchanged']}"
+        )
+        return locale_stats
+    
+    workers = min(max(1, concurrency), len(locales))
+    if workers <= 1:
+        return {locale: run(locale) for locale in locales}
+    
+    logger.info(
+        f"🔀 LOCALES_PARALLEL "
+        f"locales={len(locales)} "
+        f"concurrency={workers}"
+    )
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() preserves locale order regardless of completion order
+        return dict(zip(locales, executor.map(run, locales)))
+
+
+def fetch_entries(transformer: BaseTransformer) -> List[Any]:
+    """
+    Fetch a transformer's entries (served from the primed cache).
+    
+    Args:
+        transformer: Transformer whose content type to fetch
+    
+    Returns:
+        Entries at the transformer's include depth
+    """
+    return transformer.client.get_entries(
+        content_type=transformer.content_type,
+        locale=transformer.locale,
+        include=transformer.include_depth
+    )
+
+
+def fetch_entries_by_ids(transformer: BaseTransformer, entry_ids: List[str]) -> List[Any]:
+    """
+    Fetch specific entries of a transformer's content type.
+    
+    Args:
+        transformer: Transformer whose locale and include depth to use
+        entry_ids: Entry identifiers
+    
+    Returns:
+        Entries found (unpublished or deleted IDs are logged and left out)
+    
+    Raises:
+        Exception: If a lookup request fails (the stage fails instead of
+            reporting the IDs as deleted)
+    """
+    found = transformer.client.get_entries_by_ids(
+        entry_ids,
+        locale=transformer.locale,
+        include=transformer.include_depth,
+        content_type=transformer.content_type
+    )
+    
+    missing = [entry_id for entry_id in entry_ids if found.get(entry_id) is None]
+    if missing:
+        logger.warning(
+            f"⚠️ ENTRIES_NOT_FOUND "
+            f"content_type={transformer.content_type} "
+            f"locale={transformer.locale} "
+            f"ids={','.join(missing)}"
+        )
+    
+    return [found[entry_id] for entry_id in entry_ids if found.get(entry_id) is not None]
+
+
+def first_entry(entries: List[Any], content_type: str, locale: str) -> Optional[Any]:
+    """
+    Get the entry of a singleton content type.
+    
+    Args:
+        entries: Fetched entries
+        content_type: Content type ID (for logs)
+        locale: Locale code (for logs)
+    
+    Returns:
+        The first entry, or None when there is none
+    """
+    if not entries:
+        logger.warning(
+            f"⚠️ NO_ENTRY_FOUND "
+            f"content_type={content_type} "
+            f"locale={locale}"
+        )
+        return None
+    
+    if len(entries) > 1:
+        logger.warning(
+            f"⚠️ MULTIPLE_ENTRIES_FOUND "
+            f"content_type={content_type} "
+            f"count={len(entries)} "
+            f"using_first=true"
+        )
+    
+    return entries[0]
+
+
+def build_locale_graph(
+    locale: str,
+    file_writer: FileWriter,
+    data_writer: DataWriter,
+    transformers: Dict[str, BaseTransformer],
+    manifest: Optional[BuildManifest] = None,
+    targets: Optional[Set[str]] = None
+) -> BuildGraph:
+    """
+    Declare a locale's fetch, transform and write stages.
+    
+    Every output has its own chain, so independent outputs run in
+    parallel. Header and footer are derived from the fetched homepage
+    entry and depend on it explicitly.
+    
+    With an incremental build manifest, outputs whose source entries and
+    code are unchanged since the last build are neither transformed nor
+    written. With targets, only the targeted outputs get stages (posts
+    are fetched by ID) and they are always rebuilt.
+    
+    Write stages return None when there was nothing to write, UP_TO_DATE
+    when the output was skipped, or their 'written', 'unchanged' and
+    'failed' file counts (blog posts add 'up_to_date' for skipped posts).
+    
+    Args:
+        locale: Contentful locale code
+        file_writer: File writer instance
+        data_writer: Data writer instance
+        transformers: Transformers from create_transformers()
+        manifest: Optional build manifest (skips and records outputs)
+        targets: Output keys to rebuild (None = every output)
+    
+    Returns:
+        Build graph for the locale
+    """
+    jekyll_locale = get_jekyll_locale(locale)
+    graph = BuildGraph(f"locale:{locale}")
+    
+    blog_transformer = transformers['blog']
+    homepage_transformer = transformers['homepage']
+    
+    # Blog posts (→ _posts/<locale>/)
+    blog_code = code_hash(type(blog_transformer), FileWriter)
+    post_prefix = output_key(locale, 'post', '')
+    post_sources: Dict[str, Dict[str, str]] = {}
+    seen_posts: Set[str] = set()
+    
+    def post_unchanged(entry: Any) -> bool:
+        seen_posts.add(entry.id)
+        sources = source_versions([entry], blog_transformer.include_depth)
+        post_sources[entry.id] = sources
+        return targets is None and manifest.skip(output_key(locale, 'post', entry.id), sources, blog_code)
+    
+    def remove_posts(paths: List[str]) -> None:
+        for path in paths:
+            try:
+                file_writer.remove_post(path)
+            except IOError:
+                # Logged by the writer; the stale file stays
+                pass
+    
+    def prune_posts(candidates: List[str], allow_empty: bool = False) -> None:
+        # Posts whose entries were not fetched were unpublished or deleted
+        gone = [key for key in candidates if key[len(post_prefix):] not in seen_posts]
+        if not gone:
+            return
+        if not seen_posts and not allow_empty:
+            logger.warning(
+                f"⚠️ PRUNE_SKIPPED "
+                f"locale={locale} "
+                f"stale={len(gone)} "
+                f"reason=empty_collection"
+            )
+            return
+        remove_posts(manifest.drop(gone))
+        logger.info(
+            f"🧹 POSTS_PRUNED "
+            f"locale={locale} "
+            f"count={len(gone)}"
+        )
+    
+    def write_posts(results: Iterable[Tuple[Any, Dict[str, Any]]]) -> Dict[str, int]:
+        counts = {'written': 0, 'unchanged': 0, 'failed': 0}
+        for entry, post in results:
+            try:
+                path, written = file_writer.write_blog_post(post, jekyll_locale)
+            except Exception as e:
+                logger.error(
+                    f"❌ POST_WRITE_FAILED "
+                    f"locale={jekyll_locale} "
+                    f"error={str(e)}"
+                )
+                counts['failed'] += 1
+                continue
+            
+            counts['written' if written else 'unchanged'] += 1
+            if manifest is not None:
+                # A changed slug or date moves the post: drop the old file
+                remove_posts(manifest.record(
+                    output_key(locale, 'post', entry.id),
+                    locale,
+                    post_sources.pop(entry.id),
+                    blog_code,
+                    [path]
+                ))
+        return counts
+    
+    post_ids = None
+    if targets is not None:
+        post_ids = sorted(key[len(post_prefix):] for key in targets if key.startswith(post_prefix))
+    
+    if post_ids is None and CONTENTFUL_STREAM_POSTS:
+        # Fetch, transform and write interleave page by page in one stage
+        def stream_posts(inputs: Dict[str, Any]) -> Dict[str, int]:
+            stream_stats: Dict[str, Any] = {}
+            counts = write_posts(blog_transformer.transform_stream(
+                stream_stats,
+                skip=post_unchanged if manifest is not None else None
+            ))
+            counts['failed'] += stream_stats['failed']
+            counts['up_to_date'] = stream_stats['skipped']
+            if manifest is not None and stream_stats['complete']:
+                prune_posts(manifest.keys(post_prefix))
+            return counts
+        
+        graph.add('write:posts', stream_posts)
+    elif post_ids is None or post_ids:
+        def fetch_posts(inputs: Dict[str, Any]) -> List[Any]:
+            if post_ids is None:
+                return fetch_entries(blog_transformer)
+            return fetch_entries_by_ids(blog_transformer, post_ids)
+        
+        def transform_posts(inputs: Dict[str, Any]) -> Tuple[List[Tuple[Any, Dict[str, Any]]], int, int]:
+            entries = inputs['fetch:blog']
+            pending = entries
+            if manifest is not None:
+                pending = [entry for entry in entries if not post_unchanged(entry)]
+            transformed = blog_transformer.transform_each(pending)
+            results = [(entry, post) for entry, post in transformed if post is not None]
+            return results, len(entries) - len(pending), len(transformed) - len(results)
+        
+        def write_transformed_posts(inputs: Dict[str, Any]) -> Dict[str, int]:
+            results, up_to_date, failed = inputs['transform:blog']
+            counts = write_posts(results)
+            # Posts that failed to transform count towards the exit code
+            counts['failed'] += failed
+            counts['up_to_date'] = up_to_date
+            if manifest is not None:
+                if post_ids is None:
+                    prune_posts(manifest.keys(post_prefix))
+                else:
+                    # The lookup succeeded, so targeted posts it did not
+                    # return are confirmed unpublished or deleted
+                    prune_posts([post_prefix + post_id for post_id in post_ids], allow_empty=True)
+            return counts
+        
+        graph.add('fetch:blog', fetch_posts)
+        graph.add('transform:blog', transform_posts, ['fetch:blog'])
+        graph.add('write:posts', write_transformed_posts, ['transform:blog'])
+    
+    def add_data_output(
+        data_name: str,
+        fetch_stage: str,
+        transformer: BaseTransformer,
+        build: Callable[[Any], Dict[str, Any]]
+    ) -> None:
+        key = output_key(locale, 'data', data_name)
+        code = code_hash(type(transformer), DataWriter)
+        
+        def sources(inputs: Dict[str, Any]) -> Dict[str, str]:
+            return source_versions(inputs[fetch_stage][:1], transformer.include_depth)
+        
+        def transform(inputs: Dict[str, Any]) -> Any:
+            entry = first_entry(inputs[fetch_stage], transformer.content_type, locale)
+            if entry is None:
+                return None
+            if targets is None and manifest is not None and manifest.skip(key, sources(inputs), code):
+                return UP_TO_DATE
+            return build(entry)
+        
+        def write(inputs: Dict[str, Any]) -> Any:
+            data = inputs[f"transform:{data_name}"]
+            if data is None or data == UP_TO_DATE:
+                return data
+            path, written = data_writer.write_data_file(data, data_name, jekyll_locale)
+            if manifest is not None:
+                manifest.record(key, locale, sources(inputs), code, [path])
+            return {'written': int(written), 'unchanged': int(not written), 'failed': 0}
+        
+        graph.add(f"transform:{data_name}", transform, [fetch_stage])
+        graph.add(f"write:{data_name}", write, [f"transform:{data_name}", fetch_stage])
+    
+    # Singleton data files (→ _data/<name>-<locale>.yml); header and
+    # footer come from the homepage entry's references
+    for role, data_name, build in (
+        ('blog_listing', 'blog-page', transformers['blog_listing'].transform_single),
+        ('profile', 'profile', transformers['profile'].transform_single),
+        ('homepage', 'homepage', homepage_transformer.transform_single),
+        ('homepage', 'header', homepage_transformer.extract_header),
+        ('homepage', 'footer', homepage_transformer.extract_footer)
+    ):
+        if targets is not None and output_key(locale, 'data', data_name) not in targets:
+            continue
+        transformer = transformers[role]
+        if f"fetch:{role}" not in graph.stages:
+            graph.add(f"fetch:{role}", lambda inputs, t=transformer: fetch_entries(t))
+        add_data_output(data_name, f"fetch:{role}", transformer, build)
+    
+    return graph
+
+
 def process_locale(
     client: ContentfulClient,
     locale: str,
     file_writer: FileWriter,
-    data_writer: DataWriter
+    data_writer: DataWriter,
+    transformers: Optional[Dict[str, BaseTransformer]] = None,
+    manifest: Optional[BuildManifest] = None,
+    targets: Optional[Set[str]] = None
 ) -> Dict[str, int]:
     """
     Process all content for a single locale.
     
+    Runs the locale's build graph; an output whose fetch, transform or
+    write stage failed counts as one failed entry, and an output skipped
+    as up to date counts as successful. 'written' and 'unchanged' count
+    the files rewritten and the files rendered byte-identical (left
+    untouched).
+    
     Args:
         client: Contentful client instance
         locale: Contentful locale code (e.g., 'en-US')
         file_writer: File writer instance
         data_writer: Data writer instance
+        transformers: Transformers from create_transformers(); when
+            omitted, the locale's fetches are planned and run here
+        manifest: Optional build manifest (skips and records outputs)
+        targets: Output keys to rebuild (None = every output)
     
     Returns:
-        Statistics dictionary with success/failure counts
+        Statistics dictionary with success/failure and file counts
     """
     stats = {
         'total_entries': 0,
         'successful': 0,
-        'failed': 0
+        'failed': 0,
+        'written': 0,
+        'unchanged': 0
     }
     
-    # Map Contentful locale to Jekyll folder name
-    jekyll_locale = get_jekyll_locale(locale)
-    
-    # Initialize transformers for this locale
-    blog_transformer = BlogPostTransformer(client, locale)
-    blog_listing_transformer = BlogListingPageTransformer(client, locale)
-    profile_transformer = ProfileTransformer(client, locale)
-    header_transformer = HeaderTransformer(client, locale)
-    footer_transformer = FooterTransformer(client, locale)
-    homepage_transformer = HomepageTransformer(client, locale)
-    
-    # Transform blog posts
-    logger.info(f"📝 Transforming blog posts...")
-    blog_posts = blog_transformer.transform_all()
-    stats['total_entries'] += len(blog_posts)
-    
-    # Write blog posts (use Jekyll locale for folder name)
-    if blog_posts:
-        try:
-            file_writer.write_multiple_posts(blog_posts, jekyll_locale)
-            stats['successful'] += len(blog_posts)
-        except Exception as e:
-            logger.error(f"❌ BLOG_POSTS_WRITE_FAILED: {str(e)}")
-            stats['failed'] += len(blog_posts)
-    
-    # Transform and write blog listing page (→ _data/blog-page-{locale}.yml)
-    logger.info(f"📋 Transforming blog listing page...")
-    blog_listing_pages = blog_listing_transformer.transform_all()
-    stats['total_entries'] += len(blog_listing_pages)
-    
-    if blog_listing_pages:
-        try:
-            data_writer.write_data_file(blog_listing_pages[0], 'blog-page', jekyll_locale)
-            stats['successful'] += 1
-        except Exception as e:
-            logger.error(f"❌ BLOG_LISTING_PAGE_WRITE_FAILED: {str(e)}")
-            stats['failed'] += 1
-    
-    # Transform and write profile (use Jekyll locale for filename)
-    logger.info(f"👤 Transforming profile...")
-    profiles = profile_transformer.transform_all()
-    stats['total_entries'] += len(profiles)
-    
-    if profiles:
-        try:
-            data_writer.write_data_file(profiles[0], 'profile', jekyll_locale)
-            stats['successful'] += 1
-        except Exception as e:
-            logger.error(f"❌ PROFILE_WRITE_FAILED: {str(e)}")
-            stats['failed'] += 1
+    if transformers is None:
+        transformers = create_transformers(client, locale)
+        if targets is None:
+            plan_locale(planned_transformers(transformers), locale).execute(
+                client, locale, CONTENTFUL_FETCH_CONCURRENCY
+            )
     
-    # Transform and write homepage (use Jekyll locale for filename)
-    # Homepage contains nested Header and Footer references
-    logger.info(f"🏠 Transforming homepage (includes header & footer)...")
-    homepages = homepage_transformer.transform_all()
-    stats['total_entries'] += len(homepages)
+    graph = build_locale_graph(locale, file_writer, data_writer, transformers, manifest, targets)
+    report = graph.run(CONTENTFUL_STAGE_CONCURRENCY)
+    report.log()
     
-    if homepages:
-        try:
-            data_writer.write_data_file(homepages[0], 'homepage', jekyll_locale)
-            stats['successful'] += 1
-        except Exception as e:
-            logger.error(f"❌ HOMEPAGE_WRITE_FAILED: {str(e)}")
-            stats['failed'] += 1
+    for name in graph.stages:
+        if not name.startswith('write:'):
+            continue
         
-        # Extract and write header from homepage
-        try:
-            header_data = homepage_transformer.get_header_data()
-            data_writer.write_data_file(header_data, 'header', jekyll_locale)
-            logger.info(f"✅ HEADER_WRITTEN from homepage")
-            stats['successful'] += 1
+        if not report.succeeded(name):
             stats['total_entries'] += 1
-        except Exception as e:
-            logger.error(f"❌ HEADER_WRITE_FAILED: {str(e)}")
             stats['failed'] += 1
+            continue
         
-        # Extract and write footer from homepage
-        try:
-            footer_data = homepage_transformer.get_footer_data()
-            data_writer.write_data_file(footer_data, 'footer', jekyll_locale)
-            logger.info(f"✅ FOOTER_WRITTEN from homepage")
-            stats['successful'] += 1
+        result = report.results[name]
+        if result == UP_TO_DATE:
             stats['total_entries'] += 1
-        except Exception as e:
-            logger.error(f"❌ FOOTER_WRITE_FAILED: {str(e)}")
-            stats['failed'] += 1
+            stats['successful'] += 1
+        elif result is not None:
+            up_to_date = result.get('up_to_date', 0)
+            stats['total_entries'] += result['written'] + result['unchanged'] + result['failed'] + up_to_date
+            stats['successful'] += result['written'] + result['unchanged'] + up_to_date
+            stats['failed'] += result['failed']
+            stats['written'] += result['written']
+            stats['unchanged'] += result['unchanged']
     
     return stats
 
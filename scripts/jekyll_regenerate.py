@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Jekyll regeneration scoped to the files the last transform changed.
+
+Runs `jekyll build --incremental` against the `_site/` and `.jekyll-metadata`
+restored from the previous CI run. Jekyll decides what to regenerate from
+source mtimes, so this script:
+- pins every git-tracked source to the HEAD commit time (a fresh checkout
+  would otherwise look modified),
+- touches the pages that list posts when a post was added or modified,
+- falls back to a full regeneration (metadata dropped) when the code or
+  any data file changed or a post was removed, since Jekyll does not
+  track site.data or site.posts dependencies.
+
+Run with: python scripts/jekyll_regenerate.py [--dry-run] [-- <jekyll build args>]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from scripts.config import (
+    logger,
+    CONTENTFUL_CHANGE_SUMMARY,
+    JEKYLL_BUILD_STATE,
+    JEKYLL_LISTING_PAGES
+)
+from scripts.writers.change_set import load_summary
+
+
+FULL = 'full'
+INCREMENTAL = 'incremental'
+
+SITE_DIR = '_site'
+METADATA_FILE = '.jekyll-metadata'
+DATA_DIR = '_data'
+POSTS_DIR = '_posts'
+
+
+def plan_regeneration(
+    summary: Optional[Dict[str, Any]],
+    head: Optional[str],
+    state: Optional[Dict[str, Any]],
+    site_ready: bool
+) -> Tuple[str, str]:
+    """
+    Decide between incremental and full regeneration.
+
+    Args:
+        summary: Change summary of the last transform (None if unavailable)
+        head: Current git commit (None outside a git checkout)
+        state: State saved by the previous successful site build
+        site_ready: Whether `_site/` and `.jekyll-metadata` were restored
+
+    Returns:
+        (FULL or INCREMENTAL, reason)
+    """
+    if not site_ready:
+        return FULL, 'no_previous_site'
+    if head is None or state is None or state.get('head') != head:
+        # Layouts, includes, config or plugins may have changed
+        return FULL, 'code_changed'
+    if summary is None:
+        return FULL, 'no_change_summary'
+    if summary['removed']:
+        return FULL, 'files_removed'
+    if any(is_under(path, DATA_DIR) for path in summary['added'] + summary['modified']):
+        # Header/footer data is rendered into every page
+        return FULL, 'data_changed'
+    return INCREMENTAL, 'posts_modified' if summary['changed'] else 'no_changes'
+
+
+def is_under(path: str, directory: str) -> bool:
+    """Check whether a relative path is inside a top-level directory."""
+    return os.path.normpath(path).split(os.sep, 1)[0] == directory
+
+
+def pin_mtimes(paths: List[str], mtime: float) -> int:
+    """
+    Set the modification time of existing files.
+
+    Args:
+        paths: File paths
+        mtime: Timestamp to set
+
+    Returns:
+        Number of files updated
+    """
+    pinned = 0
+    for path in paths:
+        try:
+            os.utime(path, (mtime, mtime))
+            pinned += 1
+        except OSError:
+            # Deleted in the working tree
+            pass
+    return pinned
+
+
+def git_checkout() -> Optional[Tuple[str, float, List[str]]]:
+    """
+    Read the current commit, its time and the tracked files.
+
+    Returns:
+        (commit, commit time, tracked paths), or None outside a git checkout
+    """
+    try:
+        head = git('rev-parse', 'HEAD').strip()
+        commit_time = float(git('log', '-1', '--format=%ct').strip())
+        tracked = [path for path in git('ls-files', '-z').split('\0') if path]
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
+        logger.warning(
+            f"⚠️ GIT_UNAVAILABLE "
+            f"error={str(e)} "
+            f"action=full_regeneration"
+        )
+        return None
+    return head, commit_time, tracked
+
+
+def git(*args: str) -> str:
+    """Run a git command and return its output."""
+    return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout
+
+
+def load_state(path: str) -> Optional[Dict[str, Any]]:
+    """Read the state saved by the previous site build (None if missing)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(path: str, state: Dict[str, Any]) -> None:
+    """
+    Atomically write the site build state.
+
+    Raises:
+        IOError: If the state cannot be written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        raise IOError(f"Failed to write Jekyll build state: {str(e)}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Regenerate the site, incrementally when the changes allow it.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Jekyll's exit code
+    """
+    parser = argparse.ArgumentParser(description='Run Jekyll regeneration scoped to the changed content files.')
+    parser.add_argument('--dry-run', action='store_true', help='Plan and print the Jekyll command without running it')
+    parser.add_argument('jekyll_args', nargs='*', help='Extra `jekyll build` arguments (after --)')
+    args = parser.parse_args(argv)
+
+    summary = load_summary(CONTENTFUL_CHANGE_SUMMARY) if CONTENTFUL_CHANGE_SUMMARY else None
+    checkout = git_checkout()
+    head = checkout[0] if checkout else None
+    site_ready = os.path.isdir(SITE_DIR) and os.path.exists(METADATA_FILE)
+
+    mode, reason = plan_regeneration(summary, head, load_state(JEKYLL_BUILD_STATE), site_ready)
+
+    changed = set(summary['added'] + summary['modified']) if summary else set()
+    touched = []
+
+    if checkout is not None and not args.dry_run:
+        # Unchanged sources keep the mtime recorded in .jekyll-metadata
+        _, commit_time, tracked = checkout
+        pin_mtimes([path for path in tracked if os.path.normpath(path) not in changed], commit_time)
+
+    if mode == FULL:
+        if os.path.exists(METADATA_FILE) and not args.dry_run:
+            os.remove(METADATA_FILE)
+    elif any(is_under(path, POSTS_DIR) for path in changed):
+        touched = JEKYLL_LISTING_PAGES
+        if not args.dry_run:
+            for page in touched:
+                if os.path.exists(page):
+                    os.utime(page)
+
+    logger.info(
+        f"🔁 JEKYLL_REGENERATE "
+        f"mode={mode} "
+        f"reason={reason} "
+        f"changed={len(changed)} "
+        f"touched={len(touched)}"
+    )
+
+    command = ['bundle', 'exec', 'jekyll', 'build', '--incremental', *args.jekyll_args]
+
+    if args.dry_run:
+        print(' '.join(command))
+        return 0
+
+    exit_code = subprocess.run(command).returncode
+
+    if exit_code == 0 and head is not None:
+        try:
+            save_state(JEKYLL_BUILD_STATE, {'head': head})
+        except IOError as e:
+            # Graceful degradation: the next run regenerates everything
+            logger.warning(
+                f"⚠️ JEKYLL_STATE_NOT_SAVED "
+                f"error={str(e)} "
+                f"action=full_regeneration_next_run"
+            )
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Payload size report for schema-derived field projection.
+
+For every transformer, prints the select list and include depth derived
+from contentful-schemas/, then fetches the first collection page twice
+(hard-coded include with all fields vs. projected) and compares sizes.
+
+Run with: python -m scripts.payload_report [--locale en-US] [--offline]
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Any, List, Optional
+
+from scripts.config import (
+    CONTENTFUL_SPACE_ID,
+    CONTENTFUL_MODE,
+    SUPPORTED_LOCALES,
+    get_active_token
+)
+from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_to_jekyll import create_transformers
+
+
+def payload_size(body: Dict[str, Any]) -> int:
+    """Get the serialized size of a response body in bytes."""
+    return len(json.dumps(body, ensure_ascii=False).encode('utf-8'))
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display."""
+    return f"{size / 1024:.1f} KiB" if size >= 1024 else f"{size} B"
+
+
+def build_rows(
+    client: Optional[ContentfulClient],
+    locale: str
+) -> List[Dict[str, Any]]:
+    """
+    Measure every transformer's first collection page before/after projection.
+
+    Args:
+        client: Contentful client, or None to only compute projections
+        locale: Locale code to fetch
+
+    Returns:
+        One row per transformer
+    """
+    rows = []
+
+    for name, transformer in create_transformers(client, locale).items():
+        projection = transformer.get_projection()
+        row = {
+            'transformer': name,
+            'content_type': transformer.content_type,
+            'include_before': transformer.default_include_depth,
+            'include_after': transformer.include_depth,
+            'select': projection.fields if projection else None,
+            'bytes_before': None,
+            'bytes_after': None
+        }
+
+        if client is not None:
+            before = client.get_raw_page(
+                transformer.content_type, locale, row['include_before'], projected=False
+            )
+            after = client.get_raw_page(transformer.content_type, locale, row['include_after'])
+            row['bytes_before'] = payload_size(before)
+            row['bytes_after'] = payload_size(after)
+
+        rows.append(row)
+
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    """Print the report table and totals."""
+    print(f"{'transformer':<14}{'content type':<18}{'include':<10}{'before':>12}{'after':>12}{'saved':>8}")
+
+    total_before = 0
+    total_after = 0
+
+    for row in rows:
+        include = f"{row['include_before']} → {row['include_after']}"
+        if row['bytes_before'] is None:
+            before = after = saved = '-'
+        else:
+            total_before += row['bytes_before']
+            total_after += row['bytes_after']
+            before = format_bytes(row['bytes_before'])
+            after = format_bytes(row['bytes_after'])
+            saved = (
+                f"{1 - row['bytes_after'] / row['bytes_before']:.0%}"
+                if row['bytes_before'] else '-'
+            )
+        print(f"{row['transformer']:<14}{row['content_type']:<18}{include:<10}{before:>12}{after:>12}{saved:>8}")
+        print(f"{'':<14}select={','.join(row['select']) if row['select'] else '(all fields)'}")
+
+    if total_before:
+        print(
+            f"\nTotal: {format_bytes(total_before)} → {format_bytes(total_after)} "
+            f"({1 - total_after / total_before:.0%} smaller)"
+        )
+
+
+def main() -> int:
+    """
+    Entry point for the payload report.
+
+    Returns:
+        Exit code (0 = success, 1 = failure)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--locale', default=SUPPORTED_LOCALES[0], help='Locale to fetch')
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Only show derived select lists and include depths'
+    )
+    args = parser.parse_args()
+
+    try:
+        client = None
+        if not args.offline:
+            client = ContentfulClient(
+                space_id=CONTENTFUL_SPACE_ID,
+                access_token=get_active_token(),
+                mode=CONTENTFUL_MODE
+            )
+        print_report(build_rows(client, args.locale))
+    except Exception as e:
+        print(f"❌ PAYLOAD_REPORT_FAILED: {str(e)}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Contentful Delivery API.
+
+Serves the subset of the API the pipeline uses (/entries, /assets,
+/content_types and /sync) from a JSON snapshot, with optional latency,
+server errors and rate limiting (429) injected, so the client's
+concurrency and retry behaviour can be exercised without touching the
+real space's rate limit.
+
+The snapshot uses the Sync API shape written by SyncStore
+(sync-state.json): {"entries": {id: item}, "assets": {id: item}} with
+all-locale fields; an optional "content_types" list is served as is.
+
+Run with: python -m scripts.stand_in_server --snapshot .contentful-sync/sync-state.json
+Then build with CONTENTFUL_API_URL=http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from scripts.config import logger, DEFAULT_LOCALE
+from scripts.contentful_client.localization import localize_item
+from scripts.contentful_client.rate_limiter import (
+    HEADER_RESET,
+    HEADER_SECOND_LIMIT,
+    HEADER_SECOND_REMAINING
+)
+
+
+# Delivery API defaults and caps
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+DEFAULT_INCLUDE = 1
+MAX_INCLUDE = 10
+
+# Items per Sync API page
+SYNC_PAGE_SIZE = 100
+
+# Sync token handed out once the snapshot has been fully delivered
+SYNC_DONE_TOKEN = 'snapshot'
+
+
+class SpaceData:
+    """
+    Snapshot of a space served by the stand-in.
+
+    Attributes:
+        entries: Raw all-locale entries keyed by ID
+        assets: Raw all-locale assets keyed by ID
+        content_types: Raw content type definitions
+    """
+
+    def __init__(
+        self,
+        entries: Dict[str, Dict[str, Any]],
+        assets: Dict[str, Dict[str, Any]],
+        content_types: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        self.entries = entries
+        self.assets = assets
+        self.content_types = content_types or []
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SpaceData':
+        """
+        Build space data from a snapshot dictionary.
+
+        Entries and assets may be given keyed by ID or as lists.
+
+        Args:
+            data: Snapshot dictionary
+
+        Returns:
+            SpaceData
+        """
+        def by_id(items: Any) -> Dict[str, Dict[str, Any]]:
+            if isinstance(items, dict):
+                return items
+            return {item['sys']['id']: item for item in items or []}
+
+        return cls(
+            by_id(data.get('entries')),
+            by_id(data.get('assets')),
+            data.get('content_types')
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'SpaceData':
+        """
+        Load a snapshot file.
+
+        Args:
+            path: JSON snapshot path
+
+        Returns:
+            SpaceData
+
+        Raises:
+            OSError, ValueError: If the file is missing or invalid
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def _content_type_of(item: Dict[str, Any]) -> Optional[str]:
+    """Get the content type ID of a raw entry."""
+    return item['sys'].get('contentType', {}).get('sys', {}).get('id')
+
+
+def _collect_links(value: Any, links: Set[Tuple[str, str]]) -> None:
+    """Collect (link_type, id) of every Entry/Asset link nested in a value."""
+    if isinstance(value, dict):
+        sys_data = value.get('sys')
+        if (
+            isinstance(sys_data, dict)
+            and sys_data.get('type') == 'Link'
+            and sys_data.get('linkType') in ('Entry', 'Asset')
+        ):
+            links.add((sys_data['linkType'], sys_data['id']))
+            return
+        for nested in value.values():
+            _collect_links(nested, links)
+    elif isinstance(value, list):
+        for nested in value:
+            _collect_links(nested, links)
+
+
+def _localize(item: Dict[str, Any], locale: str) -> Dict[str, Any]:
+    """Shape an item for a locale ('*' keeps every locale)."""
+    if locale == '*':
+        return item
+    return localize_item(item, locale)
+
+
+def _select(item: Dict[str, Any], select: Optional[str]) -> Dict[str, Any]:
+    """Apply a `select` parameter (sys is always kept)."""
+    if not select:
+        return item
+
+    selected = [s.strip() for s in select.split(',')]
+    if 'fields' in selected:
+        return item
+
+    field_ids = [s[len('fields.'):] for s in selected if s.startswith('fields.')]
+    projected = {'sys': item['sys']}
+    if field_ids:
+        projected['fields'] = {
+            k: v for k, v in item.get('fields', {}).items() if k in field_ids
+        }
+    return projected
+
+
+def _matches_filters(item: Dict[str, Any], params: Dict[str, str]) -> bool:
+    """Check `fields.<id>` equality filters against a localized item."""
+    for key, expected in params.items():
+        if not key.startswith('fields.') or '[' in key:
+            continue
+        if str(item.get('fields', {}).get(key[len('fields.'):])) != expected:
+            return False
+    return True
+
+
+def _page(
+    items: List[Dict[str, Any]],
+    params: Dict[str, str]
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Slice sorted items by skip/limit, returning (page, skip, limit)."""
+    skip = max(0, int(params.get('skip', 0)))
+    limit = max(0, min(int(params.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+    return items[skip:skip + limit], skip, limit
+
+
+def _filter_ids(
+    items: List[Dict[str, Any]],
+    params: Dict[str, str]
+) -> List[Dict[str, Any]]:
+    """Apply a `sys.id[in]` filter."""
+    if 'sys.id[in]' not in params:
+        return items
+    wanted = set(params['sys.id[in]'].split(','))
+    return [item for item in items if item['sys']['id'] in wanted]
+
+
+def query_entries(data: SpaceData, params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Answer an /entries collection query.
+
+    Supports content_type, locale (with fallbacks, or '*'), include,
+    skip, limit, select, sys.id[in] and fields.<id> equality filters.
+    Items are ordered by sys.id.
+
+    Args:
+        data: Space snapshot
+        params: Query parameters (single values)
+
+    Returns:
+        Delivery API collection body with includes (and errors for
+        links that cannot be resolved)
+    """
+    locale = params.get('locale', DEFAULT_LOCALE)
+    content_type = params.get('content_type')
+
+    candidates = [
+        item for item in data.entries.values()
+        if content_type is None or _content_type_of(item) == content_type
+    ]
+    candidates = _filter_ids(candidates, params)
+    localized = [_localize(item, locale) for item in candidates]
+    localized = [item for item in localized if _matches_filters(item, params)]
+    localized.sort(key=lambda item: item['sys']['id'])
+
+    page, skip, limit = _page(localized, params)
+    include = max(0, min(int(params.get('include', DEFAULT_INCLUDE)), MAX_INCLUDE))
+
+    # Breadth-first over links, one level per include
+    seen: Set[Tuple[str, str]] = {('Entry', item['sys']['id']) for item in page}
+    includes: Dict[str, List[Dict[str, Any]]] = {'Entry': [], 'Asset': []}
+    unresolved: Set[Tuple[str, str]] = set()
+    frontier = page
+
+    for _ in range(include):
+        links: Set[Tuple[str, str]] = set()
+        for item in frontier:
+            _collect_links(item.get('fields', {}), links)
+
+        frontier = []
+        for link_type, item_id in sorted(links - seen):
+            seen.add((link_type, item_id))
+            source = data.entries if link_type == 'Entry' else data.assets
+            raw = source.get(item_id)
+            if raw is None:
+                unresolved.add((link_type, item_id))
+                continue
+            linked = _localize(raw, locale)
+            includes[link_type].append(linked)
+            if link_type == 'Entry':
+                frontier.append(linked)
+
+    select = params.get('select')
+    body: Dict[str, Any] = {
+        'sys': {'type': 'Array'},
+        'total': len(localized),
+        'skip': skip,
+        'limit': limit,
+        'items': [_select(item, select) for item in page]
+    }
+
+    if includes['Entry'] or includes['Asset']:
+        body['includes'] = {k: v for k, v in includes.items() if v}
+
+    if unresolved:
+        body['errors'] = [
+            {
+                'sys': {'id': 'notResolvable', 'type': 'error'},
+                'details': {'type': 'Link', 'linkType': link_type, 'id': item_id}
+            }
+            for link_type, item_id in sorted(unresolved)
+        ]
+
+    return body
+
+
+def query_assets(data: SpaceData, params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Answer an /assets collection query (locale, skip, limit, sys.id[in]).
+
+    Args:
+        data: Space snapshot
+        params: Query parameters
+
+    Returns:
+        Delivery API collection body
+    """
+    locale = params.get('locale', DEFAULT_LOCALE)
+    assets = sorted(_filter_ids(list(data.assets.values()), params), key=lambda a: a['sys']['id'])
+    page, skip, limit = _page(assets, params)
+
+    return {
+        'sys': {'type': 'Array'},
+        'total': len(assets),
+        'skip': skip,
+        'limit': limit,
+        'items': [_localize(asset, locale) for asset in page]
+    }
+
+
+def query_sync(data: SpaceData, params: Dict[str, str], base_url: str) -> Dict[str, Any]:
+    """
+    Answer a Sync API request.
+
+    An initial sync pages through every entry and asset; any later token
+    reports no changes (the snapshot is static).
+
+    Args:
+        data: Space snapshot
+        params: Query parameters (initial or sync_token)
+        base_url: URL prefix for nextPageUrl/nextSyncUrl
+
+    Returns:
+        Sync page body
+    """
+    token = params.get('sync_token', '')
+
+    if params.get('initial') == 'true' or token.startswith('page-'):
+        page_number = int(token[len('page-'):]) if token.startswith('page-') else 0
+        items = list(data.entries.values()) + list(data.assets.values())
+        start = page_number * SYNC_PAGE_SIZE
+        body: Dict[str, Any] = {
+            'sys': {'type': 'Array'},
+            'items': items[start:start + SYNC_PAGE_SIZE]
+        }
+        if start + SYNC_PAGE_SIZE < len(items):
+            body['nextPageUrl'] = f"{base_url}/sync?sync_token=page-{page_number + 1}"
+        else:
+            body['nextSyncUrl'] = f"{base_url}/sync?sync_token={SYNC_DONE_TOKEN}"
+        return body
+
+    return {
+        'sys': {'type': 'Array'},
+        'items': [],
+        'nextSyncUrl': f"{base_url}/sync?sync_token={SYNC_DONE_TOKEN}"
+    }
+
+
+class FaultInjector:
+    """
+    Decides per request whether to inject latency, a 5xx or a 429.
+
+    Attributes:
+        latency: Seconds added to every response
+        error_rate: Fraction of requests answered with 500
+        throttle_rate: Fraction of requests answered with 429
+        rate_limit: Requests per second before 429s (0 = unlimited)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: int = 0,
+        seed: Optional[int] = None
+    ) -> None:
+        self.latency = max(0.0, latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = max(0, rate_limit)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = 0
+        self._window_count = 0
+
+    def decide(self) -> Tuple[Optional[int], Dict[str, str]]:
+        """
+        Decide the outcome of one request.
+
+        Returns:
+            Tuple of (status to inject or None, rate limit headers)
+        """
+        headers: Dict[str, str] = {}
+
+        with self._lock:
+            roll = self._random.random()
+
+            if self.rate_limit:
+                now = time.time()
+                window = int(now)
+                if window != self._window:
+                    self._window = window
+                    self._window_count = 0
+                self._window_count += 1
+                remaining = self.rate_limit - self._window_count
+                headers[HEADER_SECOND_LIMIT] = str(self.rate_limit)
+                headers[HEADER_SECOND_REMAINING] = str(max(0, remaining))
+                if remaining < 0:
+                    headers[HEADER_RESET] = f"{window + 1 - now:.3f}"
+                    return 429, headers
+
+        if roll < self.throttle_rate:
+            headers[HEADER_RESET] = '1'
+            return 429, headers
+        if roll < self.throttle_rate + self.error_rate:
+            return 500, headers
+
+        return None, headers
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering Delivery API requests from a snapshot.
+
+    Attributes:
+        data: Space snapshot
+        faults: Fault injector
+        stats: Request counters (requests, errors, throttled)
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        data: SpaceData,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        faults: Optional[FaultInjector] = None
+    ) -> None:
+        """
+        Bind the server (port 0 picks a free port).
+
+        Args:
+            data: Space snapshot
+            host: Interface to bind
+            port: Port to bind
+            faults: Fault injector (default: none)
+        """
+        super().__init__((host, port), StandInHandler)
+        self.data = data
+        self.faults = faults or FaultInjector()
+        self.stats = {'requests': 0, 'errors': 0, 'throttled': 0}
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str) -> None:
+        """Increment a request counter (thread-safe)."""
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def start(self) -> None:
+        """Serve requests on a background daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='stand-in-server', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes /spaces/<space>[/environments/<env>]/<resource> requests."""
+
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        segments = [s for s in parsed.path.split('/') if s]
+
+        self.server.count('requests')
+
+        if len(segments) < 3 or segments[0] != 'spaces':
+            self._send(404, {'sys': {'type': 'Error', 'id': 'NotFound'}})
+            return
+
+        prefix = segments[:4] if segments[2] == 'environments' else segments[:2]
+        resource = segments[len(prefix)] if len(segments) > len(prefix) else ''
+        base_url = f"{self.server.url}/{'/'.join(prefix)}"
+
+        faults = self.server.faults
+        if faults.latency:
+            time.sleep(faults.latency)
+
+        status, headers = faults.decide()
+        if status == 429:
+            self.server.count('throttled')
+            self._send(429, {'sys': {'type': 'Error', 'id': 'RateLimitExceeded'}}, headers)
+            return
+        if status is not None:
+            self.server.count('errors')
+            self._send(status, {'sys': {'type': 'Error', 'id': 'ServerError'}}, headers)
+            return
+
+        data = self.server.data
+        try:
+            if resource == 'entries':
+                body = query_entries(data, params)
+            elif resource == 'assets':
+                body = query_assets(data, params)
+            elif resource == 'content_types':
+                body = {
+                    'sys': {'type': 'Array'},
+                    'total': len(data.content_types),
+                    'items': data.content_types
+                }
+            elif resource == 'sync':
+                body = query_sync(data, params, base_url)
+            else:
+                self._send(404, {'sys': {'type': 'Error', 'id': 'NotFound'}}, headers)
+                return
+        except ValueError as e:
+            self._send(400, {'sys': {'type': 'Error', 'id': 'BadRequest'}, 'message': str(e)}, headers)
+            return
+
+        self._send(200, body, headers)
+
+    def _send(
+        self,
+        status: int,
+        body: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Write a JSON response."""
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/vnd.contentful.delivery.v1+json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"🛰️ STAND_IN_REQUEST {format % args}")
+
+
+def main() -> int:
+    """
+    Entry point for the stand-in server.
+
+    Returns:
+        Exit code (0 = success, 1 = failure)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--snapshot', required=True, help='JSON snapshot (sync-state.json shape)')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requests per second before 429 (0 = unlimited)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for injected faults')
+    args = parser.parse_args()
+
+    try:
+        data = SpaceData.load(args.snapshot)
+        server = StandInServer(
+            data,
+            host=args.host,
+            port=args.port,
+            faults=FaultInjector(
+                latency=args.latency,
+                error_rate=args.error_rate,
+                throttle_rate=args.throttle_rate,
+                rate_limit=args.rate_limit,
+                seed=args.seed
+            )
+        )
+    except Exception as e:
+        logger.error(f"❌ STAND_IN_FAILED: {str(e)}")
+        return 1
+
+    logger.info(
+        f"🛰️ STAND_IN_LISTENING "
+        f"url={server.url} "
+        f"entries={len(data.entries)} "
+        f"assets={len(data.assets)} "
+        f"latency={args.latency}s "
+        f"error_rate={args.error_rate} "
+        f"throttle_rate={args.throttle_rate} "
+        f"rate_limit={args.rate_limit}"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(
+            f"🛑 STAND_IN_STOPPED "
+            f"requests={server.stats['requests']} "
+            f"errors={server.stats['errors']} "
+            f"throttled={server.stats['throttled']}"
+        )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Synthetic Contentful space generator for scale testing.
+
+Builds spaces of configurable size whose entries follow the models in
+contentful-schemas/: blog posts with deep rich text, SEO entries and
+shared hero banners, a homepage with header, footer and a graph of
+content blocks, shared menu items, a profile and the blog listing page,
+all across several locales.
+
+The output is a snapshot in the SyncStore state shape (sync-state.json),
+so it can be used directly by:
+- ContentfulClient in sync mode (CONTENTFUL_SYNC_DIR pointing at it)
+- scripts/stand_in_server.py (--snapshot), which a recording cassette
+  can then capture (CONTENTFUL_CASSETTE_MODE=record)
+
+Run with: python -m scripts.synthetic_space --posts 10000 --output .synthetic/sync-state.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from typing import Dict, Any, List, Optional
+
+from scripts.config import (
+    logger,
+    CONTENTFUL_SPACE_ID,
+    CONTENTFUL_MODE,
+    DEFAULT_LOCALE,
+    SUPPORTED_LOCALES
+)
+from scripts.contentful_client.schema_projection import (
+    SCHEMA_ID_ALIASES,
+    SchemaRegistry,
+    get_schema_registry
+)
+from scripts.contentful_client.sync_store import SYNC_STATE_VERSION
+from scripts.stand_in_server import SYNC_DONE_TOKEN
+
+
+# Schema IDs whose live content type ID differs (inverse of SCHEMA_ID_ALIASES)
+LIVE_CONTENT_TYPE_IDS: Dict[str, str] = {
+    schema_id: live_id for live_id, schema_id in SCHEMA_ID_ALIASES.items()
+}
+
+# Homepage block types, cycled through in this order
+BLOCK_TYPES = [
+    'heroBanner',
+    'componentSkillsList',
+    'componentProjectsGrid',
+    'componentRichText',
+    'textWithImage',
+    'componentCarousel',
+    'componentQuote'
+]
+
+WORDS = (
+    'content delivery static site build locale entry asset schema render '
+    'cache query include link field page post design system engineering '
+    'performance deploy preview markdown template component graph rich '
+    'text data author update release network request response budget'
+).split()
+
+
+class SpaceGenerator:
+    """
+    Generates a synthetic space from the schema definitions.
+
+    Fields are filled from each content type's schema: localized fields
+    get one value per locale, non-localized fields a default-locale value,
+    and optional fields are always set so payloads are full-sized. Link
+    fields are wired explicitly to build the shared graph (menu items,
+    hero banners and social links are reused across entries). Generation
+    is deterministic for a given seed.
+
+    Attributes:
+        posts: Number of blogPage entries
+        locales: Locales to fill (the first is the default)
+        asset_count: Size of the shared asset pool
+        menu_items: Size of the shared menu item pool
+        blocks: Number of homepage blocks
+        paragraphs: Rich text sections per blog post
+        list_depth: Nesting depth of rich text lists
+    """
+
+    def __init__(
+        self,
+        posts: int = 100,
+        locales: Optional[List[str]] = None,
+        assets: int = 50,
+        menu_items: int = 8,
+        blocks: int = len(BLOCK_TYPES),
+        paragraphs: int = 6,
+        list_depth: int = 3,
+        seed: int = 0,
+        registry: Optional[SchemaRegistry] = None
+    ) -> None:
+        """
+        Initialize generator.
+
+        Args:
+            posts: Number of blog posts
+            locales: Locales to fill (default: SUPPORTED_LOCALES)
+            assets: Shared asset pool size
+            menu_items: Shared menu item pool size
+            blocks: Homepage block count
+            paragraphs: Rich text sections per post
+            list_depth: Nested list depth inside rich text
+            seed: Random seed
+            registry: Schema registry (default: the repository schemas)
+        """
+        self.posts = max(0, posts)
+        self.locales = list(locales or SUPPORTED_LOCALES)
+        self.asset_count = max(1, assets)
+        self.menu_items = max(1, menu_items)
+        self.blocks = max(0, blocks)
+        self.paragraphs = max(1, paragraphs)
+        self.list_depth = max(1, list_depth)
+        self.registry = registry or get_schema_registry()
+        self._random = random.Random(seed)
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._assets: Dict[str, Dict[str, Any]] = {}
+        self._counters: Dict[str, int] = {}
+
+    @property
+    def default_locale(self) -> str:
+        return self.locales[0]
+
+    def _next_id(self, prefix: str) -> str:
+        """Get the next sequential ID for a prefix."""
+        self._counters[prefix] = self._counters.get(prefix, 0) + 1
+        return f"{prefix}-{self._counters[prefix]}"
+
+    def _words(self, count: int) -> str:
+        """Random words."""
+        return ' '.join(self._random.choice(WORDS) for _ in range(count))
+
+    def _sentence(self, locale: str, words: int = 12) -> str:
+        """Random sentence, tagged with the locale outside the default."""
+        text = self._words(words).capitalize() + '.'
+        return text if locale == self.default_locale else f"[{locale}] {text}"
+
+    @staticmethod
+    def _link(item_id: str, link_type: str = 'Entry') -> Dict[str, Any]:
+        """Build a raw link."""
+        return {'sys': {'type': 'Link', 'linkType': link_type, 'id': item_id}}
+
+    def _random_asset(self) -> Dict[str, Any]:
+        """Link to a random asset from the pool."""
+        return self._link(f"asset-{self._random.randint(1, self.asset_count)}", 'Asset')
+
+    def _sys(self, item_id: str, item_type: str, content_type: Optional[str] = None) -> Dict[str, Any]:
+        """Build a sys block like the Sync API's."""
+        sys_data: Dict[str, Any] = {
+            'id': item_id,
+            'type': item_type,
+            'revision': 1,
+            'createdAt': '2024-01-01T00:00:00.000Z',
+            'updatedAt': '2024-01-01T00:00:00.000Z'
+        }
+        if content_type:
+            sys_data['contentType'] = {
+                'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}
+            }
+        return sys_data
+
+    def _rich_text(self, locale: str, sections: int) -> Dict[str, Any]:
+        """
+        Build a rich text document with headings, marked-up paragraphs,
+        hyperlinks, nested lists, quotes and embedded assets.
+        """
+        def text(value: str, marks: Optional[List[str]] = None) -> Dict[str, Any]:
+            return {
+                'nodeType': 'text',
+                'value': value,
+                'marks': [{'type': mark} for mark in marks or []],
+                'data': {}
+            }
+
+        def paragraph() -> Dict[str, Any]:
+            return {
+                'nodeType': 'paragraph',
+                'data': {},
+                'content': [
+                    text(self._sentence(locale, 20) + ' '),
+                    text(self._words(3), ['bold']),
+                    text(' '),
+                    {
+                        'nodeType': 'hyperlink',
+                        'data': {'uri': f"https://example.com/{self._random.choice(WORDS)}"},
+                        'content': [text(self._words(2))]
+                    },
+                    text(' ' + self._sentence(locale, 15))
+                ]
+            }
+
+        def nested_list(depth: int) -> Dict[str, Any]:
+            items = []
+            for _ in range(2):
+                item_content: List[Dict[str, Any]] = [{
+                    'nodeType': 'paragraph',
+                    'data': {},
+                    'content': [text(self._sentence(locale, 8), ['italic'])]
+                }]
+                if depth > 1:
+                    item_content.append(nested_list(depth - 1))
+                items.append({'nodeType': 'list-item', 'data': {}, 'content': item_content})
+            return {'nodeType': 'unordered-list', 'data': {}, 'content': items}
+
+        content: List[Dict[str, Any]] = []
+        for section in range(sections):
+            content.append({
+                'nodeType': 'heading-2',
+                'data': {},
+                'content': [text(self._sentence(locale, 5))]
+            })
+            content.extend(paragraph() for _ in range(2))
+            if section % 3 == 0:
+                content.append(nested_list(self.list_depth))
+            if section % 4 == 1:
+                content.append({'nodeType': 'blockquote', 'data': {}, 'content': [paragraph()]})
+            if section % 4 == 2:
+                content.append({
+                    'nodeType': 'embedded-asset-block',
+                    'data': {'target': self._random_asset()},
+                    'content': []
+                })
+            content.append({'nodeType': 'hr', 'data': {}, 'content': []})
+
+        return {'nodeType': 'document', 'data': {}, 'content': content}
+
+    def _scalar(self, field: Dict[str, Any], locale: str, serial: int) -> Any:
+        """Generate a value for a non-link field."""
+        field_id = field['id']
+        field_type = field['type']
+
+        if field_type == 'Symbol':
+            if field_id == 'url':
+                return f"{self._random.choice(WORDS)}-{serial}"
+            if field_id.lower().endswith('url'):
+                return f"https://example.com/{self._random.choice(WORDS)}"
+            if field_id == 'email':
+                return f"person{serial}@example.com"
+            if field_id == 'name':
+                return f"{self._words(2).title()} {serial}"
+            return self._sentence(locale, 4).rstrip('.')
+        if field_type == 'Text':
+            return ' '.join(self._sentence(locale) for _ in range(3))
+        if field_type == 'Date':
+            return f"20{20 + serial % 5}-{1 + serial % 12:02d}-{1 + serial % 28:02d}"
+        if field_type == 'Boolean':
+            return self._random.random() < 0.3
+        if field_type in ('Integer', 'Number'):
+            return self._random.randint(1, 100)
+        if field_type == 'RichText':
+            return self._rich_text(locale, 2)
+        if field_type == 'Array' and field.get('items', {}).get('type') == 'Symbol':
+            return [self._words(1) for _ in range(5)]
+        return None
+
+    def _entry(self, content_type: str, links: Optional[Dict[str, Any]] = None, prefix: Optional[str] = None) -> str:
+        """
+        Create an entry whose fields follow the content type's schema.
+
+        Args:
+            content_type: Live content type ID
+            links: Values for link (or any other) fields, by field ID;
+                given values are not localized
+            prefix: ID prefix (default: the content type ID)
+
+        Returns:
+            The new entry's ID
+        """
+        links = links or {}
+        entry_id = self._next_id(prefix or content_type)
+        serial = self._counters[prefix or content_type]
+        schema = self.registry.content_types.get(self.registry.resolve_id(content_type), {})
+
+        fields: Dict[str, Any] = {}
+        for field_id, field in schema.items():
+            if field_id in links:
+                if links[field_id] is not None:
+                    fields[field_id] = {self.default_locale: links[field_id]}
+                continue
+
+            if self.registry.link_targets(field) is not None:
+                # Unwired asset links point into the pool; entry links stay empty
+                if self.registry.link_targets(field) == ['Asset']:
+                    fields[field_id] = {self.default_locale: self._random_asset()}
+                continue
+
+            locales = self.locales if field.get('localized') else [self.default_locale]
+            values = {locale: self._scalar(field, locale, serial) for locale in locales}
+            if any(value is not None for value in values.values()):
+                fields[field_id] = values
+
+        self._entries[entry_id] = {'sys': self._sys(entry_id, 'Entry', content_type), 'fields': fields}
+        return entry_id
+
+    def _build_assets(self) -> None:
+        """Create the shared asset pool."""
+        for i in range(1, self.asset_count + 1):
+            asset_id = f"asset-{i}"
+            self._assets[asset_id] = {
+                'sys': self._sys(asset_id, 'Asset'),
+                'fields': {
+                    'title': {locale: self._sentence(locale, 3) for locale in self.locales},
+                    'description': {locale: self._sentence(locale) for locale in self.locales},
+                    'file': {
+                        self.default_locale: {
+                            'url': f"//images.ctfassets.net/synthetic/{asset_id}/image-{i}.jpg",
+                            'fileName': f"image-{i}.jpg",
+                            'contentType': 'image/jpeg',
+                            'details': {
+                                'size': self._random.randint(20_000, 900_000),
+                                'image': {'width': 1600, 'height': 900}
+                            }
+                        }
+                    }
+                }
+            }
+
+    def _seo(self) -> Dict[str, Any]:
+        """Create an SEO entry and link to it."""
+        return self._link(self._entry('seo'))
+
+    def _block(self, block_type: str) -> Dict[str, Any]:
+        """Create a homepage block (and its nested entries) and link to it."""
+        if block_type == 'componentProjectsGrid':
+            projects = [self._link(self._entry('componentProjectCard')) for _ in range(6)]
+            return self._link(self._entry(block_type, {'projects': projects}))
+        if block_type == 'componentCarousel':
+            cards = [self._link(self._entry('componentCard')) for _ in range(5)]
+            return self._link(self._entry(block_type, {'cards': cards}))
+        if block_type == 'componentRichText':
+            return self._link(self._entry(block_type, {
+                'content': self._rich_text(self.default_locale, 4)
+            }))
+        return self._link(self._entry(block_type))
+
+    def generate(self) -> Dict[str, Any]:
+        """
+        Build the space.
+
+        Returns:
+            Dictionary with 'entries' and 'assets' (keyed by ID, all-locale
+            fields) and 'content_types' (Delivery API shape)
+        """
+        self._entries = {}
+        self._assets = {}
+        self._counters = {}
+
+        self._build_assets()
+
+        menu_items = [self._link(self._entry('mlMenuItem')) for _ in range(self.menu_items)]
+        social_links = [self._link(self._entry('componentSocialLink')) for _ in range(3)]
+        hero_banners = [
+            self._link(self._entry('heroBanner'))
+            for _ in range(max(1, self.posts // 10))
+        ]
+
+        # Blog posts: own SEO entry, shared hero banner, deep rich text
+        for _ in range(self.posts):
+            post_id = self._entry('blogPage', {
+                'seo': self._seo(),
+                'heroBanner': self._random.choice(hero_banners)
+            })
+            post_fields = self._entries[post_id]['fields']
+            post_fields['text'] = {
+                locale: self._rich_text(locale, self.paragraphs) for locale in self.locales
+            }
+
+        header = self._link(self._entry('orHeader', {
+            'menuItems': menu_items,
+            'topLinks': menu_items[:2]
+        }))
+        footer = self._link(self._entry('orFooter', {'menuItems': menu_items}))
+
+        self._entry('homePage', {
+            'seo': self._seo(),
+            'header': header,
+            'footer': footer,
+            'blocks': [
+                self._block(BLOCK_TYPES[i % len(BLOCK_TYPES)]) for i in range(self.blocks)
+            ]
+        })
+        self._entry('profile', {'socialLinks': social_links})
+        self._entry('blogListingPage', {
+            'seo': self._seo(),
+            'hero': self._random.choice(hero_banners)
+        })
+
+        return {
+            'entries': self._entries,
+            'assets': self._assets,
+            'content_types': self.content_types()
+        }
+
+    def content_types(self) -> List[Dict[str, Any]]:
+        """Get the schemas as Delivery API content types (live IDs)."""
+        return [
+            {
+                'sys': {'id': LIVE_CONTENT_TYPE_IDS.get(schema_id, schema_id), 'type': 'ContentType'},
+                'name': schema_id,
+                'fields': list(fields.values())
+            }
+            for schema_id, fields in self.registry.content_types.items()
+        ]
+
+
+def build_snapshot(
+    space: Dict[str, Any],
+    space_id: str,
+    mode: str = 'production',
+    environment: str = 'master'
+) -> Dict[str, Any]:
+    """
+    Wrap a generated space as SyncStore state.
+
+    Args:
+        space: Output of SpaceGenerator.generate()
+        space_id: Space ID the snapshot is scoped to
+        mode: 'production' or 'preview'
+        environment: Contentful environment ID
+
+    Returns:
+        State dictionary loadable by SyncStore and the stand-in server
+    """
+    return {
+        'version': SYNC_STATE_VERSION,
+        'space_id': space_id,
+        'environment': environment,
+        'mode': mode,
+        'next_sync_token': SYNC_DONE_TOKEN,
+        'synced_at': None,
+        **space
+    }
+
+
+def main() -> int:
+    """
+    Entry point for the generator.
+
+    Returns:
+        Exit code (0 = success, 1 = failure)
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', required=True, help='Snapshot file to write (sync-state.json)')
+    parser.add_argument('--posts', type=int, default=100, help='Number of blog posts')
+    parser.add_argument('--locales', default=','.join(SUPPORTED_LOCALES), help='Comma-separated locales')
+    parser.add_argument('--assets', type=int, default=50, help='Shared asset pool size')
+    parser.add_argument('--menu-items', type=int, default=8, help='Shared menu item pool size')
+    parser.add_argument('--blocks', type=int, default=len(BLOCK_TYPES), help='Homepage blocks')
+    parser.add_argument('--paragraphs', type=int, default=6, help='Rich text sections per post')
+    parser.add_argument('--list-depth', type=int, default=3, help='Nested list depth in rich text')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--space-id', default=CONTENTFUL_SPACE_ID or 'synthetic', help='Space ID to scope the snapshot to')
+    args = parser.parse_args()
+
+    locales = [locale.strip() for locale in args.locales.split(',') if locale.strip()]
+    if DEFAULT_LOCALE in locales:
+        # Keep the space default first
+        locales.remove(DEFAULT_LOCALE)
+        locales.insert(0, DEFAULT_LOCALE)
+
+    try:
+        space = SpaceGenerator(
+            posts=args.posts,
+            locales=locales,
+            assets=args.assets,
+            menu_items=args.menu_items,
+            blocks=args.blocks,
+            paragraphs=args.paragraphs,
+            list_depth=args.list_depth,
+            seed=args.seed
+        ).generate()
+
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(build_snapshot(space, args.space_id, CONTENTFUL_MODE), f, ensure_ascii=False)
+    except Exception as e:
+        logger.error(f"❌ SYNTHETIC_SPACE_FAILED: {str(e)}")
+        return 1
+
+    logger.info(
+        f"🧪 SYNTHETIC_SPACE_WRITTEN "
+        f"path={args.output} "
+        f"entries={len(space['entries'])} "
+        f"assets={len(space['assets'])} "
+        f"locales={','.join(locales)} "
+        f"bytes={os.path.getsize(args.output)}"
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,11 +4,13 @@ Provides common functionality for all transformers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from contentful.entry import Entry
 
 from scripts.contentful_client.client import ContentfulClient
-from scripts.config import logger
+from scripts.contentful_client.query_planner import DataNeed
+from scripts.contentful_client.schema_projection import FieldProjection, project
+from scripts.config import logger, DEFAULT_LOCALE, LOCALE_FALLBACKS
 
 
 class BaseTransformer(ABC):
@@ -21,8 +23,15 @@ class BaseTransformer(ABC):
     Attributes:
         client: ContentfulClient instance
         locale: Locale code (e.g., 'en', 'es')
+        field_paths: Contentful field paths transform_single() reads
+            (dotted through links, e.g. 'seo.ogImage'); used to derive
+            the select list and include depth from contentful-schemas/
+        default_include_depth: Include depth when no projection applies
     """
     
+    field_paths: List[str] = []
+    default_include_depth: int = 2
+    
     def __init__(self, client: ContentfulClient, locale: str = 'en') -> None:
         """
         Initialize transformer.
@@ -33,7 +42,9 @@ class BaseTransformer(ABC):
         """
         self.client = client
         self.locale = locale
-        self.fallback_locale = 'en'  # Default fallback
+        self.fallback_locale = LOCALE_FALLBACKS.get(locale, DEFAULT_LOCALE)
+        self._projection: Optional[FieldProjection] = None
+        self._projection_resolved = False
         
         logger.info(
             f"✅ TRANSFORMER_INIT "
@@ -67,6 +78,172 @@ class BaseTransformer(ABC):
         """
         pass
     
+    def transform_each(self, entries: List[Entry]) -> List[Tuple[Entry, Optional[Dict[str, Any]]]]:
+        """
+        Transform entries with graceful degradation, keeping each result
+        next to its entry.
+        
+        Failures are logged and paired with None.
+        
+        Args:
+            entries: Entries to transform
+        
+        Returns:
+            (entry, transformed data or None) per entry, in entry order
+        """
+        results = []
+        
+        for entry in entries:
+            try:
+                results.append((entry, self.transform_single(entry)))
+            except Exception as e:
+                self.log_transform_error(entry, e)
+                results.append((entry, None))
+        
+        return results
+    
+    def transform_batch(self, entries: List[Entry]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Transform entries with graceful degradation.
+        
+        Failures are logged and skipped.
+        
+        Args:
+            entries: Entries to transform
+        
+        Returns:
+            Tuple of (transformed data in entry order, failure count)
+        """
+        results = self.transform_each(entries)
+        transformed = [data for _, data in results if data is not None]
+        return transformed, len(results) - len(transformed)
+    
+    def transform_stream(
+        self,
+        stats: Optional[Dict[str, Any]] = None,
+        skip: Optional[Callable[[Entry], bool]] = None
+    ) -> Iterator[Tuple[Entry, Dict[str, Any]]]:
+        """
+        Transform entries page by page as they are fetched.
+        
+        Unlike transform_all(), neither the entries nor the results are
+        collected: each page is transformed and its results yielded
+        before the next page is requested, so memory stays bounded by
+        the page size. Failures are logged and skipped as in
+        transform_all().
+        
+        Args:
+            stats: Optional dictionary updated in place with 'total',
+                'success', 'failed' and 'skipped' counts, and 'complete'
+                (False if a page fetch failed and the stream ended early)
+            skip: Optional predicate for entries that need no transform
+                (e.g., unchanged since the last build)
+        
+        Yields:
+            (entry, transformed data) per successfully transformed entry
+        """
+        if stats is None:
+            stats = {}
+        for key in ('total', 'success', 'failed', 'skipped'):
+            stats.setdefault(key, 0)
+        stats['complete'] = False
+        
+        logger.info(
+            f"📊 TRANSFORM_STREAM_START "
+            f"content_type={self.content_type} "
+            f"locale={self.locale}"
+        )
+        
+        pages = self.client.iter_entry_pages(
+            content_type=self.content_type,
+            locale=self.locale,
+            include=self.include_depth
+        )
+        
+        while True:
+            try:
+                page = next(pages)
+            except StopIteration:
+                stats['complete'] = True
+                break
+            except Exception as e:
+                logger.error(
+                    f"❌ FETCH_FAILED "
+                    f"content_type={self.content_type} "
+                    f"locale={self.locale} "
+                    f"error={str(e)}"
+                )
+                break
+            
+            stats['total'] += len(page)
+            if skip is not None:
+                pending = [entry for entry in page if not skip(entry)]
+                stats['skipped'] += len(page) - len(pending)
+                page = pending
+            
+            for entry, data in self.transform_each(page):
+                if data is None:
+                    stats['failed'] += 1
+                    continue
+                stats['success'] += 1
+                yield entry, data
+        
+        logger.info(
+            f"📊 TRANSFORM_STREAM_COMPLETE "
+            f"content_type={self.content_type} "
+            f"locale={self.locale} "
+            f"total={stats['total']} "
+            f"success={stats['success']} "
+            f"failed={stats['failed']} "
+            f"skipped={stats['skipped']}"
+        )
+    
+    def get_projection(self) -> Optional[FieldProjection]:
+        """
+        Get the schema-derived projection for this transformer.
+        
+        Computed once from field_paths; the select list is registered
+        with the client so every collection fetch for this content type
+        only downloads the fields transform_single() reads.
+        
+        Returns:
+            FieldProjection, or None to fetch all fields at
+            default_include_depth
+        """
+        if not self._projection_resolved:
+            self._projection = project(self.content_type, self.field_paths)
+            self._projection_resolved = True
+            
+            # client may be None when only inspecting projections
+            if self._projection is not None and self.client is not None:
+                self.client.set_field_projection(
+                    self.content_type,
+                    self._projection.fields
+                )
+        
+        return self._projection
+    
+    @property
+    def include_depth(self) -> int:
+        """Reference include depth used by transform_all()."""
+        projection = self.get_projection()
+        return projection.include if projection else self.default_include_depth
+    
+    def get_data_needs(self) -> List[DataNeed]:
+        """
+        Declare the fetches transform_all() relies on (for query planning).
+        
+        Returns:
+            List of data needs (default: own content type at include_depth)
+        """
+        return [
+            DataNeed(
+                self.content_type,
+                include=self.include_depth,
+                requested_by=self.__class__.__name__
+            )
+        ]
+    
     def validate_required_fields(
         self,
         entry: Entry,
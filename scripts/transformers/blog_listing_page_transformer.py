@@ -20,6 +20,13 @@ class BlogListingPageTransformer(BaseTransformer):
     the /blog/ archive page.
     """
     
+    field_paths = [
+        'title', 'description',
+        'hero.title', 'hero.description', 'hero.ctaLabel', 'hero.ctaUrl', 'hero.image',
+        'seo.title', 'seo.description', 'seo.ogImage'
+    ]
+    default_include_depth = 3  # Hero banner image + SEO og image
+    
     def __init__(self, client, locale: str = 'en') -> None:
         super().__init__(client, locale)
         self.content_type = CONTENT_TYPE_BLOG_LISTING
@@ -82,7 +89,7 @@ class BlogListingPageTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=3
+                include=self.include_depth
             )
             if not entries:
                 logger.warning(f"⚠️ NO_BLOG_LISTING_PAGE locale={self.locale}")
@@ -3,10 +3,11 @@ Blog post transformer for Contentful blogTemplate content type.
 Transforms blog posts to Jekyll markdown with frontmatter.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from contentful.entry import Entry
 
 from scripts.transformers.base_transformer import BaseTransformer
+from scripts.transformers.parallel import transform_parallel
 from scripts.converters.markdown_converter import RichTextConverter
 from scripts.config import logger, CONTENT_TYPE_BLOG_POST, get_jekyll_locale
 
@@ -20,17 +21,35 @@ class BlogPostTransformer(BaseTransformer):
     Extracts featured images and metadata.
     """
     
-    def __init__(self, client, locale: str = 'en') -> None:
+    field_paths = [
+        'url', 'title', 'description', 'label', 'author', 'publishDate', 'image', 'text',
+        'heroBanner.title', 'heroBanner.description', 'heroBanner.ctaLabel',
+        'heroBanner.ctaUrl', 'heroBanner.image',
+        'seo.title', 'seo.description', 'seo.keywords', 'seo.ogImage',
+        'seo.canonicalUrl', 'seo.noIndex'
+    ]
+    
+    def __init__(
+        self,
+        client,
+        locale: str = 'en',
+        workers: int = 0,
+        chunk_size: int = 25
+    ) -> None:
         """
         Initialize blog post transformer.
         
         Args:
             client: ContentfulClient instance
             locale: Locale code
+            workers: Transform worker processes (0 or 1 = serial)
+            chunk_size: Posts per worker task
         """
         super().__init__(client, locale)
         self.markdown_converter = RichTextConverter()
         self.content_type = CONTENT_TYPE_BLOG_POST
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
     
     def validate_seo(self, entry: Entry) -> None:
         """
@@ -206,6 +225,39 @@ class BlogPostTransformer(BaseTransformer):
             'body': body_markdown
         }
     
+    def transform_each(self, entries: List[Entry]) -> List[Tuple[Entry, Optional[Dict[str, Any]]]]:
+        """
+        Transform posts, in worker processes when workers > 1.
+        
+        Rich text conversion is CPU-bound, so batches larger than one
+        chunk are split across the shared worker pool; results keep
+        entry order and failures are reported per entry. If the pool
+        fails, the batch is transformed serially instead.
+        
+        Args:
+            entries: Blog post entries
+        
+        Returns:
+            (entry, transformed post or None) per entry, in entry order
+        """
+        if self.workers > 1 and len(entries) > self.chunk_size:
+            try:
+                results = transform_parallel(self, entries, self.workers, self.chunk_size)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ PARALLEL_TRANSFORM_FAILED "
+                    f"locale={self.locale} "
+                    f"error={str(e)} "
+                    f"action=serial_transform"
+                )
+            else:
+                return [
+                    (entry, post if error is None else None)
+                    for entry, (post, error) in zip(entries, results)
+                ]
+        
+        return super().transform_each(entries)
+    
     def transform_all(self) -> List[Dict[str, Any]]:
         """
         Transform all blog posts with graceful degradation.
@@ -224,7 +276,7 @@ class BlogPostTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=2  # Include SEO and image references
+                include=self.include_depth  # Include SEO and image references
             )
         except Exception as e:
             logger.error(
@@ -236,17 +288,7 @@ class BlogPostTransformer(BaseTransformer):
             return []
         
         # Transform with graceful degradation
-        transformed = []
-        failed_count = 0
-        
-        for entry in entries:
-            try:
-                post_data = self.transform_single(entry)
-                transformed.append(post_data)
-            except Exception as e:
-                self.log_transform_error(entry, e)
-                failed_count += 1
-                # Continue with next entry
+        transformed, failed_count = self.transform_batch(entries)
         
         # Summary
         total = len(entries)
@@ -18,6 +18,11 @@ class FooterTransformer(BaseTransformer):
     Outputs to _data/footer-{locale}.yml
     """
     
+    field_paths = [
+        'brandUrl', 'brandImage', 'description', 'copyright',
+        'menuItems.label', 'menuItems.url', 'menuItems.openInNewTab'
+    ]
+    
     def __init__(self, client, locale: str = 'en') -> None:
         """
         Initialize footer transformer.
@@ -187,7 +192,7 @@ class FooterTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=2  # Include menu items and social links
+                include=self.include_depth  # Include menu items and social links
             )
             
             if not entries:
@@ -18,6 +18,12 @@ class HeaderTransformer(BaseTransformer):
     Outputs to _data/header-{locale}.yml
     """
     
+    field_paths = [
+        'brandUrl', 'brandImage',
+        'menuItems.label', 'menuItems.url', 'menuItems.openInNewTab',
+        'topLinks.label', 'topLinks.url', 'topLinks.openInNewTab'
+    ]
+    
     def __init__(self, client, locale: str = 'en') -> None:
         """
         Initialize header transformer.
@@ -146,7 +152,7 @@ class HeaderTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=2  # Include menu items
+                include=self.include_depth  # Include menu items
             )
             
             if not entries:
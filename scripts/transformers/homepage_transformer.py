@@ -21,6 +21,25 @@ class HomepageTransformer(BaseTransformer):
     Outputs to _data/homepage-{locale}.yml
     """
     
+    field_paths = [
+        'name', 'url',
+        # Blocks (fields shared by several block types resolve per type)
+        'blocks.name', 'blocks.title', 'blocks.description', 'blocks.ctaLabel',
+        'blocks.ctaUrl', 'blocks.image', 'blocks.skills', 'blocks.imageOnRight',
+        'blocks.quote', 'blocks.author', 'blocks.role',
+        'blocks.projects.title', 'blocks.projects.description', 'blocks.projects.url',
+        'blocks.projects.image', 'blocks.projects.external',
+        'blocks.cards.title', 'blocks.cards.description', 'blocks.cards.url',
+        'blocks.cards.urlLabel', 'blocks.cards.image',
+        # Header and footer (written to their own data files)
+        'header.brandUrl', 'header.brandImage',
+        'header.menuItems.label', 'header.menuItems.url', 'header.menuItems.openInNewTab',
+        'header.topLinks.label', 'header.topLinks.url', 'header.topLinks.openInNewTab',
+        'footer.brandUrl', 'footer.brandImage', 'footer.description', 'footer.copyright',
+        'footer.menuItems.label', 'footer.menuItems.url', 'footer.menuItems.openInNewTab'
+    ]
+    default_include_depth = 10  # Header/footer menu items + blocks
+    
     def __init__(self, client, locale: str = 'en') -> None:
         """
         Initialize homepage transformer.
@@ -505,7 +524,7 @@ class HomepageTransformer(BaseTransformer):
         
         return menu_items
     
-    def _extract_header(self, homepage_entry: Entry) -> Dict[str, Any]:
+    def extract_header(self, homepage_entry: Entry) -> Dict[str, Any]:
         """
         Extract header data from homepage entry.
         
@@ -572,7 +591,7 @@ class HomepageTransformer(BaseTransformer):
             )
             return {'brand_url': '/'}
     
-    def _extract_footer(self, homepage_entry: Entry) -> Dict[str, Any]:
+    def extract_footer(self, homepage_entry: Entry) -> Dict[str, Any]:
         """
         Extract footer data from homepage entry.
         
@@ -656,8 +675,8 @@ class HomepageTransformer(BaseTransformer):
         url = fields.get('url', '/')
         
         # Extract header and footer (store for later writing to separate files)
-        self.header_data = self._extract_header(entry)
-        self.footer_data = self._extract_footer(entry)
+        self.header_data = self.extract_header(entry)
+        self.footer_data = self.extract_footer(entry)
         
         # Resolve blocks array
         block_entries = self.resolve_reference_array(entry, 'blocks')
@@ -714,7 +733,7 @@ class HomepageTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=10  # Deep include for header/footer menu items + blocks
+                include=self.include_depth  # Deep include for header/footer menu items + blocks
             )
             
             if not entries:
@@ -0,0 +1,177 @@
+"""
+Parallel entry transformation in worker processes.
+Entries are shipped to workers as raw JSON payloads (items + includes) and
+rebuilt there as raw-JSON entries, since SDK entries do not pickle.
+"""
+
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from scripts.config import logger
+from scripts.contentful_client.raw_resources import LINK_TYPES, build_raw_entries, collect_linked
+
+
+# (transformed data or None, error message or None) per entry
+ChunkResult = List[Tuple[Optional[Dict[str, Any]], Optional[str]]]
+
+# Shared executor, created on first use
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+# Worker-side transformers per (class, locale), reused across chunks
+_worker_transformers: Dict[Tuple[type, str], Any] = {}
+
+
+def free_threaded() -> bool:
+    """Check whether the interpreter runs without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def get_transform_executor(workers: int) -> Executor:
+    """
+    Get the shared transform executor, creating it on first use.
+
+    Free-threaded builds get a thread pool (threads already run on every
+    core there); otherwise a process pool sidesteps the GIL. The pool is
+    created lazily from a build worker thread while the cache sweeper,
+    rate limiter and logging threads run, so its workers are spawned:
+    forking then could copy a lock held by another thread and deadlock
+    the child.
+
+    Args:
+        workers: Worker count (only used on creation)
+
+    Returns:
+        Executor shared by every parallel transform
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            if free_threaded():
+                _executor = ThreadPoolExecutor(max_workers=workers)
+            else:
+                _executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+
+            logger.info(
+                f"🧵 TRANSFORM_POOL_STARTED "
+                f"type={_executor.__class__.__name__} "
+                f"workers={workers}"
+            )
+        return _executor
+
+
+def shutdown_transform_executor() -> None:
+    """Stop the shared executor (a later call starts a new one)."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def build_payload(entries: List[Any], depth: int) -> Dict[str, Any]:
+    """
+    Serialize entries and everything they link to as a collection page.
+
+    Linked entries and assets are collected by walking the resolved
+    fields up to ``depth`` levels, so the payload resolves the same
+    links the entries did.
+
+    Args:
+        entries: SDK or raw-JSON entries
+        depth: Link levels to include
+
+    Returns:
+        Collection page body (items + includes), picklable
+    """
+    includes: Dict[str, Dict[str, Dict[str, Any]]] = {link_type: {} for link_type in LINK_TYPES}
+    for raw in collect_linked(entries, depth):
+        includes[raw['sys']['type']][raw['sys']['id']] = raw
+
+    return {
+        'sys': {'type': 'Array'},
+        'items': [entry.raw for entry in entries],
+        'includes': {
+            link_type: list(items.values()) for link_type, items in includes.items() if items
+        }
+    }
+
+
+def transform_payload(
+    transformer_class: Type[Any],
+    locale: str,
+    payload: Dict[str, Any]
+) -> ChunkResult:
+    """
+    Transform a payload's items (runs in a worker).
+
+    Args:
+        transformer_class: Transformer to apply (built with no client)
+        locale: Contentful locale code
+        payload: Output of build_payload()
+
+    Returns:
+        (result, error) per item, in item order
+    """
+    key = (transformer_class, locale)
+    transformer = _worker_transformers.get(key)
+    if transformer is None:
+        transformer = _worker_transformers[key] = transformer_class(None, locale)
+
+    results: ChunkResult = []
+    for entry in build_raw_entries([payload], locale):
+        try:
+            results.append((transformer.transform_single(entry), None))
+        except Exception as e:
+            transformer.log_transform_error(entry, e)
+            results.append((None, str(e)))
+    return results
+
+
+def transform_parallel(
+    transformer: Any,
+    entries: List[Any],
+    workers: int,
+    chunk_size: int
+) -> ChunkResult:
+    """
+    Transform entries in chunks on the shared executor.
+
+    Args:
+        transformer: Transformer whose class and locale the workers use
+        entries: Entries to transform
+        workers: Executor size
+        chunk_size: Entries per task
+
+    Returns:
+        (result, error) per entry, in entry order
+
+    Raises:
+        Exception: If the pool fails (e.g., a worker died); callers fall
+            back to transforming serially
+    """
+    executor = get_transform_executor(workers)
+
+    futures = [
+        executor.submit(
+            transform_payload,
+            transformer.__class__,
+            transformer.locale,
+            build_payload(entries[start:start + chunk_size], transformer.include_depth)
+        )
+        for start in range(0, len(entries), chunk_size)
+    ]
+
+    results: ChunkResult = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -18,6 +18,11 @@ class ProfileTransformer(BaseTransformer):
     Outputs to _data/profile-{locale}.yml
     """
     
+    field_paths = [
+        'fullName', 'title', 'bio', 'email', 'profileImage', 'ctaLabel', 'ctaUrl',
+        'socialLinks.name', 'socialLinks.url'
+    ]
+    
     def __init__(self, client, locale: str = 'en') -> None:
         """
         Initialize profile transformer.
@@ -125,7 +130,7 @@ class ProfileTransformer(BaseTransformer):
             entries = self.client.get_entries(
                 content_type=self.content_type,
                 locale=self.locale,
-                include=2  # Include social links
+                include=self.include_depth  # Include social links
             )
             
             if not entries:
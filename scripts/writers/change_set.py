@@ -0,0 +1,186 @@
+"""
+Change tracking for generated files.
+Collects what every write and removal did, for the change summary CI uses
+to skip the Jekyll build and deploy when the output is identical.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from scripts.config import logger
+from scripts.writers.content_hash import ADDED, MODIFIED, REMOVED, UNCHANGED, output_digest
+
+
+CHANGE_SUMMARY_VERSION = 1
+
+
+class ChangeSet:
+    """
+    Outcome of every file the writers touched during a build.
+
+    Shared by the writers (thread-safe); a path recorded twice keeps its
+    last outcome.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty change set."""
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, str] = {}
+
+    def record(self, path: str, status: str) -> None:
+        """
+        Record what happened to a file.
+
+        Args:
+            path: File path
+            status: ADDED, MODIFIED, UNCHANGED or REMOVED
+        """
+        with self._lock:
+            self._statuses[os.path.normpath(path)] = status
+
+    def paths(self, status: str) -> List[str]:
+        """
+        Get the files with an outcome.
+
+        Args:
+            status: ADDED, MODIFIED, UNCHANGED or REMOVED
+
+        Returns:
+            Sorted file paths
+        """
+        with self._lock:
+            return sorted(path for path, recorded in self._statuses.items() if recorded == status)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count files per outcome.
+
+        Returns:
+            Dictionary with 'added', 'modified', 'removed' and
+            'unchanged' counts
+        """
+        counts = {status: 0 for status in (ADDED, MODIFIED, REMOVED, UNCHANGED)}
+        with self._lock:
+            for status in self._statuses.values():
+                counts[status] += 1
+        return counts
+
+    def changed_paths(self) -> List[str]:
+        """
+        Get every file added, modified or removed.
+
+        Returns:
+            Sorted file paths
+        """
+        with self._lock:
+            return sorted(path for path, status in self._statuses.items() if status != UNCHANGED)
+
+    @property
+    def changed(self) -> bool:
+        """Whether any file was added, modified or removed."""
+        counts = self.counts()
+        return bool(counts[ADDED] or counts[MODIFIED] or counts[REMOVED])
+
+    def summary(self, roots: List[str]) -> Dict[str, Any]:
+        """
+        Build the machine-readable change summary.
+
+        Args:
+            roots: Output folders to digest (e.g., _posts, _data)
+
+        Returns:
+            Summary with 'changed', per-outcome path lists, the
+            unchanged count and a digest of the whole output
+        """
+        return {
+            'version': CHANGE_SUMMARY_VERSION,
+            'generated_at': time.time(),
+            'changed': self.changed,
+            'added': self.paths(ADDED),
+            'modified': self.paths(MODIFIED),
+            'removed': self.paths(REMOVED),
+            'unchanged': self.counts()[UNCHANGED],
+            'digest': output_digest(roots)
+        }
+
+    def save(self, path: str, roots: List[str]) -> Dict[str, Any]:
+        """
+        Atomically write the change summary.
+
+        Args:
+            path: Summary file (its folder is created)
+            roots: Output folders to digest
+
+        Returns:
+            The summary written
+
+        Raises:
+            IOError: If the summary cannot be written
+        """
+        summary = self.summary(roots)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(
+                f"❌ CHANGE_SUMMARY_WRITE_FAILED "
+                f"path={path} "
+                f"error={str(e)}"
+            )
+            raise IOError(f"Failed to write change summary: {str(e)}")
+
+        logger.info(
+            f"📝 CHANGE_SUMMARY_WRITTEN "
+            f"path={path} "
+            f"changed={str(summary['changed']).lower()} "
+            f"added={len(summary['added'])} "
+            f"modified={len(summary['modified'])} "
+            f"removed={len(summary['removed'])} "
+            f"digest={summary['digest'][:12]}"
+        )
+
+        return summary
+
+
+def load_summary(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a change summary written by ChangeSet.save().
+
+    Args:
+        path: Summary file
+
+    Returns:
+        The summary, or None if it is missing, unreadable or from another
+        summary version
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(
+            f"⚠️ CHANGE_SUMMARY_UNREADABLE "
+            f"path={path} "
+            f"error={str(e)}"
+        )
+        return None
+
+    if summary.get('version') != CHANGE_SUMMARY_VERSION:
+        logger.warning(
+            f"⚠️ CHANGE_SUMMARY_MISMATCH "
+            f"path={path} "
+            f"version={summary.get('version')}"
+        )
+        return None
+
+    return summary
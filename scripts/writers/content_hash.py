@@ -0,0 +1,90 @@
+"""
+Write-if-changed helpers shared by the writers.
+Skips rewriting files whose content is byte-identical, so unchanged
+outputs keep their mtime for `jekyll build --incremental`, and digests
+whole output trees.
+"""
+
+import hashlib
+import os
+from typing import List
+
+
+# Outcomes of a file write (or removal)
+ADDED = 'added'
+MODIFIED = 'modified'
+UNCHANGED = 'unchanged'
+REMOVED = 'removed'
+
+
+def content_digest(data: bytes) -> str:
+    """
+    Hash serialized file content.
+
+    Args:
+        data: File bytes
+
+    Returns:
+        SHA-256 hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: str, content: str) -> str:
+    """
+    Write a UTF-8 text file unless it already has exactly this content.
+
+    The existing file is only hashed when its size matches, so changed
+    files usually cost one stat() before the write.
+
+    Args:
+        path: File path
+        content: Serialized file content
+
+    Returns:
+        ADDED (new file), MODIFIED (rewritten) or UNCHANGED (left as is)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    data = content.encode('utf-8')
+    status = ADDED
+
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if content_digest(f.read()) == content_digest(data):
+                    return UNCHANGED
+        status = MODIFIED
+    except OSError:
+        # Missing or unreadable: write it
+        pass
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    return status
+
+
+def output_digest(roots: List[str]) -> str:
+    """
+    Hash every file under some output folders.
+
+    Identical output trees (same relative paths, same bytes) give the
+    same digest, whichever build produced them.
+
+    Args:
+        roots: Output folders (missing ones are skipped)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for root in sorted(roots):
+        for directory, subdirectories, files in os.walk(root):
+            subdirectories.sort()
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                with open(path, 'rb') as f:
+                    file_digest = content_digest(f.read())
+                digest.update(f"{os.path.normpath(path)}\0{file_digest}\n".encode('utf-8'))
+    return digest.hexdigest()
@@ -4,10 +4,12 @@ Writes structured data to _data/ directory.
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import yaml
 
 from scripts.config import logger
+from scripts.writers.change_set import ChangeSet
+from scripts.writers.content_hash import UNCHANGED, write_if_changed
 
 
 class DataWriter:
@@ -20,14 +22,16 @@ class DataWriter:
     - UTF-8 encoding
     """
     
-    def __init__(self, base_path: str = '.') -> None:
+    def __init__(self, base_path: str = '.', changes: Optional[ChangeSet] = None) -> None:
         """
         Initialize data writer.
         
         Args:
             base_path: Base directory path (default: current directory)
+            changes: Optional change set recording every file outcome
         """
         self.base_path = base_path
+        self.changes = changes
         self.data_dir = os.path.join(base_path, '_data')
     
     def _ensure_data_folder(self) -> str:
@@ -73,15 +77,21 @@ class DataWriter:
         data: Dict[str, Any],
         content_type: str,
         locale: str
-    ) -> None:
+    ) -> Tuple[str, bool]:
         """
         Write data to YAML file.
         
+        A file whose current content is identical is left untouched
+        (mtime preserved).
+        
         Args:
             data: Data dictionary to serialize
             content_type: Content type (e.g., 'profile', 'header', 'footer')
             locale: Locale code
         
+        Returns:
+            Tuple of (file path, whether the file was written)
+        
         Raises:
             IOError: If file write fails
         """
@@ -106,16 +116,28 @@ class DataWriter:
             header = self._generate_header_comment(content_type, locale)
             full_content = header + yaml_content
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            # Write to file (skipped when identical)
+            status = write_if_changed(file_path, full_content)
+            written = status != UNCHANGED
+            if self.changes is not None:
+                self.changes.record(file_path, status)
             
-            logger.info(
-                f"✅ DATA_WRITTEN "
-                f"path={file_path} "
-                f"content_type={content_type} "
-                f"locale={locale}"
-            )
+            if written:
+                logger.info(
+                    f"✅ DATA_WRITTEN "
+                    f"path={file_path} "
+                    f"content_type={content_type} "
+                    f"locale={locale}"
+                )
+            else:
+                logger.info(
+                    f"⏸️ DATA_UNCHANGED "
+                    f"path={file_path} "
+                    f"content_type={content_type} "
+                    f"locale={locale}"
+                )
+            
+            return file_path, written
             
         except Exception as e:
             logger.error(
@@ -128,20 +150,22 @@ class DataWriter:
     def write_multiple_data_files(
         self,
         data_items: list[tuple[Dict[str, Any], str, str]]
-    ) -> None:
+    ) -> Dict[str, int]:
         """
         Write multiple data files.
         
         Args:
             data_items: List of tuples (data, content_type, locale)
+        
+        Returns:
+            Dictionary with 'written', 'unchanged' and 'failed' counts
         """
-        success_count = 0
-        failed_count = 0
+        counts = {'written': 0, 'unchanged': 0, 'failed': 0}
         
         for data, content_type, locale in data_items:
             try:
-                self.write_data_file(data, content_type, locale)
-                success_count += 1
+                _, written = self.write_data_file(data, content_type, locale)
+                counts['written' if written else 'unchanged'] += 1
             except Exception as e:
                 logger.error(
                     f"❌ DATA_WRITE_FAILED "
@@ -149,10 +173,13 @@ class DataWriter:
                     f"locale={locale} "
                     f"error={str(e)}"
                 )
-                failed_count += 1
+                counts['failed'] += 1
         
         logger.info(
             f"📊 DATA_FILES_WRITTEN "
-            f"success={success_count} "
-            f"failed={failed_count}"
+            f"written={counts['written']} "
+            f"unchanged={counts['unchanged']} "
+            f"failed={counts['failed']}"
         )
+        
+        return counts
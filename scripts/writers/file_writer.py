@@ -6,10 +6,12 @@ Writes posts with YAML frontmatter to locale-specific folders.
 import os
 import re
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional, Tuple
 import frontmatter
 
 from scripts.config import logger
+from scripts.writers.change_set import ChangeSet
+from scripts.writers.content_hash import REMOVED, UNCHANGED, write_if_changed
 
 
 class FileWriter:
@@ -23,14 +25,16 @@ class FileWriter:
     - Date and slug validation
     """
     
-    def __init__(self, base_path: str = '.') -> None:
+    def __init__(self, base_path: str = '.', changes: Optional[ChangeSet] = None) -> None:
         """
         Initialize file writer.
         
         Args:
             base_path: Base directory path (default: current directory)
+            changes: Optional change set recording every file outcome
         """
         self.base_path = base_path
+        self.changes = changes
         self.posts_dir = os.path.join(base_path, '_posts')
     
     def _validate_slug(self, slug: str) -> str:
@@ -121,14 +125,20 @@ class FileWriter:
         self,
         post_data: Dict[str, Any],
         locale: str
-    ) -> None:
+    ) -> Tuple[str, bool]:
         """
         Write blog post to markdown file with frontmatter.
         
+        A file whose current content is identical is left untouched
+        (mtime preserved).
+        
         Args:
             post_data: Dictionary with 'frontmatter' and 'body' keys
             locale: Locale code
         
+        Returns:
+            Tuple of (file path, whether the file was written)
+        
         Raises:
             IOError: If file write fails
         """
@@ -156,16 +166,28 @@ class FileWriter:
             # Create frontmatter post
             post = frontmatter.Post(body, **frontmatter_dict)
             
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter.dumps(post))
+            # Write to file (skipped when identical)
+            status = write_if_changed(file_path, frontmatter.dumps(post))
+            written = status != UNCHANGED
+            if self.changes is not None:
+                self.changes.record(file_path, status)
             
-            logger.info(
-                f"✅ POST_WRITTEN "
-                f"path={file_path} "
-                f"locale={locale} "
-                f"slug={slug}"
-            )
+            if written:
+                logger.info(
+                    f"✅ POST_WRITTEN "
+                    f"path={file_path} "
+                    f"locale={locale} "
+                    f"slug={slug}"
+                )
+            else:
+                logger.info(
+                    f"⏸️ POST_UNCHANGED "
+                    f"path={file_path} "
+                    f"locale={locale} "
+                    f"slug={slug}"
+                )
+            
+            return file_path, written
             
         except Exception as e:
             logger.error(
@@ -175,36 +197,79 @@ class FileWriter:
             )
             raise IOError(f"Failed to write post: {str(e)}")
     
+    def remove_post(self, file_path: str) -> bool:
+        """
+        Delete a post file that is no longer generated.
+        
+        Args:
+            file_path: Path returned by write_blog_post()
+        
+        Returns:
+            True if the file was deleted, False if it did not exist
+        
+        Raises:
+            IOError: If the file cannot be deleted
+        """
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.error(
+                f"❌ REMOVE_FAILED "
+                f"path={file_path} "
+                f"error={str(e)}"
+            )
+            raise IOError(f"Failed to remove post: {str(e)}")
+        
+        if self.changes is not None:
+            self.changes.record(file_path, REMOVED)
+        
+        logger.info(
+            f"🗑️ POST_REMOVED "
+            f"path={file_path}"
+        )
+        
+        return True
+    
     def write_multiple_posts(
         self,
-        posts_data: list[Dict[str, Any]],
+        posts_data: Iterable[Dict[str, Any]],
         locale: str
-    ) -> None:
+    ) -> Dict[str, int]:
         """
         Write multiple blog posts.
         
+        Posts are written as they are drawn from posts_data, so a
+        generator is never materialized.
+        
         Args:
-            posts_data: List of post dictionaries
+            posts_data: Iterable of post dictionaries
             locale: Locale code
+        
+        Returns:
+            Dictionary with 'written', 'unchanged' and 'failed' counts
         """
-        success_count = 0
-        failed_count = 0
+        counts = {'written': 0, 'unchanged': 0, 'failed': 0}
         
         for post_data in posts_data:
             try:
-                self.write_blog_post(post_data, locale)
-                success_count += 1
+                _, written = self.write_blog_post(post_data, locale)
+                counts['written' if written else 'unchanged'] += 1
             except Exception as e:
                 logger.error(
                     f"❌ POST_WRITE_FAILED "
                     f"locale={locale} "
                     f"error={str(e)}"
                 )
-                failed_count += 1
+                counts['failed'] += 1
         
         logger.info(
             f"📊 POSTS_WRITTEN "
             f"locale={locale} "
-            f"success={success_count} "
-            f"failed={failed_count}"
+            f"written={counts['written']} "
+            f"unchanged={counts['unchanged']} "
+            f"failed={counts['failed']}"
         )
+        
+        return counts
@@ -133,4 +133,63 @@ class TestBlogPostTransformer:
         
         # Act & Assert
         with pytest.raises(ValueError):
-            transformer.transform_single(mock_entry)
\ No newline at end of file
+            transformer.transform_single(mock_entry)
+    
+    def test_transform_stream_yields_per_page_and_counts(self):
+        """Test that streaming transforms page by page and counts failures."""
+        # Arrange
+        mock_client = Mock()
+        pages = [[Mock(id='a'), Mock(id='bad')], [Mock(id='c')]]
+        mock_client.iter_entry_pages.return_value = iter(pages)
+        transformer = BlogPostTransformer(mock_client, locale='en')
+        
+        def transform_single(entry):
+            if entry.id == 'bad':
+                raise ValueError('SEO_MISSING')
+            return {'frontmatter': {'slug': entry.id}, 'body': ''}
+        
+        transformer.transform_single = transform_single
+        stats = {}
+        
+        # Act
+        slugs = [post['frontmatter']['slug'] for _, post in transformer.transform_stream(stats)]
+        
+        # Assert
+        assert slugs == ['a', 'c']
+        assert stats == {'total': 3, 'success': 2, 'failed': 1, 'skipped': 0, 'complete': True}
+    
+    def test_transform_stream_skips_unchanged_entries(self):
+        """Test that entries the skip predicate rejects are not transformed."""
+        # Arrange
+        mock_client = Mock()
+        mock_client.iter_entry_pages.return_value = iter([[Mock(id='a'), Mock(id='b')]])
+        transformer = BlogPostTransformer(mock_client, locale='en')
+        transformer.transform_single = Mock(return_value={'frontmatter': {}, 'body': ''})
+        stats = {}
+        
+        # Act
+        results = list(transformer.transform_stream(stats, skip=lambda entry: entry.id == 'a'))
+        
+        # Assert
+        assert [entry.id for entry, _ in results] == ['b']
+        assert transformer.transform_single.call_count == 1
+        assert stats['skipped'] == 1
+    
+    def test_transform_stream_stops_on_fetch_failure(self):
+        """Test that a failed page fetch ends the stream gracefully."""
+        # Arrange
+        mock_client = Mock()
+        
+        def pages():
+            yield [Mock(id='a')]
+            raise ConnectionError('network down')
+        
+        mock_client.iter_entry_pages.return_value = pages()
+        transformer = BlogPostTransformer(mock_client, locale='en')
+        transformer.transform_single = lambda entry: {'frontmatter': {}, 'body': ''}
+        
+        # Act
+        posts = list(transformer.transform_stream())
+        
+        # Assert
+        assert len(posts) == 1
@@ -0,0 +1,94 @@
+"""
+Unit tests for the build stage scheduler.
+Tests dependency ordering, parallelism, failure skipping and the critical path.
+"""
+
+import threading
+import time
+
+import pytest
+
+from scripts.build_graph import FAILED, SKIPPED, SUCCEEDED, BuildGraph
+
+
+class TestBuildGraph:
+    """Test suite for BuildGraph."""
+
+    def test_results_flow_to_dependents(self):
+        """Test that stages receive their dependencies' results."""
+        # Arrange
+        graph = BuildGraph('test')
+        graph.add('fetch', lambda inputs: [1, 2, 3])
+        graph.add('transform', lambda inputs: [x * 2 for x in inputs['fetch']], ['fetch'])
+        graph.add('write', lambda inputs: sum(inputs['transform']), ['transform'])
+
+        # Act
+        report = graph.run()
+
+        # Assert
+        assert report.results['write'] == 12
+        assert all(status == SUCCEEDED for status in report.statuses.values())
+
+    def test_ready_stages_run_in_parallel(self):
+        """Test that independent stages overlap."""
+        # Arrange
+        barrier = threading.Barrier(3, timeout=2)
+        graph = BuildGraph('test')
+        for name in ('a', 'b', 'c'):
+            graph.add(name, lambda inputs: barrier.wait())
+
+        # Act
+        report = graph.run(concurrency=3)
+
+        # Assert
+        assert [report.statuses[name] for name in ('a', 'b', 'c')] == [SUCCEEDED] * 3
+
+    def test_failure_skips_downstream_only(self):
+        """Test that a failed stage skips its dependents but not other branches."""
+        # Arrange
+        def fail(inputs):
+            raise RuntimeError('fetch failed')
+
+        graph = BuildGraph('test')
+        graph.add('fetch:homepage', fail)
+        graph.add('transform:header', lambda inputs: {}, ['fetch:homepage'])
+        graph.add('write:header', lambda inputs: True, ['transform:header'])
+        graph.add('fetch:profile', lambda inputs: ['p'])
+        graph.add('write:profile', lambda inputs: True, ['fetch:profile'])
+
+        # Act
+        report = graph.run()
+
+        # Assert
+        assert report.statuses['fetch:homepage'] == FAILED
+        assert report.errors['fetch:homepage'] == 'fetch failed'
+        assert report.statuses['transform:header'] == SKIPPED
+        assert report.statuses['write:header'] == SKIPPED
+        assert report.succeeded('write:profile')
+
+    def test_critical_path_follows_longest_chain(self):
+        """Test that the critical path is the slowest dependent chain."""
+        # Arrange
+        graph = BuildGraph('test')
+        graph.add('slow_fetch', lambda inputs: time.sleep(0.05))
+        graph.add('fast_fetch', lambda inputs: None)
+        graph.add(
+            'write',
+            lambda inputs: time.sleep(0.01),
+            ['slow_fetch', 'fast_fetch']
+        )
+
+        # Act
+        report = graph.run()
+        path, duration = report.critical_path()
+
+        # Assert
+        assert path == ['slow_fetch', 'write']
+        assert duration >= 0.06
+
+    def test_unknown_dependency_rejected(self):
+        """Test that dependencies must be declared first."""
+        graph = BuildGraph('test')
+
+        with pytest.raises(ValueError):
+            graph.add('write', lambda inputs: None, ['transform'])
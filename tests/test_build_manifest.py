@@ -0,0 +1,189 @@
+"""
+Unit tests for the incremental build manifest.
+Tests source versioning, skip decisions, the reverse index, and persistence.
+"""
+
+import os
+import shutil
+import tempfile
+
+from scripts.build_manifest import BuildManifest, code_files, code_hash, source_versions
+from scripts.contentful_client.raw_resources import build_raw_entries
+from scripts.transformers.blog_post_transformer import BlogPostTransformer
+from scripts.transformers.profile_transformer import ProfileTransformer
+from scripts.writers.file_writer import FileWriter
+
+
+def make_body(post_revision=1, seo_revision=1):
+    """Build a collection page with one post linking an SEO entry."""
+    def sys(item_id, revision, content_type):
+        return {
+            'id': item_id,
+            'type': 'Entry',
+            'revision': revision,
+            'updatedAt': f"2026-01-0{revision}T00:00:00Z",
+            'locale': 'en-US',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        }
+
+    return {
+        'sys': {'type': 'Array'},
+        'items': [{
+            'sys': sys('post-1', post_revision, 'blogPage'),
+            'fields': {'seo': {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'seo-1'}}}
+        }],
+        'includes': {
+            'Entry': [{'sys': sys('seo-1', seo_revision, 'seo'), 'fields': {'title': 'SEO'}}]
+        }
+    }
+
+
+class TestSourceVersions:
+    """Test suite for source_versions() and code_hash()."""
+
+    def test_linked_entries_versioned(self):
+        """Test that linked entries within the depth are part of the sources."""
+        # Arrange
+        entries = build_raw_entries([make_body(seo_revision=3)], 'en-US')
+
+        # Act
+        shallow = source_versions(entries, 0)
+        deep = source_versions(entries, 1)
+
+        # Assert
+        assert shallow == {'Entry:post-1': '1@2026-01-01T00:00:00Z'}
+        assert deep['Entry:seo-1'] == '3@2026-01-03T00:00:00Z'
+
+    def test_code_hash_differs_per_transformer(self):
+        """Test that transformers in different modules hash differently."""
+        assert code_hash(BlogPostTransformer, FileWriter) == code_hash(BlogPostTransformer, FileWriter)
+        assert code_hash(BlogPostTransformer, FileWriter) != code_hash(ProfileTransformer, FileWriter)
+
+    def test_code_hash_covers_orchestration(self):
+        """Test that the build script and client sources are part of every code hash."""
+        # Act
+        files = [os.path.relpath(path) for path in code_files(ProfileTransformer, FileWriter)]
+
+        # Assert
+        assert os.path.join('scripts', 'contentful_to_jekyll.py') in files
+        assert os.path.join('scripts', 'contentful_client', 'client.py') in files
+        assert os.path.join('scripts', 'contentful_client', 'raw_resources.py') in files
+        assert os.path.join('scripts', 'transformers', 'profile_transformer.py') in files
+
+
+class TestBuildManifest:
+    """Test suite for BuildManifest."""
+
+    def setup_method(self):
+        """Create a temporary directory with one output file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'manifest.json')
+        self.output = os.path.join(self.temp_dir, 'post.md')
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write('post')
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_output_skipped(self):
+        """Test that identical sources and code skip the output."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space')
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', [self.output])
+
+        # Act
+        skipped = manifest.skip('en-US:post:a', {'Entry:a': '1@t'}, 'code')
+
+        # Assert
+        assert skipped
+        assert manifest.get_stats() == {'skipped': 1, 'rebuilt': 1}
+
+    def test_changed_inputs_rebuilt(self):
+        """Test that a new entry version, new code, or an edited or missing file forces a rebuild."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space')
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', [self.output])
+
+        # Act & Assert
+        assert not manifest.skip('en-US:post:a', {'Entry:a': '2@t'}, 'code')
+        assert not manifest.skip('en-US:post:a', {'Entry:a': '1@t'}, 'new-code')
+        assert not manifest.skip('en-US:post:b', {'Entry:b': '1@t'}, 'code')
+
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write('checked-out copy')
+        assert not manifest.skip('en-US:post:a', {'Entry:a': '1@t'}, 'code')
+
+        os.remove(self.output)
+        assert not manifest.skip('en-US:post:a', {'Entry:a': '1@t'}, 'code')
+        assert manifest.get_stats()['skipped'] == 0
+
+    def test_save_and_load_roundtrip(self):
+        """Test that records survive a save/load cycle."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space')
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', [self.output])
+        manifest.save()
+
+        # Act
+        reloaded = BuildManifest(self.path, space_id='space')
+        loaded = reloaded.load()
+
+        # Assert
+        assert loaded
+        assert reloaded.skip('en-US:post:a', {'Entry:a': '1@t'}, 'code')
+
+    def test_scope_mismatch_discards_records(self):
+        """Test that a manifest from another mode is ignored."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space', mode='preview')
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', [self.output])
+        manifest.save()
+
+        # Act
+        production = BuildManifest(self.path, space_id='space', mode='production')
+        loaded = production.load()
+
+        # Assert
+        assert not loaded
+        assert production.records == {}
+
+    def test_reverse_index_maps_sources_to_outputs(self):
+        """Test that a shared source maps to every output built from it."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space')
+        manifest.record('en-US:data:header', 'en-US', {'Entry:home': '1@t', 'Entry:menu': '1@t'}, 'c', [self.output])
+        manifest.record('es:data:header', 'es', {'Entry:home': '1@t', 'Entry:menu': '1@t'}, 'c', [self.output])
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t', 'Asset:img': '1@t'}, 'c', [self.output])
+
+        # Act
+        affected = manifest.affected_outputs(['menu', 'img'])
+
+        # Assert
+        assert affected == {'en-US:data:header', 'es:data:header', 'en-US:post:a'}
+        assert manifest.reverse_index()['home'] == ['en-US:data:header', 'es:data:header']
+
+    def test_record_only_mode_never_skips(self):
+        """Test that a non-incremental manifest records but rebuilds everything."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space', incremental=False)
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', [self.output])
+
+        # Act & Assert
+        assert not manifest.skip('en-US:post:a', {'Entry:a': '1@t'}, 'code')
+
+    def test_record_and_drop_return_stale_outputs(self):
+        """Test that re-recording reports files no longer produced and drop() forgets outputs."""
+        # Arrange
+        manifest = BuildManifest(self.path, space_id='space')
+        manifest.record('en-US:post:a', 'en-US', {'Entry:a': '1@t'}, 'code', ['old-slug.md'])
+        manifest.record('en-US:post:b', 'en-US', {'Entry:b': '1@t'}, 'code', ['b.md'])
+
+        # Act
+        stale = manifest.record('en-US:post:a', 'en-US', {'Entry:a': '2@t'}, 'code', ['new-slug.md'])
+        dropped = manifest.drop(['en-US:post:b', 'en-US:post:unknown'])
+
+        # Assert
+        assert stale == ['old-slug.md']
+        assert dropped == ['b.md']
+        assert manifest.keys('en-US:post:') == ['en-US:post:a']
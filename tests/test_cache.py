@@ -0,0 +1,287 @@
+"""
+Unit tests for ResponseCache and SingleFlight.
+Tests expiry, concurrent access and request coalescing.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scripts.contentful_client.cache import ResponseCache, SingleFlight, estimate_size
+
+
+class TestResponseCache:
+    """Test suite for the thread-safe TTL cache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a fresh value is returned."""
+        # Arrange
+        cache = ResponseCache(ttl=300)
+        cache.set('key', ['entry'])
+
+        # Act
+        value = cache.get('key')
+
+        # Assert
+        assert value == ['entry']
+
+    def test_expired_value_dropped(self):
+        """Test that values older than the TTL are treated as missing."""
+        # Arrange
+        cache = ResponseCache(ttl=10)
+        with patch('scripts.contentful_client.cache.time.time', return_value=1000.0):
+            cache.set('key', ['entry'])
+
+        # Act
+        with patch('scripts.contentful_client.cache.time.time', return_value=1011.0):
+            value = cache.get('key')
+
+        # Assert
+        assert value is None
+        assert len(cache) == 0
+
+    def test_clear_reports_removed_count(self):
+        """Test that clear() empties the cache and returns the count."""
+        # Arrange
+        cache = ResponseCache()
+        cache.set('a', [])
+        cache.set('b', [])
+
+        # Act
+        removed = cache.clear()
+
+        # Assert
+        assert removed == 2
+        assert cache.values() == []
+
+    def test_concurrent_writers(self):
+        """Test that parallel writers never lose values."""
+        # Arrange
+        cache = ResponseCache()
+
+        def write(worker):
+            for i in range(200):
+                cache.set(f"{worker}:{i}", i)
+                cache.get(f"{worker}:{i}")
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(cache) == 8 * 200
+
+
+class TestEviction:
+    """Test suite for the LRU byte budget and background expiry."""
+
+    def make_cache(self, max_bytes, ttl=300):
+        """Create a cache where every value weighs its length in bytes."""
+        return ResponseCache(ttl=ttl, max_bytes=max_bytes, sizeof=len)
+
+    def test_least_recently_used_evicted(self):
+        """Test that the oldest unread value goes first when over budget."""
+        # Arrange
+        cache = self.make_cache(max_bytes=10)
+        cache.set('a', 'x' * 4)
+        cache.set('b', 'x' * 4)
+        cache.get('a')
+
+        # Act
+        cache.set('c', 'x' * 4)
+
+        # Assert
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+        assert cache.get_stats() == {'resident_bytes': 8, 'evictions': 1, 'expirations': 0}
+
+    def test_replacing_key_updates_size(self):
+        """Test that overwriting a key does not double count its bytes."""
+        # Arrange
+        cache = self.make_cache(max_bytes=100)
+        cache.set('a', 'x' * 10)
+
+        # Act
+        cache.set('a', 'x' * 3)
+
+        # Assert
+        assert cache.get_stats()['resident_bytes'] == 3
+
+    def test_known_size_not_estimated(self):
+        """Test that a size passed by the caller is used instead of the estimator."""
+        # Arrange
+        sizeof = Mock(return_value=1)
+        cache = ResponseCache(ttl=300, max_bytes=100, sizeof=sizeof)
+
+        # Act
+        cache.set('a', 'value', size=42)
+
+        # Assert
+        sizeof.assert_not_called()
+        assert cache.get_stats()['resident_bytes'] == 42
+
+    def test_oversized_value_not_stored(self):
+        """Test that a value larger than the whole budget is skipped."""
+        # Arrange
+        cache = self.make_cache(max_bytes=5)
+        cache.set('small', 'x')
+
+        # Act
+        cache.set('huge', 'x' * 6)
+
+        # Assert
+        assert cache.get('huge') is None
+        assert cache.get('small') == 'x'
+
+    def test_unbounded_cache_never_evicts(self):
+        """Test that max_bytes=0 disables eviction but still tracks size."""
+        # Arrange
+        cache = self.make_cache(max_bytes=0)
+
+        # Act
+        for i in range(50):
+            cache.set(str(i), 'x' * 100)
+
+        # Assert
+        assert len(cache) == 50
+        assert cache.get_stats()['resident_bytes'] == 5000
+
+    def test_purge_expired(self):
+        """Test that expired values are removed without being read."""
+        # Arrange
+        cache = self.make_cache(max_bytes=0, ttl=10)
+        with patch('scripts.contentful_client.cache.time.time', return_value=1000.0):
+            cache.set('old', 'x')
+        with patch('scripts.contentful_client.cache.time.time', return_value=1008.0):
+            cache.set('new', 'y')
+
+        # Act
+        with patch('scripts.contentful_client.cache.time.time', return_value=1012.0):
+            removed = cache.purge_expired()
+
+        # Assert
+        assert removed == 1
+        assert cache.get_stats()['resident_bytes'] == 1
+
+    def test_background_sweeper_purges(self):
+        """Test that the sweeper thread drops expired values."""
+        # Arrange
+        cache = self.make_cache(max_bytes=0, ttl=0)
+        cache.set('a', 'x')
+
+        # Act
+        cache.start_sweeper(0.01)
+        deadline = time.time() + 2
+        while len(cache) and time.time() < deadline:
+            time.sleep(0.01)
+        cache.stop_sweeper()
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.get_stats()['expirations'] == 1
+
+    def test_estimate_size_uses_raw_payload(self):
+        """Test that SDK resources are measured by their raw JSON."""
+        # Arrange
+        entry = Mock()
+        entry.raw = {'sys': {'id': 'post-1'}, 'fields': {'title': 'x' * 1000}}
+
+        # Act
+        size = estimate_size([entry])
+
+        # Assert
+        assert size > 1000
+
+
+class TestSingleFlight:
+    """Test suite for in-flight request coalescing."""
+
+    def run_concurrently(self, flight, key, fn, callers=5):
+        """Call flight.do() from several threads started together."""
+        barrier = threading.Barrier(callers)
+        results = []
+        errors = []
+
+        def call():
+            barrier.wait()
+            try:
+                results.append(flight.do(key, fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_callers_share_one_execution(self):
+        """Test that identical in-flight calls run the function once."""
+        # Arrange
+        flight = SingleFlight()
+
+        def fetch():
+            time.sleep(0.05)
+            return ['entry']
+
+        fn = Mock(side_effect=fetch)
+
+        # Act
+        results, errors = self.run_concurrently(flight, 'blogPage:en-US:2', fn)
+
+        # Assert
+        assert fn.call_count == 1
+        assert errors == []
+        assert [result for result, _ in results] == [['entry']] * 5
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+
+    def test_errors_propagate_to_waiters(self):
+        """Test that every waiting caller sees the leader's exception."""
+        # Arrange
+        flight = SingleFlight()
+
+        def fetch():
+            time.sleep(0.05)
+            raise ValueError('boom')
+
+        # Act
+        results, errors = self.run_concurrently(flight, 'key', fetch, callers=3)
+
+        # Assert
+        assert results == []
+        assert len(errors) == 3
+
+    def test_completed_call_not_remembered(self):
+        """Test that sequential calls each execute."""
+        # Arrange
+        flight = SingleFlight()
+        fn = Mock(return_value=1)
+
+        # Act
+        flight.do('key', fn)
+        flight.do('key', fn)
+
+        # Assert
+        assert fn.call_count == 2
+
+    def test_distinct_keys_not_coalesced(self):
+        """Test that different keys run independently."""
+        flight = SingleFlight()
+
+        assert flight.do('a', lambda: 1) == (1, False)
+        assert flight.do('b', lambda: 2) == (2, False)
+
+    def test_leader_exception_reraised(self):
+        """Test that the executing caller gets its own exception."""
+        flight = SingleFlight()
+
+        with pytest.raises(ValueError):
+            flight.do('key', Mock(side_effect=ValueError('boom')))
@@ -0,0 +1,289 @@
+"""
+Unit tests for record/replay cassettes.
+Tests persistence, replay lookups, and offline ContentfulClient runs.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from contentful.content_type_cache import ContentTypeCache
+
+from scripts import config
+from scripts.contentful_client.cassette import Cassette, CassetteMissError
+from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_client.rate_limiter import RateLimiter
+from scripts.contentful_client.raw_resources import RawAsset
+from scripts.contentful_client.sync_store import SyncStore
+from scripts.stand_in_server import SpaceData, StandInServer
+from scripts.synthetic_space import SpaceGenerator, build_snapshot
+from scripts.transformers.blog_post_transformer import BlogPostTransformer
+from tests.test_contentful_client import make_paged_session, make_raw_entry, make_response
+
+
+def make_client(session, cassette, **kwargs):
+    """Create a ContentfulClient with a cassette, mocked SDK and HTTP session."""
+    sdk = Mock()
+    sdk.default_locale = 'en-US'
+    with patch.object(ContentfulClient, '_initialize_client', return_value=sdk), \
+            patch.object(ContentfulClient, '_load_content_types'):
+        client = ContentfulClient(
+            'space',
+            'token',
+            rate_limiter=RateLimiter(rate=1000, sleep=lambda seconds: None),
+            cassette=cassette,
+            **kwargs
+        )
+    client._session = session
+    return client
+
+
+class TestCassette:
+    """Test suite for Cassette."""
+
+    def setup_method(self):
+        """Create temporary cassette directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'build.json.gz')
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_recorded_responses_replay_after_reload(self):
+        """Test that saved interactions are found regardless of query order."""
+        # Arrange
+        recorder = Cassette(self.path, mode='record')
+        recorder.record('/entries', {'content_type': 'blogPage', 'include': 2}, {'items': [1]})
+        recorder.save()
+        player = Cassette(self.path, mode='replay')
+
+        # Act
+        loaded = player.load()
+        body = player.play('/entries', {'include': 2, 'content_type': 'blogPage'})
+
+        # Assert
+        assert loaded == 1
+        assert body == {'items': [1]}
+        assert player.get_stats() == {'interactions': 1, 'played': 1, 'misses': 0}
+
+    def test_unrecorded_request_raises(self):
+        """Test that replay fails loudly for requests it never saw."""
+        # Arrange
+        player = Cassette(self.path, mode='replay')
+
+        # Act / Assert
+        with pytest.raises(CassetteMissError):
+            player.play('/entries', {'content_type': 'profile'})
+        assert player.get_stats()['misses'] == 1
+
+    def test_replay_simulates_latency(self):
+        """Test that every replayed request sleeps for the configured latency."""
+        # Arrange
+        sleep = Mock()
+        player = Cassette(self.path, mode='replay', latency=0.25, sleep=sleep)
+        player.record('/entries', {}, {'items': []})
+
+        # Act
+        player.play('/entries', {})
+
+        # Assert
+        sleep.assert_called_once_with(0.25)
+
+    def test_unknown_mode_rejected(self):
+        """Test that only record and replay modes are accepted."""
+        with pytest.raises(ValueError):
+            Cassette(self.path, mode='rewind')
+
+    def test_recorded_body_isolated_from_caller(self):
+        """Test that hydrating the caller's body after recording does not reach the cassette."""
+        # Arrange
+        recorder = Cassette(self.path, mode='record')
+        body = {'items': [{'sys': {'id': 'a'}}]}
+        recorder.record('/entries', {}, body)
+
+        # Act
+        body['items'][0]['sys'] = object()
+        recorder.save()
+        player = Cassette(self.path, mode='replay')
+        player.load()
+        played = player.play('/entries', {})
+        played['items'].clear()
+
+        # Assert
+        assert player.play('/entries', {}) == {'items': [{'sys': {'id': 'a'}}]}
+
+    def test_unserializable_body_not_fatal(self):
+        """Test that a body that cannot be serialized is logged, not raised."""
+        # Arrange
+        recorder = Cassette(self.path, mode='record')
+        recorder.record('/entries', {}, {'items': [object()]})
+
+        # Act
+        recorder.save()
+
+        # Assert
+        assert not os.path.exists(self.path)
+
+    def test_replay_needs_no_access_token(self):
+        """Test that config validation accepts a missing token when replaying."""
+        with patch.object(config, 'CONTENTFUL_MODE', 'production'), \
+                patch.object(config, 'CONTENTFUL_ACCESS_TOKEN', ''), \
+                patch.object(config, 'CONTENTFUL_CASSETTE', self.path), \
+                patch.object(config, 'CONTENTFUL_CASSETTE_MODE', 'replay'):
+            config.validate_config()
+
+            with patch.object(config, 'CONTENTFUL_CASSETTE_MODE', 'record'):
+                with pytest.raises(EnvironmentError):
+                    config.validate_config()
+
+
+class TestClientCassette:
+    """Test suite for ContentfulClient with a cassette."""
+
+    def setup_method(self):
+        """Create temporary cassette directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'build.json.gz')
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_replay_serves_recorded_build_offline(self):
+        """Test that a replayed client returns the recorded entries without HTTP."""
+        # Arrange
+        recording = make_client(make_paged_session(total=250), Cassette(self.path, mode='record'))
+        recorded_ids = [e.id for e in recording.get_entries('blogPage', locale='en-US')]
+        recording.close()
+
+        offline = Mock()
+        offline.get.side_effect = AssertionError('network used during replay')
+        player = Cassette(self.path, mode='replay')
+        player.load()
+        replaying = make_client(offline, player)
+
+        # Act
+        replayed_ids = [e.id for e in replaying.get_entries('blogPage', locale='en-US')]
+
+        # Assert
+        assert replayed_ids == recorded_ids
+        assert len(replayed_ids) == 250
+        offline.get.assert_not_called()
+        assert replaying.get_cache_stats()['api_calls'] == 3
+
+    def test_content_types_replayed_into_sdk_cache(self):
+        """Test that recorded content types fill the SDK's coercion cache."""
+        # Arrange
+        player = Cassette(self.path, mode='replay')
+        player.record('/content_types', {'limit': 1000}, {
+            'sys': {'type': 'Array'},
+            'items': [{
+                'sys': {'id': 'blogPage', 'type': 'ContentType'},
+                'name': 'Blog Page',
+                'fields': [{'id': 'title', 'name': 'Title', 'type': 'Symbol'}]
+            }]
+        })
+        client = make_client(Mock(), player)
+
+        # Act
+        with patch('scripts.contentful_client.client.ContentTypeCache') as cache:
+            client._load_content_types()
+
+        # Assert
+        assert [ct.id for ct in cache.__CACHE__] == ['blogPage']
+
+    def test_sync_pages_go_through_cassette(self):
+        """Test that Sync API pages are recorded and replayed."""
+        # Arrange
+        session = Mock()
+        session.get.return_value = make_response(body={
+            'items': [make_raw_entry('a')],
+            'nextSyncUrl': 'https://cdn.contentful.com/spaces/space/sync?sync_token=tok-2'
+        })
+        player = Cassette(self.path, mode='replay')
+        player.record('/sync', {'initial': 'true'}, session.get.return_value.json.return_value)
+        store = SyncStore(self.temp_dir, space_id='space')
+        client = make_client(session, player, sync_store=store)
+
+        # Act
+        stats = client.sync()
+
+        # Assert
+        assert stats['upserted'] == 1
+        assert store.next_sync_token == 'tok-2'
+        session.get.assert_not_called()
+
+
+class TestModeParity:
+    """Test suite comparing SDK and raw-JSON entries replayed from one cassette."""
+
+    def setup_method(self):
+        """Record a synthetic space's blog posts through the stand-in server."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'build.json.gz')
+        self.content_types = ContentTypeCache.__CACHE__
+
+        space = SpaceGenerator(posts=6, paragraphs=4, seed=3).generate()
+        server = StandInServer(SpaceData.from_dict(build_snapshot(space, 'synthetic')))
+        server.start()
+        try:
+            recording = self.make_client(Cassette(self.path, mode='record'), api_url=server.url)
+            self.transform(recording)
+            recording.close()
+        finally:
+            server.stop()
+
+    def teardown_method(self):
+        """Restore the SDK content type cache and clean up."""
+        ContentTypeCache.__CACHE__ = self.content_types
+        shutil.rmtree(self.temp_dir)
+
+    def make_client(self, cassette, **kwargs):
+        """Create a client whose content types go through the cassette (SDK mocked)."""
+        sdk = Mock()
+        sdk.default_locale = 'en-US'
+        with patch.object(ContentfulClient, '_initialize_client', return_value=sdk):
+            return ContentfulClient(
+                'space',
+                'token',
+                rate_limiter=RateLimiter(rate=1000, sleep=lambda seconds: None),
+                cassette=cassette,
+                **kwargs
+            )
+
+    def transform(self, client):
+        """Fetch and transform every blog post the client returns."""
+        transformer = BlogPostTransformer(client, 'en-US')
+        entries = client.get_entries(
+            content_type=transformer.content_type,
+            locale='en-US',
+            include=transformer.include_depth
+        )
+        return entries, [transformer.transform_single(entry) for entry in entries]
+
+    def replay(self, raw_entries):
+        """Fetch and transform the recorded posts offline in SDK or raw mode."""
+        player = Cassette(self.path, mode='replay')
+        player.load()
+        return self.transform(self.make_client(player, raw_entries=raw_entries))
+
+    def test_raw_entries_transform_like_sdk_entries(self):
+        """Test that both entry modes produce identical posts from the same responses."""
+        # Act
+        _, sdk_posts = self.replay(raw_entries=False)
+        raw_entries, raw_posts = self.replay(raw_entries=True)
+
+        # Assert
+        embedded = [
+            node['data']['target']
+            for entry in raw_entries
+            for node in entry.fields()['text']['content']
+            if node['nodeType'] == 'embedded-asset-block'
+        ]
+        assert embedded
+        assert all(isinstance(target, RawAsset) for target in embedded)
+        assert len(sdk_posts) == 6
+        assert raw_posts == sdk_posts
@@ -0,0 +1,80 @@
+"""
+Unit tests for the build change set.
+Tests outcome tracking, the change summary, and the output digest.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from scripts.writers.change_set import ChangeSet
+from scripts.writers.content_hash import ADDED, MODIFIED, UNCHANGED, output_digest, write_if_changed
+
+
+class TestChangeSet:
+    """Test suite for ChangeSet and the output digest."""
+
+    def setup_method(self):
+        """Create a temporary output folder."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, '_data')
+        os.makedirs(self.root)
+        self.path = os.path.join(self.root, 'profile-en.yml')
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_write_if_changed_statuses(self):
+        """Test that writes report added, unchanged and modified."""
+        assert write_if_changed(self.path, 'name: a\n') == ADDED
+        assert write_if_changed(self.path, 'name: a\n') == UNCHANGED
+        assert write_if_changed(self.path, 'name: b\n') == MODIFIED
+
+    def test_unchanged_build_reports_no_changes(self):
+        """Test that a set with only unchanged files is not changed."""
+        # Arrange
+        changes = ChangeSet()
+        changes.record(self.path, UNCHANGED)
+
+        # Act
+        summary = changes.summary([self.root])
+
+        # Assert
+        assert not summary['changed']
+        assert summary['unchanged'] == 1
+        assert summary['added'] == summary['modified'] == summary['removed'] == []
+        assert changes.changed_paths() == []
+
+    def test_save_writes_summary(self):
+        """Test that the saved summary lists changed paths and digests the output."""
+        # Arrange
+        changes = ChangeSet()
+        changes.record(self.path, write_if_changed(self.path, 'name: a\n'))
+        summary_path = os.path.join(self.temp_dir, 'build', 'changes.json')
+
+        # Act
+        changes.save(summary_path, [self.root])
+
+        # Assert
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            summary = json.load(f)
+        assert summary['changed']
+        assert summary['added'] == [os.path.normpath(self.path)]
+        assert summary['digest'] == output_digest([self.root])
+
+    def test_output_digest_tracks_content(self):
+        """Test that the digest is stable for identical output and changes with it."""
+        # Arrange
+        write_if_changed(self.path, 'name: a\n')
+        before = output_digest([self.root, os.path.join(self.temp_dir, 'missing')])
+
+        # Act
+        same = output_digest([self.root])
+        write_if_changed(self.path, 'name: b\n')
+        after = output_digest([self.root])
+
+        # Assert
+        assert before == same
+        assert after != before
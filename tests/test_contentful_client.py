@@ -0,0 +1,694 @@
+"""
+Unit tests for ContentfulClient.
+Tests pagination, caching, and request accounting against a mocked SDK.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_client.http_cache import HttpCache
+from scripts.contentful_client.rate_limiter import RateLimiter
+
+
+def make_raw_entry(entry_id, content_type='blogPage'):
+    """Build a raw single-locale entry payload."""
+    return {
+        'sys': {
+            'id': entry_id,
+            'type': 'Entry',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        },
+        'fields': {'title': entry_id}
+    }
+
+
+def make_response(status_code=200, body=None, headers=None):
+    """Build a mock requests.Response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    return response
+
+
+def make_paged_session(total):
+    """Create a mock session whose get() serves `total` entries in pages."""
+    session = Mock()
+
+    def get(url, params=None, headers=None, timeout=None):
+        skip, limit = params['skip'], params['limit']
+        items = [make_raw_entry(f"entry-{i}") for i in range(skip, min(skip + limit, total))]
+        return make_response(body={
+            'sys': {'type': 'Array'},
+            'total': total,
+            'skip': skip,
+            'limit': limit,
+            'items': items
+        })
+
+    session.get.side_effect = get
+    return session
+
+
+def make_client(session, **kwargs):
+    """Create a ContentfulClient wired to a mocked SDK and HTTP session."""
+    sdk = Mock()
+    sdk.default_locale = 'en-US'
+    kwargs.setdefault('rate_limiter', RateLimiter(rate=1000, sleep=lambda seconds: None))
+    with patch.object(ContentfulClient, '_initialize_client', return_value=sdk):
+        client = ContentfulClient('space', 'token', **kwargs)
+    client._session = session
+    return client
+
+
+class TestPagination:
+    """Test suite for automatic collection pagination."""
+
+    def test_single_page_collection(self):
+        """Test that small collections need exactly one request."""
+        # Arrange
+        session = make_paged_session(total=3)
+        client = make_client(session, page_size=100)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='en-US')
+
+        # Assert
+        assert [e.id for e in entries] == ['entry-0', 'entry-1', 'entry-2']
+        assert session.get.call_count == 1
+        assert client.get_cache_stats()['api_calls'] == 1
+
+    def test_collection_sized_from_response_bodies(self):
+        """Test that a fetched collection is cached at its response byte size, not re-serialized."""
+        # Arrange
+        session = make_paged_session(total=250)
+        serve = session.get.side_effect
+
+        def get_with_content(url, **kwargs):
+            response = serve(url, **kwargs)
+            response.content = b'x' * 1000
+            return response
+
+        session.get.side_effect = get_with_content
+        client = make_client(session, page_size=100)
+        client._cache._sizeof = Mock(return_value=1)
+
+        # Act
+        client.get_entries('blogPage', locale='en-US')
+
+        # Assert
+        client._cache._sizeof.assert_not_called()
+        assert client.get_cache_stats()['resident_bytes'] == 3000
+
+    def test_all_pages_fetched_in_order(self):
+        """Test that collections larger than one page are complete and ordered."""
+        # Arrange
+        session = make_paged_session(total=250)
+        client = make_client(session, page_size=100, page_concurrency=3)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='en-US')
+
+        # Assert
+        assert [e.id for e in entries] == [f"entry-{i}" for i in range(250)]
+        queries = [call[1]['params'] for call in session.get.call_args_list]
+        assert sorted(q['skip'] for q in queries) == [0, 100, 200]
+        assert all(q['order'] == 'sys.id' for q in queries)
+
+    def test_remaining_pages_fetched_concurrently(self):
+        """Test that pages after the first run in parallel up to the limit."""
+        # Arrange
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+        session = make_paged_session(total=500)
+        serve = session.get.side_effect
+
+        def tracking_get(url, **kwargs):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            try:
+                time.sleep(0.05)
+                return serve(url, **kwargs)
+            finally:
+                with lock:
+                    active['now'] -= 1
+
+        session.get.side_effect = tracking_get
+        client = make_client(session, page_size=100, page_concurrency=2)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='en-US')
+
+        # Assert
+        assert len(entries) == 500
+        assert active['peak'] == 2
+
+    def test_page_size_capped_at_api_maximum(self):
+        """Test that page size never exceeds Contentful's 1000 limit."""
+        client = make_client(make_paged_session(total=0), page_size=5000)
+
+        assert client.page_size == 1000
+
+
+class TestEntryStreaming:
+    """Test suite for page-by-page collection streaming."""
+
+    def test_pages_yielded_in_order_without_caching(self):
+        """Test that streamed pages arrive in skip order and are not cached."""
+        # Arrange
+        session = make_paged_session(total=250)
+        client = make_client(session, page_size=100, page_concurrency=3)
+
+        # Act
+        pages = [[e.id for e in page] for page in client.iter_entry_pages('blogPage', locale='en-US')]
+
+        # Assert
+        assert [len(page) for page in pages] == [100, 100, 50]
+        assert sum(pages, []) == [f"entry-{i}" for i in range(250)]
+        assert client.get_cache_stats()['cached_requests'] == 0
+
+    def test_read_ahead_bounded_by_page_concurrency(self):
+        """Test that no more than page_concurrency pages are fetched ahead."""
+        # Arrange
+        session = make_paged_session(total=1000)
+        client = make_client(session, page_size=100, page_concurrency=2)
+        stream = client.iter_entry_pages('blogPage', locale='en-US')
+
+        # Act
+        next(stream)
+        next(stream)
+        time.sleep(0.05)
+        requested = session.get.call_count
+        stream.close()
+
+        # Assert
+        assert requested <= 4
+
+    def test_cached_collection_streamed_from_memory(self):
+        """Test that an already cached collection needs no new requests."""
+        # Arrange
+        session = make_paged_session(total=30)
+        client = make_client(session, page_size=10)
+        client.get_entries('blogPage', locale='en-US')
+
+        # Act
+        pages = list(client.iter_entry_pages('blogPage', locale='en-US'))
+
+        # Assert
+        assert [len(page) for page in pages] == [10, 10, 10]
+        assert session.get.call_count == 3
+
+
+class TestSingleFlight:
+    """Test suite for coalescing identical concurrent get_entries() calls."""
+
+    def test_concurrent_identical_requests_share_one_fetch(self):
+        """Test that parallel callers for one key make a single API call."""
+        # Arrange
+        session = make_paged_session(total=3)
+        serve = session.get.side_effect
+
+        def slow_get(url, **kwargs):
+            time.sleep(0.05)
+            return serve(url, **kwargs)
+
+        session.get.side_effect = slow_get
+        client = make_client(session)
+        barrier = threading.Barrier(4)
+        results = []
+
+        def fetch():
+            barrier.wait()
+            results.append(client.get_entries('blogPage', 'en-US'))
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert session.get.call_count == 1
+        assert all(result is results[0] for result in results)
+        stats = client.get_cache_stats()
+        assert stats['cache_misses'] == 1
+        assert stats['coalesced_requests'] == 3
+
+    def test_cache_hits_counted(self):
+        """Test that later calls are reported as cache hits."""
+        # Arrange
+        client = make_client(make_paged_session(total=1))
+
+        # Act
+        client.get_entries('blogPage', 'en-US')
+        client.get_entries('blogPage', 'en-US')
+
+        # Assert
+        stats = client.get_cache_stats()
+        assert stats['cache_misses'] == 1
+        assert stats['cache_hits'] == 1
+        assert stats['coalesced_requests'] == 0
+
+
+class TestIncludeSuperset:
+    """Test suite for serving shallow requests from deeper cached responses."""
+
+    def test_deeper_response_serves_shallower_request(self):
+        """Test that include=2 is answered by a cached include=10 response."""
+        # Arrange
+        session = make_paged_session(total=2)
+        client = make_client(session)
+        deep = client.get_entries('homePage', 'en-US', include=10)
+
+        # Act
+        shallow = client.get_entries('homePage', 'en-US', include=2)
+
+        # Assert
+        assert shallow is deep
+        assert session.get.call_count == 1
+
+    def test_shallower_response_not_reused_for_deeper_request(self):
+        """Test that include=10 is fetched even when include=2 is cached."""
+        # Arrange
+        session = make_paged_session(total=2)
+        client = make_client(session)
+        client.get_entries('homePage', 'en-US', include=2)
+
+        # Act
+        client.get_entries('homePage', 'en-US', include=10)
+
+        # Assert
+        assert session.get.call_count == 2
+
+    def test_superset_requires_same_filters(self):
+        """Test that a filtered request never reuses an unfiltered response."""
+        # Arrange
+        session = make_paged_session(total=2)
+        client = make_client(session)
+        client.get_entries('blogPage', 'en-US', include=10)
+
+        # Act
+        client.get_entries('blogPage', 'en-US', include=2, filters={'fields.url': 'a'})
+
+        # Assert
+        assert session.get.call_count == 2
+
+
+class TestMemoryBudget:
+    """Test suite for the client's cache byte budget."""
+
+    def test_budget_evicts_and_reports(self):
+        """Test that evictions and resident bytes surface in get_cache_stats()."""
+        # Arrange
+        client = make_client(make_paged_session(total=20), cache_max_bytes=6000)
+
+        # Act
+        for content_type in ('blogPage', 'profile', 'homePage', 'seo', 'orHeader'):
+            client.get_entries(content_type, 'en-US')
+
+        # Assert
+        stats = client.get_cache_stats()
+        assert 0 < stats['resident_bytes'] <= 6000
+        assert stats['evictions'] > 0
+        assert stats['cached_requests'] < 5
+
+
+class TestFieldProjection:
+    """Test suite for select= on collection fetches."""
+
+    def test_select_sent_for_projected_type(self):
+        """Test that registered fields become the select parameter."""
+        # Arrange
+        session = make_paged_session(total=1)
+        client = make_client(session)
+        client.set_field_projection('blogPage', ['title', 'seo'])
+        client.set_field_projection('blogPage', ['seo', 'url'])
+
+        # Act
+        client.get_entries('blogPage', 'en-US')
+
+        # Assert
+        params = session.get.call_args[1]['params']
+        assert params['select'] == 'sys,fields.title,fields.seo,fields.url'
+
+    def test_unprojected_type_fetches_all_fields(self):
+        """Test that types without a projection send no select."""
+        # Arrange
+        session = make_paged_session(total=1)
+        client = make_client(session)
+
+        # Act
+        client.get_entries('profile', 'en-US')
+
+        # Assert
+        assert 'select' not in session.get.call_args[1]['params']
+
+    def test_raw_page_with_and_without_projection(self):
+        """Test that get_raw_page() applies the projection only when asked to."""
+        # Arrange
+        session = make_paged_session(total=1)
+        client = make_client(session)
+        client.set_field_projection('blogPage', ['title'])
+
+        # Act
+        body = client.get_raw_page('blogPage', 'en-US', include=1)
+        projected = session.get.call_args[1]['params']
+        client.get_raw_page('blogPage', 'en-US', include=3, projected=False)
+        full = session.get.call_args[1]['params']
+
+        # Assert
+        assert body['items'][0]['sys']['id'] == 'entry-0'
+        assert (projected['select'], projected['include']) == ('sys,fields.title', 1)
+        assert 'select' not in full and full['include'] == 3
+
+
+class TestHttpCache:
+    """Test suite for ETag revalidation through the disk cache."""
+
+    def setup_method(self):
+        """Create temporary cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.http_cache = HttpCache(self.temp_dir, space_id='space')
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_not_modified_served_from_disk(self):
+        """Test that a 304 reuses the stored body from a previous build."""
+        # Arrange
+        body = {'sys': {'type': 'Array'}, 'total': 1, 'items': [make_raw_entry('post-1')]}
+        cold_session = Mock()
+        cold_session.get.return_value = make_response(body=body, headers={'ETag': '"v1"'})
+        make_client(cold_session, http_cache=self.http_cache).get_entries('blogPage', 'en-US')
+
+        warm_session = Mock()
+        warm_session.get.return_value = make_response(status_code=304)
+        warm_client = make_client(warm_session, http_cache=self.http_cache)
+
+        # Act
+        entries = warm_client.get_entries('blogPage', 'en-US')
+
+        # Assert
+        assert [e.id for e in entries] == ['post-1']
+        sent_headers = warm_session.get.call_args[1]['headers']
+        assert sent_headers['If-None-Match'] == '"v1"'
+        assert warm_client.get_cache_stats()['not_modified'] == 1
+
+    def test_key_scoped_by_mode(self):
+        """Test that production and preview responses never share entries."""
+        # Arrange
+        preview_cache = HttpCache(self.temp_dir, space_id='space', mode='preview')
+        query = {'content_type': 'blogPage', 'locale': 'en-US', 'include': 2}
+
+        # Act / Assert
+        assert self.http_cache.make_key('/entries', query) != preview_cache.make_key('/entries', query)
+
+    def test_response_without_etag_not_stored(self):
+        """Test that responses without an ETag are not cached."""
+        # Act
+        self.http_cache.put('key', None, {'items': []})
+
+        # Assert
+        assert self.http_cache.get('key') is None
+
+    def test_failed_write_leaves_no_temp_file(self):
+        """Test that a failed cache write is ignored and cleans up its temp file."""
+        # Arrange
+        with patch('scripts.contentful_client.http_cache.os.replace', side_effect=OSError('disk full')):
+            # Act
+            self.http_cache.put('key', '"v1"', {'items': []})
+
+        # Assert
+        assert self.http_cache.get('key') is None
+        assert os.listdir(self.temp_dir) == []
+
+
+class TestRateLimitRetry:
+    """Test suite for 429 handling on the raw request path."""
+
+    def test_retries_once_after_reset(self):
+        """Test that a 429 is retried after X-Contentful-RateLimit-Reset."""
+        # Arrange
+        body = {'sys': {'type': 'Array'}, 'total': 0, 'items': []}
+        session = Mock()
+        session.get.side_effect = [
+            make_response(status_code=429, headers={'X-Contentful-RateLimit-Reset': '0'}),
+            make_response(body=body)
+        ]
+        client = make_client(session)
+
+        # Act
+        entries = client.get_entries('blogPage', 'en-US')
+
+        # Assert
+        assert entries == []
+        assert session.get.call_count == 2
+        assert client.get_cache_stats()['throttled_requests'] == 1
+
+    def test_raises_after_retries_exhausted(self):
+        """Test that persistent 503s surface as an API error."""
+        # Arrange
+        session = Mock()
+        session.get.return_value = make_response(status_code=503)
+        client = make_client(
+            session,
+            rate_limiter=RateLimiter(rate=1000, max_retries=2, sleep=lambda seconds: None)
+        )
+
+        # Act / Assert
+        with pytest.raises(Exception):
+            client.get_entries('blogPage', 'en-US')
+        assert session.get.call_count == 3
+
+
+class TestMultiLocale:
+    """Test suite for locale='*' fetches with local demultiplexing."""
+
+    def test_one_request_serves_every_locale(self):
+        """Test that en-US and es share a single locale='*' request."""
+        # Arrange
+        body = {
+            'sys': {'type': 'Array'},
+            'total': 1,
+            'items': [{
+                'sys': {
+                    'id': 'post-1',
+                    'type': 'Entry',
+                    'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'blogPage'}}
+                },
+                'fields': {
+                    'title': {'en-US': 'Hello', 'es': 'Hola'},
+                    'author': {'en-US': 'Jane'},
+                    'seo': {'en-US': {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'seo-1'}}}
+                }
+            }],
+            'includes': {'Entry': [{
+                'sys': {
+                    'id': 'seo-1',
+                    'type': 'Entry',
+                    'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'seo'}}
+                },
+                'fields': {'title': {'en-US': 'SEO', 'es': 'SEO es'}}
+            }]}
+        }
+        session = Mock()
+        session.get.return_value = make_response(body=body)
+        client = make_client(session, multi_locale=True)
+
+        # Act
+        english = client.get_entries('blogPage', 'en-US')
+        spanish = client.get_entries('blogPage', 'es')
+
+        # Assert
+        assert session.get.call_count == 1
+        assert session.get.call_args[1]['params']['locale'] == '*'
+        assert english[0].fields()['title'] == 'Hello'
+        assert spanish[0].fields()['title'] == 'Hola'
+        assert spanish[0].fields()['author'] == 'Jane'
+        assert spanish[0].fields()['seo'].fields()['title'] == 'SEO es'
+
+    def test_parallel_locales_share_all_locale_fetch(self):
+        """Test that locales requested in parallel wait on one locale='*' fetch."""
+        # Arrange
+        body = {
+            'sys': {'type': 'Array'},
+            'total': 1,
+            'items': [{
+                'sys': {
+                    'id': 'post-1',
+                    'type': 'Entry',
+                    'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'blogPage'}}
+                },
+                'fields': {'title': {'en-US': 'Hello', 'es': 'Hola'}}
+            }]
+        }
+
+        def slow_get(url, **kwargs):
+            time.sleep(0.05)
+            return make_response(body=body)
+
+        session = Mock()
+        session.get.side_effect = slow_get
+        client = make_client(session, multi_locale=True)
+        titles = {}
+
+        def fetch(locale):
+            titles[locale] = client.get_entries('blogPage', locale)[0].fields()['title']
+
+        threads = [threading.Thread(target=fetch, args=(loc,)) for loc in ('en-US', 'es')]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert session.get.call_count == 1
+        assert titles == {'en-US': 'Hello', 'es': 'Hola'}
+
+
+class TestRawEntries:
+    """Test suite for raw-JSON entries with lazy link resolution."""
+
+    def test_links_beyond_include_fetched_with_sys_id_in(self):
+        """Test that unresolved links are batch-fetched by ID in the request locale."""
+        # Arrange
+        page = {
+            'sys': {'type': 'Array'},
+            'total': 2,
+            'items': [make_raw_entry('post-1'), make_raw_entry('post-2')]
+        }
+        page['items'][0]['fields']['seo'] = {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'seo-1'}}
+        page['items'][1]['fields']['seo'] = {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'seo-2'}}
+        linked = {'items': [make_raw_entry('seo-1', 'seo'), make_raw_entry('seo-2', 'seo')]}
+
+        session = Mock()
+        session.get.side_effect = [make_response(body=page), make_response(body=linked)]
+        client = make_client(session, raw_entries=True)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='es', include=0)
+        seo_titles = [e.fields()['seo'].fields()['title'] for e in entries]
+
+        # Assert
+        assert seo_titles == ['seo-1', 'seo-2']
+        assert session.get.call_count == 2
+        params = session.get.call_args_list[1][1]['params']
+        assert session.get.call_args_list[1][0][0].endswith('/entries')
+        assert params['sys.id[in]'] == 'seo-1,seo-2'
+        assert params['locale'] == 'es'
+
+
+def make_id_session():
+    """Create a mock session that answers sys.id[in] queries, skipping 'gone-*' IDs."""
+    session = Mock()
+
+    def get(url, params=None, headers=None, timeout=None):
+        ids = params['sys.id[in]'].split(',')
+        items = [make_raw_entry(entry_id) for entry_id in ids if not entry_id.startswith('gone')]
+        return make_response(body={'sys': {'type': 'Array'}, 'total': len(items), 'items': items})
+
+    session.get.side_effect = get
+    return session
+
+
+class TestEntriesByIds:
+    """Test suite for batched lookups by entry ID."""
+
+    def test_ids_fetched_in_chunks_and_missing_marked(self):
+        """Test that IDs are split into sys.id[in] chunks and absent IDs map to None."""
+        # Arrange
+        session = make_id_session()
+        client = make_client(session)
+        ids = [f"entry-{i}" for i in range(150)] + ['gone-1']
+
+        # Act
+        entries = client.get_entries_by_ids(ids, locale='en-US')
+
+        # Assert
+        assert session.get.call_count == 2
+        chunk_sizes = sorted(
+            len(c[1]['params']['sys.id[in]'].split(',')) for c in session.get.call_args_list
+        )
+        assert chunk_sizes == [51, 100]
+        assert list(entries) == ids
+        assert entries['entry-149'].id == 'entry-149'
+        assert entries['gone-1'] is None
+
+    def test_cached_ids_not_refetched(self):
+        """Test that a second lookup only requests IDs not seen before."""
+        # Arrange
+        session = make_id_session()
+        client = make_client(session)
+        client.get_entries_by_ids(['a', 'b'], locale='en-US', include=3)
+
+        # Act
+        entries = client.get_entries_by_ids(['a', 'b', 'c'], locale='en-US', include=2)
+
+        # Assert
+        assert session.get.call_count == 2
+        assert session.get.call_args[1]['params']['sys.id[in]'] == 'c'
+        assert [e.id for e in entries.values()] == ['a', 'b', 'c']
+        assert client.get_cache_stats()['cache_hits'] == 2
+
+    def test_get_entry_uses_batch_cache(self):
+        """Test that get_entry is served from entries fetched by ID."""
+        # Arrange
+        session = make_id_session()
+        client = make_client(session)
+        client.get_entries_by_ids(['a'], locale='en-US')
+
+        # Act
+        entry = client.get_entry('a', locale='en-US')
+
+        # Assert
+        assert entry.id == 'a'
+        assert session.get.call_count == 1
+
+    def test_failed_fetch_raises(self):
+        """Test that a request failure raises instead of reporting IDs as missing."""
+        # Arrange
+        session = Mock()
+        session.get.return_value = make_response(status_code=404, body={'sys': {'id': 'NotFound'}})
+        client = make_client(session)
+
+        # Act & Assert
+        with pytest.raises(Exception):
+            client.get_entries_by_ids(['a'], locale='en-US')
+        assert client.get_entry('a', locale='en-US') is None
+
+    def test_cached_collection_serves_ids(self):
+        """Test that entries of a cached collection of the content type are not refetched."""
+        # Arrange
+        session = make_id_session()
+        id_lookup = session.get.side_effect
+        collection = make_response(body={
+            'sys': {'type': 'Array'},
+            'total': 2,
+            'items': [make_raw_entry('a'), make_raw_entry('b')]
+        })
+        session.get.side_effect = lambda url, params=None, **kwargs: (
+            id_lookup(url, params) if 'sys.id[in]' in params else collection
+        )
+        client = make_client(session)
+        client.get_entries('blogPage', locale='en-US', include=3)
+
+        # Act
+        entries = client.get_entries_by_ids(['a', 'c'], locale='en-US', include=2, content_type='blogPage')
+
+        # Assert
+        assert entries['a'].id == 'a'
+        assert session.get.call_count == 2
+        assert session.get.call_args[1]['params']['sys.id[in]'] == 'c'
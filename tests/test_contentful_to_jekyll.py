@@ -0,0 +1,412 @@
+"""
+Unit tests for build orchestration.
+Tests per-locale execution and failure accounting.
+"""
+
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from scripts.build_manifest import BuildManifest
+from scripts.contentful_client.raw_resources import build_raw_entries
+from scripts.contentful_to_jekyll import (
+    calculate_exit_code,
+    create_transformers,
+    plan_locale,
+    planned_transformers,
+    process_locale,
+    resolve_targets,
+    run_locales
+)
+from scripts.writers.data_writer import DataWriter
+from scripts.writers.file_writer import FileWriter
+
+
+def locale_stats(successful=1, failed=0):
+    """Build process_locale() statistics."""
+    return {
+        'total_entries': successful + failed,
+        'successful': successful,
+        'failed': failed,
+        'written': successful,
+        'unchanged': 0
+    }
+
+
+def make_writers(written=True):
+    """Create mocked file and data writers reporting every file as written (or unchanged)."""
+    file_writer = Mock()
+    file_writer.write_blog_post.return_value = ('_posts/en/post.md', written)
+    data_writer = Mock()
+    data_writer.write_data_file.return_value = ('_data/data-en.yml', written)
+    return file_writer, data_writer
+
+
+class TestRunLocales:
+    """Test suite for run_locales()."""
+
+    def test_locales_run_concurrently(self):
+        """Test that locales overlap when concurrency allows it."""
+        # Arrange
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def process(client, locale, file_writer, data_writer, transformers, manifest=None, targets=None):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            time.sleep(0.05)
+            with lock:
+                active['now'] -= 1
+            return locale_stats()
+
+        # Act
+        with patch('scripts.contentful_to_jekyll.process_locale', side_effect=process):
+            results = run_locales(Mock(), ['en-US', 'es', 'fr'], Mock(), Mock(), {}, concurrency=3)
+
+        # Assert
+        assert list(results) == ['en-US', 'es', 'fr']
+        assert active['peak'] == 3
+
+    def test_sequential_by_default(self):
+        """Test that concurrency 1 processes one locale at a time, in order."""
+        # Arrange
+        order = []
+
+        def process(client, locale, file_writer, data_writer, transformers, manifest=None, targets=None):
+            order.append(locale)
+            return locale_stats()
+
+        # Act
+        with patch('scripts.contentful_to_jekyll.process_locale', side_effect=process):
+            run_locales(Mock(), ['en-US', 'es'], Mock(), Mock(), {})
+
+        # Assert
+        assert order == ['en-US', 'es']
+
+    def test_failed_locale_reported_as_none(self):
+        """Test that a locale raising does not stop the others."""
+        # Arrange
+        def process(client, locale, file_writer, data_writer, transformers, manifest=None, targets=None):
+            if locale == 'es':
+                raise RuntimeError('boom')
+            return locale_stats(successful=4, failed=1)
+
+        # Act
+        with patch('scripts.contentful_to_jekyll.process_locale', side_effect=process):
+            results = run_locales(Mock(), ['en-US', 'es'], Mock(), Mock(), {}, concurrency=2)
+
+        # Assert
+        assert results['es'] is None
+        assert results['en-US']['failed'] == 1
+
+
+class TestCalculateExitCode:
+    """Test suite for the failure threshold."""
+
+    def test_threshold(self):
+        """Test that 10% or more failures abort the deployment."""
+        assert calculate_exit_code({'total_entries': 0, 'failed_transformations': 0}) == 0
+        assert calculate_exit_code({'total_entries': 20, 'failed_transformations': 1}) == 0
+        assert calculate_exit_code({'total_entries': 10, 'failed_transformations': 1}) == 1
+
+
+class TestPlanLocale:
+    """Test suite for planning a locale's prefetch."""
+
+    def test_header_and_footer_not_planned(self):
+        """Test that header/footer come from the homepage fetch, not their own needs."""
+        # Arrange
+        transformers = create_transformers(Mock(), 'en-US')
+
+        # Act
+        plan = plan_locale(planned_transformers(transformers), 'en-US')
+
+        # Assert
+        content_types = {need.content_type for need in plan.needs}
+        assert 'orHeader' not in content_types
+        assert 'orFooter' not in content_types
+        assert len(plan.fetches) == len(plan.needs)
+
+
+class TestResolveTargets:
+    """Test suite for mapping changed entries to outputs."""
+
+    def make_manifest(self, tmp_path):
+        """Create a manifest where a menu item feeds header and footer."""
+        manifest = BuildManifest(str(tmp_path / 'manifest.json'), space_id='space')
+        for name in ('header', 'footer', 'profile'):
+            path = tmp_path / f"{name}-en.yml"
+            path.write_text(name)
+            sources = {'Entry:home': '1@t', 'Entry:menu-1': '1@t'} if name != 'profile' else {'Entry:me': '1@t'}
+            manifest.record(f"en-US:data:{name}", 'en-US', sources, 'code', [str(path)])
+        return manifest
+
+    def test_referenced_entry_maps_to_outputs(self, tmp_path):
+        """Test that a linked entry targets every output built from it."""
+        manifest = self.make_manifest(tmp_path)
+
+        targets = resolve_targets(manifest, ['menu-1'])
+
+        assert targets == {'en-US:data:header', 'en-US:data:footer'}
+
+    def test_full_build_fallbacks(self, tmp_path):
+        """Test that unknown IDs, missing outputs or no manifest mean a full build."""
+        manifest = self.make_manifest(tmp_path)
+
+        assert resolve_targets(None, ['menu-1']) is None
+        assert resolve_targets(manifest, ['new-post']) is None
+
+        os.remove(tmp_path / 'profile-en.yml')
+        assert resolve_targets(manifest, ['menu-1']) is None
+
+
+class TestProcessLocale:
+    """Test suite for the per-locale build graph."""
+
+    def make_transformers(self):
+        """Create mocked transformers serving one entry each."""
+        transformers = {}
+        for role in ('blog', 'blog_listing', 'profile', 'homepage'):
+            transformer = Mock()
+            transformer.content_type = role
+            transformer.locale = 'en-US'
+            transformer.client.get_entries.return_value = [Mock(id=f"{role}-1")]
+            transformer.transform_single.return_value = {'name': role}
+            transformers[role] = transformer
+        posts = [Mock(id=f"post-{i}") for i in range(3)]
+        transformers['blog'].client.get_entries.return_value = posts
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, {'frontmatter': {}}) for entry in entries
+        ]
+        transformers['homepage'].extract_header.return_value = {'brand_url': '/'}
+        transformers['homepage'].extract_footer.return_value = {'brand_url': '/'}
+        return transformers
+
+    def test_every_output_written(self):
+        """Test that posts and all data files are written and counted."""
+        # Arrange
+        file_writer, data_writer = make_writers()
+
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, self.make_transformers())
+
+        # Assert
+        written = sorted(call.args[1] for call in data_writer.write_data_file.call_args_list)
+        assert written == ['blog-page', 'footer', 'header', 'homepage', 'profile']
+        assert stats == {'total_entries': 8, 'successful': 8, 'failed': 0, 'written': 8, 'unchanged': 0}
+
+    def test_identical_files_counted_unchanged(self):
+        """Test that files the writers left untouched are reported as unchanged."""
+        # Arrange
+        file_writer, data_writer = make_writers(written=False)
+
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, self.make_transformers())
+
+        # Assert
+        assert stats == {'total_entries': 8, 'successful': 8, 'failed': 0, 'written': 0, 'unchanged': 8}
+
+    def test_failed_post_transform_counted(self):
+        """Test that a post that fails to transform counts as failed."""
+        # Arrange
+        file_writer, data_writer = make_writers()
+        transformers = self.make_transformers()
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, None if entry.id == 'post-1' else {'frontmatter': {}}) for entry in entries
+        ]
+
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, transformers)
+
+        # Assert
+        assert file_writer.write_blog_post.call_count == 2
+        assert stats == {'total_entries': 8, 'successful': 7, 'failed': 1, 'written': 7, 'unchanged': 0}
+
+    def test_failed_streamed_post_counted(self):
+        """Test that a streamed post that fails to transform counts as failed."""
+        # Arrange
+        file_writer, data_writer = make_writers()
+        transformers = self.make_transformers()
+
+        def transform_stream(stats, skip=None):
+            stats.update({'total': 3, 'success': 2, 'failed': 1, 'skipped': 0, 'complete': True})
+            return [(Mock(id='post-0'), {'frontmatter': {}}), (Mock(id='post-2'), {'frontmatter': {}})]
+
+        transformers['blog'].transform_stream.side_effect = transform_stream
+
+        # Act
+        with patch('scripts.contentful_to_jekyll.CONTENTFUL_STREAM_POSTS', True):
+            stats = process_locale(Mock(), 'en-US', file_writer, data_writer, transformers)
+
+        # Assert
+        assert stats == {'total_entries': 8, 'successful': 7, 'failed': 1, 'written': 7, 'unchanged': 0}
+
+    def test_failed_fetch_skips_dependent_outputs(self):
+        """Test that a failed homepage fetch fails homepage, header and footer only."""
+        # Arrange
+        transformers = self.make_transformers()
+        transformers['homepage'].client.get_entries.side_effect = RuntimeError('API down')
+        file_writer, data_writer = make_writers()
+
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, transformers)
+
+        # Assert
+        written = sorted(call.args[1] for call in data_writer.write_data_file.call_args_list)
+        assert written == ['blog-page', 'profile']
+        assert stats == {'total_entries': 8, 'successful': 5, 'failed': 3, 'written': 5, 'unchanged': 0}
+
+    def test_missing_singleton_not_counted(self):
+        """Test that an empty content type writes nothing and is not a failure."""
+        # Arrange
+        transformers = self.make_transformers()
+        transformers['profile'].client.get_entries.return_value = []
+        file_writer, data_writer = make_writers()
+
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, transformers)
+
+        # Assert
+        assert stats == {'total_entries': 7, 'successful': 7, 'failed': 0, 'written': 7, 'unchanged': 0}
+
+    def test_unchanged_outputs_skipped_with_manifest(self, tmp_path):
+        """Test that a second build with the same entries transforms and writes nothing."""
+        # Arrange
+        def raw_entry(entry_id, revision=1):
+            return {
+                'sys': {'id': entry_id, 'type': 'Entry', 'revision': revision, 'locale': 'en-US'},
+                'fields': {}
+            }
+        
+        transformers = self.make_transformers()
+        for role, transformer in transformers.items():
+            transformer.include_depth = 1
+            entries = [raw_entry(f"{role}-{i}") for i in range(3 if role == 'blog' else 1)]
+            transformer.client.get_entries.return_value = build_raw_entries(
+                [{'items': entries}], 'en-US'
+            )
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, {'frontmatter': {'slug': entry.id, 'publish_date': '2026-01-01'}, 'body': ''})
+            for entry in entries
+        ]
+        file_writer = FileWriter(str(tmp_path))
+        data_writer = DataWriter(str(tmp_path))
+        manifest = BuildManifest(str(tmp_path / 'manifest.json'), space_id='space')
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        os.remove(tmp_path / '_data' / 'profile-en.yml')
+        for transformer in transformers.values():
+            transformer.reset_mock()
+        transformers['homepage'].extract_header.reset_mock()
+        
+        # Act
+        stats = process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        
+        # Assert
+        assert transformers['blog'].transform_each.call_args.args[0] == []
+        assert transformers['homepage'].transform_single.call_count == 0
+        assert transformers['homepage'].extract_header.call_count == 0
+        assert transformers['profile'].transform_single.call_count == 1
+        assert stats == {'total_entries': 8, 'successful': 8, 'failed': 0, 'written': 1, 'unchanged': 0}
+        assert manifest.get_stats() == {'skipped': 7, 'rebuilt': 9}
+
+    def test_targets_limit_stages(self):
+        """Test that a targeted build fetches and writes only the targeted outputs."""
+        # Arrange
+        transformers = self.make_transformers()
+        post = Mock(id='post-1')
+        transformers['blog'].client.get_entries_by_ids.return_value = {'post-1': post}
+        file_writer, data_writer = make_writers()
+        
+        # Act
+        stats = process_locale(
+            Mock(), 'en-US', file_writer, data_writer, transformers,
+            targets={'en-US:post:post-1', 'en-US:data:header', 'es:data:profile'}
+        )
+        
+        # Assert
+        written = [call.args[1] for call in data_writer.write_data_file.call_args_list]
+        assert written == ['header']
+        assert file_writer.write_blog_post.call_count == 1
+        transformers['blog'].client.get_entries.assert_not_called()
+        transformers['profile'].client.get_entries.assert_not_called()
+        assert transformers['blog'].client.get_entries_by_ids.call_args.args[0] == ['post-1']
+        assert stats == {'total_entries': 2, 'successful': 2, 'failed': 0, 'written': 2, 'unchanged': 0}
+    
+    def test_vanished_posts_pruned_with_manifest(self, tmp_path):
+        """Test that posts whose entries are no longer fetched are deleted and forgotten."""
+        # Arrange
+        transformers = self.make_transformers()
+        transformers['blog'].include_depth = 0
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, {'frontmatter': {'slug': entry.id, 'publish_date': '2026-01-01'}, 'body': ''})
+            for entry in entries
+        ]
+        file_writer = FileWriter(str(tmp_path))
+        _, data_writer = make_writers()
+        manifest = BuildManifest(str(tmp_path / 'manifest.json'), space_id='space')
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        posts = transformers['blog'].client.get_entries.return_value
+        
+        # Act
+        transformers['blog'].client.get_entries.return_value = posts[:2]
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        transformers['blog'].client.get_entries.return_value = []
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        
+        # Assert
+        assert sorted(os.listdir(tmp_path / '_posts' / 'en')) == ['2026-01-01-post-0.md', '2026-01-01-post-1.md']
+        assert sorted(manifest.keys('en-US:post:')) == ['en-US:post:post-0', 'en-US:post:post-1']
+    
+    def test_failed_targeted_fetch_keeps_posts(self, tmp_path):
+        """Test that a failed lookup fails the post output instead of deleting the targeted posts."""
+        # Arrange
+        transformers = self.make_transformers()
+        transformers['blog'].include_depth = 0
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, {'frontmatter': {'slug': entry.id, 'publish_date': '2026-01-01'}, 'body': ''})
+            for entry in entries
+        ]
+        file_writer = FileWriter(str(tmp_path))
+        _, data_writer = make_writers()
+        manifest = BuildManifest(str(tmp_path / 'manifest.json'), space_id='space')
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        transformers['blog'].client.get_entries_by_ids.side_effect = RuntimeError('500 Server Error')
+        
+        # Act
+        stats = process_locale(
+            Mock(), 'en-US', file_writer, data_writer, transformers, manifest,
+            targets={'en-US:post:post-1'}
+        )
+        
+        # Assert
+        assert stats['failed'] == 1
+        assert calculate_exit_code({'total_entries': stats['total_entries'], 'failed_transformations': stats['failed']}) == 1
+        assert os.path.exists(tmp_path / '_posts' / 'en' / '2026-01-01-post-1.md')
+        assert 'en-US:post:post-1' in manifest.keys('en-US:post:')
+    
+    def test_targeted_post_confirmed_gone_is_pruned(self, tmp_path):
+        """Test that a targeted post the lookup did not return is deleted."""
+        # Arrange
+        transformers = self.make_transformers()
+        transformers['blog'].include_depth = 0
+        transformers['blog'].transform_each.side_effect = lambda entries: [
+            (entry, {'frontmatter': {'slug': entry.id, 'publish_date': '2026-01-01'}, 'body': ''})
+            for entry in entries
+        ]
+        file_writer = FileWriter(str(tmp_path))
+        _, data_writer = make_writers()
+        manifest = BuildManifest(str(tmp_path / 'manifest.json'), space_id='space')
+        process_locale(Mock(), 'en-US', file_writer, data_writer, transformers, manifest)
+        transformers['blog'].client.get_entries_by_ids.return_value = {'post-1': None}
+        
+        # Act
+        process_locale(
+            Mock(), 'en-US', file_writer, data_writer, transformers, manifest,
+            targets={'en-US:post:post-1'}
+        )
+        
+        # Assert
+        assert not os.path.exists(tmp_path / '_posts' / 'en' / '2026-01-01-post-1.md')
+        assert sorted(manifest.keys('en-US:post:')) == ['en-US:post:post-0', 'en-US:post:post-2']
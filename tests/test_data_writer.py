@@ -210,3 +210,19 @@ class TestDataWriter:
             
             # Zebra should come before apple (insertion order)
             assert zebra_pos < apple_pos
+    
+    def test_identical_data_not_rewritten(self):
+        """Test that identical data leaves the file untouched."""
+        # Arrange
+        writer = DataWriter()
+        data = {'name': 'Profile'}
+        path, first_written = writer.write_data_file(data, content_type='profile', locale='en')
+        os.utime(path, (0, 0))
+        
+        # Act
+        _, second_written = writer.write_data_file(data, content_type='profile', locale='en')
+        
+        # Assert
+        assert first_written
+        assert not second_written
+        assert os.path.getmtime(path) == 0
@@ -7,6 +7,7 @@ import pytest
 import os
 import tempfile
 import shutil
+from scripts.writers.change_set import ChangeSet
 from scripts.writers.file_writer import FileWriter
 
 
@@ -214,3 +215,82 @@ class TestFileWriter:
             assert 'Updated content' in content
             assert 'First Version' not in content
             assert 'First content' not in content
+    
+    def test_write_multiple_posts_consumes_generator(self):
+        """Test that posts are written as a generator yields them."""
+        # Arrange
+        writer = FileWriter()
+        written_before_next = []
+        
+        def posts():
+            for i in range(3):
+                yield {
+                    'frontmatter': {'slug': f"post-{i}", 'publish_date': '2026-01-19'},
+                    'body': 'Body'
+                }
+                written_before_next.append(len(os.listdir(os.path.join('_posts', 'en'))))
+        
+        # Act
+        counts = writer.write_multiple_posts(posts(), 'en')
+        
+        # Assert
+        assert counts == {'written': 3, 'unchanged': 0, 'failed': 0}
+        assert written_before_next == [1, 2, 3]
+    
+    def test_identical_post_not_rewritten(self):
+        """Test that rewriting identical content keeps the file's mtime."""
+        # Arrange
+        writer = FileWriter()
+        post_data = {
+            'frontmatter': {'slug': 'same-post', 'title': 'Title', 'publish_date': '2026-01-19'},
+            'body': 'Content'
+        }
+        path, first_written = writer.write_blog_post(post_data, locale='en')
+        os.utime(path, (0, 0))
+        
+        # Act
+        _, second_written = writer.write_blog_post(post_data, locale='en')
+        mtime_after_identical = os.path.getmtime(path)
+        post_data['body'] = 'Edited'
+        _, third_written = writer.write_blog_post(post_data, locale='en')
+        
+        # Assert
+        assert first_written
+        assert not second_written
+        assert mtime_after_identical == 0
+        assert third_written
+    
+    def test_write_multiple_posts_counts_unchanged(self):
+        """Test that identical posts are counted as unchanged."""
+        # Arrange
+        writer = FileWriter()
+        posts = [{'frontmatter': {'slug': f"post-{i}", 'publish_date': '2026-01-19'}, 'body': 'Body'} for i in range(2)]
+        writer.write_multiple_posts(posts[:1], 'en')
+        
+        # Act
+        counts = writer.write_multiple_posts(posts, 'en')
+        
+        # Assert
+        assert counts == {'written': 1, 'unchanged': 1, 'failed': 0}
+    
+    def test_changes_recorded(self):
+        """Test that writes and removals are recorded as added, modified, unchanged or removed."""
+        # Arrange
+        changes = ChangeSet()
+        writer = FileWriter(changes=changes)
+        post_data = {'frontmatter': {'slug': 'post', 'publish_date': '2026-01-19'}, 'body': 'Body'}
+        added, _ = writer.write_blog_post(post_data, locale='en')
+        other, _ = writer.write_blog_post({**post_data, 'frontmatter': {'slug': 'other', 'publish_date': '2026-01-19'}}, locale='en')
+        
+        # Act
+        writer.write_blog_post({**post_data, 'body': 'Edited'}, locale='en')
+        removed = writer.remove_post(other)
+        removed_again = writer.remove_post(other)
+        
+        # Assert
+        assert removed
+        assert not removed_again
+        assert not os.path.exists(other)
+        assert changes.paths('modified') == [os.path.normpath(added)]
+        assert changes.paths('removed') == [os.path.normpath(other)]
+        assert changes.changed
@@ -0,0 +1,66 @@
+"""
+Unit tests for scoped Jekyll regeneration.
+Tests the incremental/full decision and source mtime pinning.
+"""
+
+import os
+
+from scripts.jekyll_regenerate import FULL, INCREMENTAL, pin_mtimes, plan_regeneration
+
+
+def make_summary(added=(), modified=(), removed=()):
+    """Build a change summary."""
+    return {
+        'version': 1,
+        'changed': bool(added or modified or removed),
+        'added': list(added),
+        'modified': list(modified),
+        'removed': list(removed),
+        'unchanged': 0,
+        'digest': ''
+    }
+
+
+class TestPlanRegeneration:
+    """Test suite for plan_regeneration()."""
+
+    def test_post_edits_regenerate_incrementally(self):
+        """Test that added or modified posts keep the previous site."""
+        # Arrange
+        summary = make_summary(added=['_posts/en/2026-01-02-new.md'], modified=['_posts/es/2026-01-01-post.md'])
+
+        # Act
+        plan = plan_regeneration(summary, 'abc', {'head': 'abc'}, site_ready=True)
+
+        # Assert
+        assert plan == (INCREMENTAL, 'posts_modified')
+        assert plan_regeneration(make_summary(), 'abc', {'head': 'abc'}, True) == (INCREMENTAL, 'no_changes')
+
+    def test_full_regeneration_fallbacks(self):
+        """Test that missing state, new code, data changes or removals regenerate everything."""
+        state = {'head': 'abc'}
+        posts = make_summary(modified=['_posts/en/post.md'])
+
+        assert plan_regeneration(posts, 'abc', state, site_ready=False) == (FULL, 'no_previous_site')
+        assert plan_regeneration(posts, 'def', state, True) == (FULL, 'code_changed')
+        assert plan_regeneration(posts, None, state, True) == (FULL, 'code_changed')
+        assert plan_regeneration(None, 'abc', state, True) == (FULL, 'no_change_summary')
+        assert plan_regeneration(make_summary(modified=['_data/header-en.yml']), 'abc', state, True) == (FULL, 'data_changed')
+        assert plan_regeneration(make_summary(removed=['_posts/en/old.md']), 'abc', state, True) == (FULL, 'files_removed')
+
+
+class TestPinMtimes:
+    """Test suite for pin_mtimes()."""
+
+    def test_existing_files_pinned(self, tmp_path):
+        """Test that existing files get the timestamp and missing ones are skipped."""
+        # Arrange
+        path = tmp_path / 'index.html'
+        path.write_text('page')
+
+        # Act
+        pinned = pin_mtimes([str(path), str(tmp_path / 'deleted.html')], 1000.0)
+
+        # Assert
+        assert pinned == 1
+        assert os.path.getmtime(path) == 1000.0
@@ -0,0 +1,171 @@
+"""
+Unit tests for parallel blog post transformation.
+Tests payload serialization, worker-pool transforms, and serial fallback.
+"""
+
+from unittest.mock import patch
+
+from contentful.resource_builder import ResourceBuilder
+
+from scripts.contentful_client.raw_resources import build_raw_entries
+from scripts.transformers.blog_post_transformer import BlogPostTransformer
+from scripts.transformers.parallel import (
+    build_payload,
+    get_transform_executor,
+    shutdown_transform_executor
+)
+
+
+def link(item_id, link_type='Entry'):
+    """Build a raw link."""
+    return {'sys': {'type': 'Link', 'linkType': link_type, 'id': item_id}}
+
+
+def make_body(posts=10, without_seo=()):
+    """Build a collection page of posts sharing one SEO entry and asset."""
+    items = []
+    for i in range(posts):
+        fields = {
+            'url': f"post-{i}",
+            'title': f"Post {i}",
+            'text': {
+                'nodeType': 'document',
+                'data': {},
+                'content': [{
+                    'nodeType': 'paragraph',
+                    'data': {},
+                    'content': [{'nodeType': 'text', 'value': f"Body {i}", 'marks': [], 'data': {}}]
+                }]
+            }
+        }
+        if i not in without_seo:
+            fields['seo'] = link('seo-1')
+        items.append({
+            'sys': {
+                'id': f"post-{i}",
+                'type': 'Entry',
+                'locale': 'en-US',
+                'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'blogPage'}}
+            },
+            'fields': fields
+        })
+
+    return {
+        'sys': {'type': 'Array'},
+        'items': items,
+        'includes': {
+            'Entry': [{
+                'sys': {
+                    'id': 'seo-1',
+                    'type': 'Entry',
+                    'locale': 'en-US',
+                    'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': 'seo'}}
+                },
+                'fields': {'title': 'SEO', 'description': 'Description', 'ogImage': link('img-1', 'Asset')}
+            }],
+            'Asset': [{
+                'sys': {'id': 'img-1', 'type': 'Asset', 'locale': 'en-US'},
+                'fields': {'file': {'url': '//images/img.png'}}
+            }]
+        }
+    }
+
+
+def make_transformer(workers=2, chunk_size=3):
+    """Create a blog transformer without a client."""
+    transformer = BlogPostTransformer(None, locale='en-US', workers=workers, chunk_size=chunk_size)
+    transformer.get_projection = lambda: None
+    return transformer
+
+
+class TestBuildPayload:
+    """Test suite for serializing entries for workers."""
+
+    def test_sdk_entries_serialized_with_linked_items(self):
+        """Test that linked entries and assets up to the depth are included."""
+        # Arrange
+        entries = ResourceBuilder('en-US', False, make_body(posts=2)).build()
+
+        # Act
+        shallow = build_payload(entries, 1)
+        deep = build_payload(entries, 2)
+
+        # Assert
+        assert [item['sys']['id'] for item in deep['items']] == ['post-0', 'post-1']
+        assert [e['sys']['id'] for e in shallow['includes']['Entry']] == ['seo-1']
+        assert 'Asset' not in shallow['includes']
+        assert [a['sys']['id'] for a in deep['includes']['Asset']] == ['img-1']
+
+    def test_payload_rebuilds_equivalent_entries(self):
+        """Test that raw entries rebuilt from a payload resolve the same links."""
+        # Arrange
+        entries = build_raw_entries([make_body(posts=1)], 'en-US')
+
+        # Act
+        rebuilt = build_raw_entries([build_payload(entries, 2)], 'en-US')
+
+        # Assert
+        seo = rebuilt[0].fields()['seo']
+        assert seo.fields()['og_image'].url() == '//images/img.png'
+
+
+class TestParallelTransform:
+    """Test suite for BlogPostTransformer.transform_batch() with workers."""
+
+    def teardown_method(self):
+        """Stop the shared worker pool."""
+        shutdown_transform_executor()
+
+    def test_parallel_matches_serial_in_order(self):
+        """Test that worker results equal serial results, in entry order."""
+        # Arrange
+        entries = build_raw_entries([make_body(posts=10)], 'en-US')
+        serial, serial_failed = make_transformer(workers=0).transform_batch(entries)
+
+        # Act
+        parallel, parallel_failed = make_transformer(workers=2).transform_batch(entries)
+
+        # Assert
+        assert parallel == serial
+        assert [post['frontmatter']['slug'] for post in parallel] == [f"post-{i}" for i in range(10)]
+        assert parallel_failed == serial_failed == 0
+
+    def test_worker_failures_counted_per_entry(self):
+        """Test that posts failing in workers are counted and skipped."""
+        # Arrange
+        entries = build_raw_entries([make_body(posts=8, without_seo=(2, 5))], 'en-US')
+
+        # Act
+        transformed, failed = make_transformer(workers=2).transform_batch(entries)
+
+        # Assert
+        assert failed == 2
+        assert len(transformed) == 6
+        assert 'post-2' not in [post['frontmatter']['slug'] for post in transformed]
+
+    def test_pool_failure_falls_back_to_serial(self):
+        """Test that a broken pool degrades to a serial transform."""
+        # Arrange
+        entries = build_raw_entries([make_body(posts=6)], 'en-US')
+        transformer = make_transformer(workers=2)
+
+        # Act
+        with patch(
+            'scripts.transformers.blog_post_transformer.transform_parallel',
+            side_effect=RuntimeError('pool broken')
+        ):
+            transformed, failed = transformer.transform_batch(entries)
+
+        # Assert
+        assert len(transformed) == 6
+        assert failed == 0
+
+    def test_process_pool_spawns_workers(self):
+        """Test that workers are spawned, not forked from the threaded build process."""
+        # Act
+        with patch('scripts.transformers.parallel.free_threaded', return_value=False), \
+                patch('scripts.transformers.parallel.ProcessPoolExecutor') as pool:
+            get_transform_executor(2)
+
+        # Assert
+        assert pool.call_args[1]['mp_context'].get_start_method() == 'spawn'
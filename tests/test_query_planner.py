@@ -0,0 +1,154 @@
+"""
+Unit tests for the query planner.
+Tests need merging and concurrent fetch execution.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from scripts.contentful_client.query_planner import DataNeed, QueryPlanner, execute_plans
+
+
+class TestQueryPlanner:
+    """Test suite for QueryPlanner."""
+
+    def test_same_content_type_merged_at_max_include(self):
+        """Test that needs for one content type share the deepest fetch."""
+        # Arrange
+        needs = [
+            DataNeed('blogPage', include=2, requested_by='A'),
+            DataNeed('blogPage', include=4, requested_by='B')
+        ]
+
+        # Act
+        plan = QueryPlanner().plan(needs)
+
+        # Assert
+        assert len(plan.fetches) == 1
+        assert plan.fetches[0].include == 4
+        assert plan.fetches[0].needs == needs
+
+    def test_different_filters_not_merged(self):
+        """Test that filtered needs keep their own request."""
+        # Arrange
+        needs = [
+            DataNeed('blogPage', include=2),
+            DataNeed('blogPage', include=2, filters={'fields.url': 'a'})
+        ]
+
+        # Act
+        plan = QueryPlanner().plan(needs)
+
+        # Assert
+        assert len(plan.fetches) == 2
+
+    def test_uniform_depth_raises_every_fetch(self):
+        """Test that uniform_depth fetches everything at the deepest include."""
+        # Arrange
+        needs = [DataNeed('blogPage', include=2), DataNeed('homePage', include=10)]
+
+        # Act
+        plan = QueryPlanner(uniform_depth=True).plan(needs)
+
+        # Assert
+        assert [f.include for f in plan.fetches] == [10, 10]
+
+    def test_execute_fetches_at_planned_depth(self):
+        """Test that execution sends one get_entries() call per planned fetch."""
+        # Arrange
+        client = Mock()
+        plan = QueryPlanner().plan([
+            DataNeed('homePage', include=3),
+            DataNeed('homePage', include=1)
+        ])
+
+        # Act
+        stats = plan.execute(client, 'en-US')
+
+        # Assert
+        assert stats == {'executed': 1, 'failed': 0}
+        client.get_entries.assert_called_once_with(
+            content_type='homePage', locale='en-US', include=3, filters=None
+        )
+
+    def test_execute_tolerates_failed_fetch(self):
+        """Test that a failing fetch is counted and skipped."""
+        # Arrange
+        client = Mock()
+        client.get_entries.side_effect = Exception('boom')
+        plan = QueryPlanner().plan([DataNeed('profile', include=2)])
+
+        # Act
+        stats = plan.execute(client, 'en-US')
+
+        # Assert
+        assert stats == {'executed': 0, 'failed': 1}
+
+
+class TestExecutePlans:
+    """Test suite for the concurrent fetch stage."""
+
+    def test_fetches_across_locales_run_concurrently(self):
+        """Test that independent fetches overlap instead of running in sequence."""
+        # Arrange
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def get_entries(**kwargs):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            time.sleep(0.05)
+            with lock:
+                active['now'] -= 1
+            return []
+
+        client = Mock()
+        client.get_entries.side_effect = get_entries
+        needs = [DataNeed('blogPage'), DataNeed('profile'), DataNeed('homePage')]
+        plans = {
+            'en-US': QueryPlanner().plan(needs),
+            'es': QueryPlanner().plan(needs)
+        }
+
+        # Act
+        stats = execute_plans(client, plans, max_workers=6)
+
+        # Assert
+        assert stats == {'executed': 6, 'failed': 0}
+        assert active['peak'] == 6
+        locales = sorted(c[1]['locale'] for c in client.get_entries.call_args_list)
+        assert locales == ['en-US'] * 3 + ['es'] * 3
+
+    def test_concurrency_limit_respected(self):
+        """Test that no more than max_workers fetches are in flight."""
+        # Arrange
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def get_entries(**kwargs):
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            time.sleep(0.02)
+            with lock:
+                active['now'] -= 1
+            return []
+
+        client = Mock()
+        client.get_entries.side_effect = get_entries
+        plan = QueryPlanner().plan([DataNeed(f"type{i}") for i in range(6)])
+
+        # Act
+        execute_plans(client, {'en-US': plan}, max_workers=2)
+
+        # Assert
+        assert active['peak'] == 2
+
+    def test_empty_plans(self):
+        """Test that nothing runs when there are no fetches."""
+        client = Mock()
+
+        assert execute_plans(client, {}, max_workers=4) == {'executed': 0, 'failed': 0}
+        client.get_entries.assert_not_called()
@@ -0,0 +1,195 @@
+"""
+Unit tests for RateLimiter.
+Tests retries, backoff, adaptive concurrency and throttle accounting.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from scripts.contentful_client.rate_limiter import RateLimiter, get_rate_limiter
+
+
+def make_response(status_code=200, headers=None):
+    """Build a mock response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestRateLimiter:
+    """Test suite for the request scheduler."""
+
+    def setup_method(self):
+        """Record sleeps instead of sleeping."""
+        self.sleeps = []
+
+    def make_limiter(self, **kwargs):
+        """Create a limiter with a recording sleep function."""
+        kwargs.setdefault('rate', 1000)
+        return RateLimiter(sleep=self.sleeps.append, **kwargs)
+
+    def test_success_returns_first_response(self):
+        """Test that healthy responses pass straight through."""
+        # Arrange
+        limiter = self.make_limiter()
+        send = Mock(return_value=make_response())
+
+        # Act
+        response = limiter.request(send)
+
+        # Assert
+        assert response.status_code == 200
+        assert send.call_count == 1
+        assert limiter.get_stats()['retries'] == 0
+
+    def test_429_waits_at_least_reset(self):
+        """Test that a 429 is retried no sooner than the reset header."""
+        # Arrange
+        limiter = self.make_limiter(base_delay=0.1)
+        send = Mock(side_effect=[
+            make_response(429, {'X-Contentful-RateLimit-Reset': '2'}),
+            make_response()
+        ])
+
+        # Act
+        response = limiter.request(send)
+
+        # Assert
+        assert response.status_code == 200
+        assert self.sleeps == [2.0]
+        stats = limiter.get_stats()
+        assert stats['throttled_requests'] == 1
+        assert stats['throttle_time'] == 2.0
+
+    def test_backoff_grows_with_jitter(self):
+        """Test that 5xx retries back off exponentially within the jitter range."""
+        # Arrange
+        limiter = self.make_limiter(base_delay=1.0, max_retries=3)
+        send = Mock(side_effect=[make_response(503)] * 3 + [make_response()])
+
+        # Act
+        limiter.request(send)
+
+        # Assert
+        assert len(self.sleeps) == 3
+        for attempt, delay in enumerate(self.sleeps):
+            assert 0 <= delay <= 2 ** attempt
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last retryable response is returned once retries run out."""
+        # Arrange
+        limiter = self.make_limiter(max_retries=1)
+        send = Mock(return_value=make_response(500))
+
+        # Act
+        response = limiter.request(send)
+
+        # Assert
+        assert response.status_code == 500
+        assert send.call_count == 2
+
+    def test_connection_error_retried_then_raised(self):
+        """Test that connection errors are retried and re-raised at the end."""
+        # Arrange
+        limiter = self.make_limiter(max_retries=2)
+        send = Mock(side_effect=requests.ConnectionError('reset'))
+
+        # Act / Assert
+        with pytest.raises(requests.ConnectionError):
+            limiter.request(send)
+        assert send.call_count == 3
+
+    def test_client_errors_not_retried(self):
+        """Test that 4xx responses other than 429 return immediately."""
+        # Arrange
+        limiter = self.make_limiter()
+        send = Mock(return_value=make_response(404))
+
+        # Act
+        limiter.request(send)
+
+        # Assert
+        assert send.call_count == 1
+
+    def test_concurrency_halves_on_429_and_recovers(self):
+        """Test multiplicative decrease on 429 and additive increase after."""
+        # Arrange
+        limiter = self.make_limiter(max_concurrency=8)
+        send = Mock(side_effect=[
+            make_response(429, {'X-Contentful-RateLimit-Reset': '0'}),
+            make_response(),
+            make_response()
+        ])
+
+        # Act
+        limiter.request(send)
+        after_throttle = limiter.get_stats()['concurrency_limit']
+        limiter.request(send)
+
+        # Assert
+        assert after_throttle == 5
+        assert limiter.get_stats()['concurrency_limit'] == 6
+
+    def test_rate_lowered_to_advertised_limit(self):
+        """Test that the per-second limit header caps the bucket rate."""
+        # Arrange
+        limiter = self.make_limiter(rate=50)
+        send = Mock(return_value=make_response(headers={'X-Contentful-RateLimit-Second-Limit': '10'}))
+
+        # Act
+        limiter.request(send)
+
+        # Assert
+        assert limiter.rate == 10
+
+    def test_token_bucket_paces_requests(self):
+        """Test that requests beyond the burst wait for tokens."""
+        # Arrange
+        limiter = RateLimiter(rate=10, burst=1, sleep=self.sleeps.append)
+        send = Mock(return_value=make_response())
+
+        # Act
+        limiter.request(send)
+        limiter.request(send)
+
+        # Assert
+        assert len(self.sleeps) == 1
+        assert 0 < self.sleeps[0] <= 0.1
+        assert limiter.get_stats()['throttle_time'] > 0
+
+    def test_in_flight_capped(self):
+        """Test that no more than max_concurrency requests run at once."""
+        # Arrange
+        limiter = RateLimiter(rate=1000, max_concurrency=2)
+        active = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def send():
+            with lock:
+                active['now'] += 1
+                active['peak'] = max(active['peak'], active['now'])
+            time.sleep(0.02)
+            with lock:
+                active['now'] -= 1
+            return make_response()
+
+        threads = [threading.Thread(target=limiter.request, args=(send,)) for _ in range(6)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert active['peak'] == 2
+
+    def test_shared_per_space(self):
+        """Test that clients of one space share a limiter."""
+        assert get_rate_limiter('space-a') is get_rate_limiter('space-a')
+        assert get_rate_limiter('space-a') is not get_rate_limiter('space-b')
@@ -0,0 +1,242 @@
+"""
+Unit tests for raw-JSON entries and lazy link resolution.
+Tests the SDK-compatible interface, link indexes and batch fetching.
+"""
+
+from unittest.mock import Mock
+
+from scripts.contentful_client.raw_resources import (
+    LinkResolver,
+    RawAsset,
+    build_raw_entries
+)
+
+
+def link(entry_id, link_type='Entry'):
+    """Build a raw link."""
+    return {'sys': {'type': 'Link', 'linkType': link_type, 'id': entry_id}}
+
+
+def raw_entry(entry_id, content_type='blogPage', **fields):
+    """Build a raw single-locale entry payload."""
+    return {
+        'sys': {
+            'id': entry_id,
+            'type': 'Entry',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        },
+        'fields': fields
+    }
+
+
+def rich_text(*targets):
+    """Build a raw rich text document embedding each target link in a block."""
+    return {
+        'nodeType': 'document',
+        'data': {},
+        'content': [
+            {'nodeType': 'paragraph', 'data': {}, 'content': [
+                {'nodeType': 'text', 'value': 'Intro', 'marks': [], 'data': {}}
+            ]}
+        ] + [
+            {'nodeType': f"embedded-{target['sys']['linkType'].lower()}-block", 'data': {'target': target}, 'content': []}
+            for target in targets
+        ]
+    }
+
+
+def raw_asset(asset_id, url):
+    """Build a raw single-locale asset payload."""
+    return {
+        'sys': {'id': asset_id, 'type': 'Asset'},
+        'fields': {'title': asset_id, 'file': {'url': url}}
+    }
+
+
+class TestRawEntry:
+    """Test suite for the SDK-compatible entry interface."""
+
+    def test_fields_use_snake_case_and_resolve_links(self):
+        """Test that fields read like SDK entries, links included."""
+        # Arrange
+        body = {
+            'items': [raw_entry(
+                'post-1',
+                title='Hello',
+                heroBanner=link('hero-1'),
+                tags=[link('tag-1'), link('tag-2')]
+            )],
+            'includes': {
+                'Entry': [
+                    raw_entry('hero-1', 'heroBanner', title='Hero', image=link('img-1', 'Asset')),
+                    raw_entry('tag-1', 'tag', name='one'),
+                    raw_entry('tag-2', 'tag', name='two')
+                ],
+                'Asset': [raw_asset('img-1', '//images.ctfassets.net/img.png')]
+            }
+        }
+
+        # Act
+        entry = build_raw_entries([body])[0]
+        fields = entry.fields()
+
+        # Assert
+        assert entry.id == 'post-1'
+        assert entry.content_type.id == 'blogPage'
+        assert fields['title'] == 'Hello'
+        assert entry.title == 'Hello'
+        assert fields['hero_banner'].fields()['title'] == 'Hero'
+        assert [t.fields()['name'] for t in fields['tags']] == ['one', 'two']
+        image = fields['hero_banner'].fields()['image']
+        assert isinstance(image, RawAsset)
+        assert image.url() == '//images.ctfassets.net/img.png'
+        assert image.url(w=120) == '//images.ctfassets.net/img.png?w=120'
+
+    def test_localized_payload_reads_requested_locale(self):
+        """Test that locale='*' payloads are read per locale."""
+        # Arrange
+        body = {'items': [raw_entry('post-1', title={'en-US': 'Hello', 'es': 'Hola'})]}
+
+        # Act
+        entry = build_raw_entries([body], default_locale='en-US', localized=True)[0]
+
+        # Assert
+        assert entry.fields()['title'] == 'Hello'
+        assert entry.fields('es')['title'] == 'Hola'
+
+    def test_fallback_locale_fills_missing_fields(self):
+        """Test that locale='*' payloads fall back per field when asked to."""
+        # Arrange
+        body = {'items': [raw_entry('post-1', title={'en-US': 'Hello'}, slug={'en-US': 'hello', 'es': 'hola'})]}
+        entry = build_raw_entries([body], default_locale='en-US', localized=True)[0]
+
+        # Act
+        strict = entry.fields('es')
+        fallback = entry.fields(locale='es', fallback_locale='en-US')
+
+        # Assert
+        assert strict == {'slug': 'hola'}
+        assert fallback == {'title': 'Hello', 'slug': 'hola'}
+
+    def test_rich_text_targets_resolve(self):
+        """Test that embedded entries and assets in rich text resolve like the SDK."""
+        # Arrange
+        body = {
+            'items': [raw_entry('post-1', text=rich_text(link('img-1', 'Asset'), link('card-1'), link('gone')))],
+            'includes': {
+                'Entry': [raw_entry('card-1', 'componentCard', title='Card')],
+                'Asset': [raw_asset('img-1', '//images.ctfassets.net/img.png')]
+            }
+        }
+
+        # Act
+        entry = build_raw_entries([body])[0]
+        content = entry.fields()['text']['content']
+
+        # Assert
+        assert [node['nodeType'] for node in content] == [
+            'paragraph', 'embedded-asset-block', 'embedded-entry-block'
+        ]
+        assert content[1]['data']['target'].url() == '//images.ctfassets.net/img.png'
+        assert content[2]['data']['target'].fields()['title'] == 'Card'
+        assert body['items'][0]['fields']['text']['content'][1]['data']['target'] == link('img-1', 'Asset')
+
+    def test_links_across_pages_resolve(self):
+        """Test that an item included with one page resolves links on another."""
+        # Arrange
+        bodies = [
+            {'items': [raw_entry('post-1', seo=link('seo-1'))]},
+            {'items': [raw_entry('post-2')], 'includes': {'Entry': [raw_entry('seo-1', 'seo')]}}
+        ]
+
+        # Act
+        entries = build_raw_entries(bodies)
+
+        # Assert
+        assert entries[0].fields()['seo'].id == 'seo-1'
+
+    def test_shared_link_resolves_to_one_object(self):
+        """Test that every link to an ID yields the same resource."""
+        # Arrange
+        body = {
+            'items': [raw_entry('a', menu=link('m')), raw_entry('b', menu=link('m'))],
+            'includes': {'Entry': [raw_entry('m', 'menuItem')]}
+        }
+
+        # Act
+        a, b = build_raw_entries([body])
+
+        # Assert
+        assert a.fields()['menu'] is b.fields()['menu']
+
+
+class TestLinkResolver:
+    """Test suite for batch fetching of unresolved links."""
+
+    def test_unresolved_links_fetched_in_one_batch(self):
+        """Test that the first miss fetches every unresolved link at once."""
+        # Arrange
+        fetch = Mock(return_value=[raw_entry('seo-1', 'seo'), raw_entry('seo-2', 'seo')])
+        body = {'items': [
+            raw_entry('post-1', seo=link('seo-1')),
+            raw_entry('post-2', seo=link('seo-2'))
+        ]}
+        entries = build_raw_entries([body], fetch_linked=fetch, locale='es')
+
+        # Act
+        first = entries[0].fields()['seo']
+        second = entries[1].fields()['seo']
+
+        # Assert
+        fetch.assert_called_once_with('Entry', ['seo-1', 'seo-2'], 'es')
+        assert (first.id, second.id) == ('seo-1', 'seo-2')
+
+    def test_rich_text_targets_fetched_in_batch(self):
+        """Test that links embedded in rich text join the batch fetch."""
+        # Arrange
+        fetch = Mock(return_value=[raw_asset('img-1', '//images.ctfassets.net/img.png')])
+        body = {'items': [raw_entry('post-1', text=rich_text(link('img-1', 'Asset')))]}
+        entry = build_raw_entries([body], fetch_linked=fetch, locale='en-US')[0]
+
+        # Act
+        target = entry.fields()['text']['content'][1]['data']['target']
+
+        # Assert
+        fetch.assert_called_once_with('Asset', ['img-1'], 'en-US')
+        assert target.id == 'img-1'
+
+    def test_missing_links_resolve_to_none_without_refetch(self):
+        """Test that IDs the API does not return are dropped and not requested again."""
+        # Arrange
+        fetch = Mock(return_value=[])
+        body = {'items': [raw_entry('post-1', seo=link('gone'), tags=[link('gone'), link('gone-2')])]}
+        entry = build_raw_entries([body], fetch_linked=fetch)[0]
+
+        # Act
+        fields = entry.fields()
+
+        # Assert
+        assert fields['seo'] is None
+        assert fields['tags'] == []
+        fetch.assert_called_once()
+
+    def test_fetch_failure_is_tolerated(self):
+        """Test that a failing batch fetch leaves links unresolved."""
+        # Arrange
+        fetch = Mock(side_effect=Exception('boom'))
+        resolver = LinkResolver(fetch_linked=fetch)
+        entry = resolver.add_body({'items': [raw_entry('post-1', seo=link('seo-1'))]})[0]
+
+        # Act
+        seo = entry.fields()['seo']
+
+        # Assert
+        assert seo is None
+
+    def test_no_fetch_without_fetcher(self):
+        """Test that links stay unresolved when no fetcher is configured."""
+        # Arrange
+        entry = build_raw_entries([{'items': [raw_entry('post-1', seo=link('seo-1'))]}])[0]
+
+        # Act / Assert
+        assert entry.fields()['seo'] is None
@@ -0,0 +1,184 @@
+"""
+Unit tests for schema-derived field projection.
+Tests select lists and include depths against the repository schemas.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from scripts.contentful_client.schema_projection import (
+    SchemaRegistry,
+    _path_depth,
+    get_schema_registry,
+    project
+)
+from scripts.transformers.blog_listing_page_transformer import BlogListingPageTransformer
+from scripts.transformers.blog_post_transformer import BlogPostTransformer
+from scripts.transformers.footer_transformer import FooterTransformer
+from scripts.transformers.header_transformer import HeaderTransformer
+from scripts.transformers.homepage_transformer import HomepageTransformer
+from scripts.transformers.profile_transformer import ProfileTransformer
+
+
+class TestProjection:
+    """Test suite for project() using the contentful-schemas/ definitions."""
+
+    def test_plain_fields_need_no_include(self):
+        """Test that non-link fields select without any include depth."""
+        # Act
+        projection = project('seo', ['title', 'description'])
+
+        # Assert
+        assert projection.fields == ['title', 'description']
+        assert projection.include == 0
+
+    def test_link_chain_depth(self):
+        """Test that each link on a path adds one include level."""
+        # Act
+        projection = project('blogListingPage', ['title', 'seo.ogImage', 'hero.title'])
+
+        # Assert
+        assert projection.fields == ['title', 'seo', 'hero']
+        assert projection.include == 2
+
+    def test_multi_type_link_uses_deepest_target(self):
+        """Test that homepage blocks resolve through carousel cards to images."""
+        # Act
+        projection = project('homePage', ['blocks.cards.image', 'blocks.title'])
+
+        # Assert
+        assert projection.include == 3
+
+    def test_live_id_alias(self):
+        """Test that live IDs map to differently named schema definitions."""
+        # Act
+        projection = project('blogPage', ['title'])
+
+        # Assert
+        assert projection is not None
+        assert projection.fields == ['title']
+
+    def test_unknown_top_level_field_disables_projection(self):
+        """Test that an unknown top-level field falls back to all fields."""
+        # Act
+        projection = project('orFooter', ['brandUrl', 'socialLinks.url'])
+
+        # Assert
+        assert projection is None
+
+    def test_unknown_nested_field_treated_as_plain(self):
+        """Test that an unknown field behind a link keeps the link depth."""
+        # Act
+        projection = project('profile', ['socialLinks.platform'])
+
+        # Assert
+        assert projection.fields == ['socialLinks']
+        assert projection.include == 1
+
+    def test_unknown_content_type(self):
+        """Test that content types without a schema are not projected."""
+        assert project('doesNotExist', ['title']) is None
+
+
+class TestSchemaRegistry:
+    """Test suite for loading schema definitions."""
+
+    def setup_method(self):
+        """Create temporary schema directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def write_schema(self, filename, definition):
+        """Write a schema file."""
+        with open(os.path.join(self.temp_dir, filename), 'w') as f:
+            json.dump(definition, f)
+
+    def test_unrestricted_link_tries_every_type(self):
+        """Test that links without linkContentType resolve against all types."""
+        # Arrange
+        self.write_schema('page.json', {'id': 'page', 'fields': [
+            {'id': 'related', 'type': 'Link', 'linkType': 'Entry'}
+        ]})
+        self.write_schema('card.json', {'id': 'card', 'fields': [
+            {'id': 'image', 'type': 'Link', 'linkType': 'Asset'}
+        ]})
+        self.write_schema('broken.json', {'not': 'a schema'})
+        registry = SchemaRegistry(self.temp_dir)
+
+        # Act
+        projection = project('page', ['related.image'], registry)
+
+        # Assert
+        assert sorted(registry.content_types) == ['card', 'page']
+        assert projection.include == 2
+
+    def test_rich_text_counts_as_link(self):
+        """Test that rich text needs an include level for embedded assets."""
+        # Arrange
+        self.write_schema('post.json', {'id': 'post', 'fields': [
+            {'id': 'body', 'type': 'RichText'}
+        ]})
+
+        # Act
+        projection = project('post', ['body'], SchemaRegistry(self.temp_dir))
+
+        # Assert
+        assert projection.include == 1
+
+
+class TestTransformerProjection:
+    """Test suite for projections applied by transformers."""
+
+    def test_homepage_include_derived_from_schema(self):
+        """Test that the homepage no longer uses the hard-coded include=10."""
+        # Arrange
+        client = Mock()
+        transformer = HomepageTransformer(client, 'en-US')
+
+        # Act
+        include = transformer.include_depth
+
+        # Assert
+        assert include == 3
+        client.set_field_projection.assert_called_once_with(
+            'homePage', ['name', 'url', 'blocks', 'header', 'footer']
+        )
+
+    def test_projection_computed_once(self):
+        """Test that the projection is registered with the client only once."""
+        # Arrange
+        client = Mock()
+        transformer = BlogListingPageTransformer(client, 'en-US')
+
+        # Act
+        transformer.include_depth
+        transformer.get_data_needs()
+
+        # Assert
+        assert client.set_field_projection.call_count == 1
+
+    def test_field_paths_match_shipped_schemas(self):
+        """Test that every transformer field path resolves in contentful-schemas/."""
+        # Arrange
+        registry = get_schema_registry()
+        transformer_classes = [
+            BlogPostTransformer, BlogListingPageTransformer, ProfileTransformer,
+            HeaderTransformer, FooterTransformer, HomepageTransformer
+        ]
+        unknown = []
+
+        # Act
+        for transformer_class in transformer_classes:
+            transformer = transformer_class(Mock(), 'en-US')
+            assert registry.has(transformer.content_type)
+            for path in transformer.field_paths:
+                _path_depth(registry, transformer.content_type, path.split('.'), unknown)
+
+        # Assert
+        assert unknown == []
@@ -0,0 +1,222 @@
+"""
+Unit tests for the local Delivery API stand-in server.
+Tests query semantics, fault injection, and ContentfulClient against it.
+"""
+
+from unittest.mock import Mock, patch
+
+import requests
+
+from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_client.rate_limiter import RateLimiter
+from scripts.stand_in_server import (
+    FaultInjector,
+    SpaceData,
+    StandInServer,
+    query_entries,
+    query_sync
+)
+
+
+def link(item_id, link_type='Entry'):
+    """Build a raw link."""
+    return {'sys': {'type': 'Link', 'linkType': link_type, 'id': item_id}}
+
+
+def entry(item_id, content_type, **fields):
+    """Build a raw all-locale entry."""
+    return {
+        'sys': {
+            'id': item_id,
+            'type': 'Entry',
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        },
+        'fields': {name: {'en-US': value} for name, value in fields.items()}
+    }
+
+
+def make_space(posts=3):
+    """Build a small space: posts → seo → og image asset."""
+    entries = {
+        f"post-{i}": entry(f"post-{i}", 'blogPage', title=f"Post {i}", url=f"post-{i}", seo=link('seo-1'))
+        for i in range(posts)
+    }
+    entries['seo-1'] = entry('seo-1', 'seo', title='SEO', ogImage=link('img-1', 'Asset'))
+    entries['seo-1']['fields']['title']['es'] = 'SEO es'
+    assets = {
+        'img-1': {
+            'sys': {'id': 'img-1', 'type': 'Asset'},
+            'fields': {'file': {'en-US': {'url': '//images/img.png'}}}
+        }
+    }
+    return SpaceData(entries, assets)
+
+
+class TestQueryEntries:
+    """Test suite for /entries query semantics."""
+
+    def test_include_depth_limits_includes(self):
+        """Test that each include level adds one level of linked items."""
+        # Arrange
+        data = make_space()
+
+        # Act
+        shallow = query_entries(data, {'content_type': 'blogPage', 'include': '1'})
+        deep = query_entries(data, {'content_type': 'blogPage', 'include': '2'})
+        none = query_entries(data, {'content_type': 'blogPage', 'include': '0'})
+
+        # Assert
+        assert [e['sys']['id'] for e in shallow['includes']['Entry']] == ['seo-1']
+        assert 'Asset' not in shallow['includes']
+        assert [a['sys']['id'] for a in deep['includes']['Asset']] == ['img-1']
+        assert 'includes' not in none
+
+    def test_locale_select_and_paging(self):
+        """Test locale fallback, field selection and skip/limit."""
+        # Arrange
+        data = make_space(posts=5)
+
+        # Act
+        body = query_entries(data, {
+            'content_type': 'blogPage',
+            'locale': 'es',
+            'skip': '2',
+            'limit': '2',
+            'select': 'sys,fields.title'
+        })
+
+        # Assert
+        assert body['total'] == 5
+        assert [i['sys']['id'] for i in body['items']] == ['post-2', 'post-3']
+        assert body['items'][0]['fields'] == {'title': 'Post 2'}
+        assert body['items'][0]['sys']['locale'] == 'es'
+        assert body['includes']['Entry'][0]['fields']['title'] == 'SEO es'
+
+    def test_sys_id_in_and_field_filter(self):
+        """Test ID batches and fields.<id> equality filters."""
+        # Arrange
+        data = make_space()
+
+        # Act
+        by_ids = query_entries(data, {'sys.id[in]': 'post-0,seo-1,missing', 'include': '0'})
+        by_url = query_entries(data, {'content_type': 'blogPage', 'fields.url': 'post-1'})
+
+        # Assert
+        assert [i['sys']['id'] for i in by_ids['items']] == ['post-0', 'seo-1']
+        assert [i['sys']['id'] for i in by_url['items']] == ['post-1']
+
+    def test_unresolvable_links_reported(self):
+        """Test that links to missing items are listed under errors."""
+        # Arrange
+        data = make_space(posts=1)
+        del data.entries['seo-1']
+
+        # Act
+        body = query_entries(data, {'content_type': 'blogPage'})
+
+        # Assert
+        assert body['errors'][0]['details']['id'] == 'seo-1'
+
+
+class TestQuerySync:
+    """Test suite for /sync."""
+
+    def test_initial_sync_pages_then_reports_no_changes(self):
+        """Test that the snapshot is paged once and later tokens are empty."""
+        # Arrange
+        data = make_space(posts=150)
+
+        # Act
+        first = query_sync(data, {'initial': 'true'}, 'http://x')
+        second = query_sync(data, {'sync_token': 'page-1'}, 'http://x')
+        delta = query_sync(data, {'sync_token': 'snapshot'}, 'http://x')
+
+        # Assert
+        assert len(first['items']) == 100
+        assert first['nextPageUrl'].endswith('sync_token=page-1')
+        assert len(second['items']) == 52
+        assert second['nextSyncUrl'].endswith('sync_token=snapshot')
+        assert delta['items'] == []
+
+
+class TestFaultInjector:
+    """Test suite for injected faults."""
+
+    def test_rate_limit_throttles_excess_requests(self):
+        """Test that requests beyond the per-second limit get 429."""
+        # Arrange
+        faults = FaultInjector(rate_limit=2)
+
+        # Act
+        with patch('scripts.stand_in_server.time.time', return_value=100.5):
+            outcomes = [faults.decide() for _ in range(3)]
+
+        # Assert
+        assert [status for status, _ in outcomes] == [None, None, 429]
+        assert outcomes[1][1]['X-Contentful-RateLimit-Second-Remaining'] == '0'
+        assert float(outcomes[2][1]['X-Contentful-RateLimit-Reset']) == 0.5
+
+    def test_error_and_throttle_rates(self):
+        """Test that full rates always inject their status."""
+        assert FaultInjector(error_rate=1.0).decide()[0] == 500
+        assert FaultInjector(throttle_rate=1.0).decide()[0] == 429
+        assert FaultInjector().decide()[0] is None
+
+
+class TestClientAgainstStandIn:
+    """Test suite for ContentfulClient pointed at a running stand-in."""
+
+    def setup_method(self):
+        """Start a stand-in server on a free port."""
+        self.server = StandInServer(make_space(posts=25))
+        self.server.start()
+
+    def teardown_method(self):
+        """Stop the server."""
+        self.server.stop()
+
+    def make_client(self, max_retries=5, **kwargs):
+        """Create a client using the stand-in's URL (SDK mocked)."""
+        sdk = Mock()
+        sdk.default_locale = 'en-US'
+        with patch.object(ContentfulClient, '_initialize_client', return_value=sdk):
+            return ContentfulClient(
+                'space',
+                'token',
+                api_url=self.server.url,
+                rate_limiter=RateLimiter(rate=1000, max_retries=max_retries, sleep=lambda s: None),
+                **kwargs
+            )
+
+    def test_paginated_fetch(self):
+        """Test that a paginated collection fetch returns every entry."""
+        # Arrange
+        client = self.make_client(page_size=10, raw_entries=True)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='en-US', include=2)
+
+        # Assert
+        assert len(entries) == 25
+        assert entries[0].fields()['seo'].fields()['og_image'].url() == '//images/img.png'
+        assert self.server.stats['requests'] == 3
+
+    def test_client_retries_injected_throttling(self):
+        """Test that injected 429s are retried until the request succeeds."""
+        # Arrange
+        self.server.faults = FaultInjector(throttle_rate=0.5, seed=7)
+        client = self.make_client(max_retries=20, page_size=5, page_concurrency=4, raw_entries=True)
+
+        # Act
+        entries = client.get_entries('blogPage', locale='en-US')
+
+        # Assert
+        assert len(entries) == 25
+        assert self.server.stats['throttled'] > 0
+        assert client.get_cache_stats()['throttled_requests'] == self.server.stats['throttled']
+
+    def test_unknown_resource_is_404(self):
+        """Test that unsupported endpoints answer 404."""
+        response = requests.get(f"{self.server.url}/spaces/space/environments/master/locales")
+
+        assert response.status_code == 404
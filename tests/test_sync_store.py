@@ -0,0 +1,291 @@
+"""
+Unit tests for Sync API delta mode.
+Tests snapshot persistence, delta merging, and snapshot-backed entries.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from contentful.content_type import ContentType
+from contentful.content_type_cache import ContentTypeCache
+from contentful.sync_page import SyncPage
+
+from scripts.contentful_client.client import ContentfulClient
+from scripts.contentful_client.localization import get_fallback_chain, localize_item
+from scripts.contentful_client.rate_limiter import RateLimiter
+from scripts.contentful_client.sync_store import SyncStore
+
+
+def make_raw_entry(entry_id, content_type, fields, item_type='Entry'):
+    """Build a raw all-locale sync item."""
+    return {
+        'sys': {
+            'id': entry_id,
+            'type': item_type,
+            'contentType': {'sys': {'type': 'Link', 'linkType': 'ContentType', 'id': content_type}}
+        },
+        'fields': fields
+    }
+
+
+def make_sync_body(items, next_page_url=None, next_sync_url='https://cdn/sync?sync_token=tok-2'):
+    """Build a Sync API response body."""
+    body = {'sys': {'type': 'Array'}, 'items': items}
+    if next_page_url:
+        body['nextPageUrl'] = next_page_url
+    else:
+        body['nextSyncUrl'] = next_sync_url
+    return body
+
+
+def make_rich_text_entry():
+    """Build a raw sync entry whose rich text embeds another entry."""
+    return make_raw_entry('post', 'blogPage', {
+        'text': {'en-US': {
+            'nodeType': 'document',
+            'data': {},
+            'content': [{
+                'nodeType': 'embedded-entry-block',
+                'data': {'target': {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'code-1'}}},
+                'content': []
+            }]
+        }}
+    })
+
+
+def make_response(body):
+    """Build a mock 200 requests.Response."""
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = body
+    return response
+
+
+class TestSyncStore:
+    """Test suite for SyncStore."""
+
+    def setup_method(self):
+        """Create temporary sync directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_apply_upserts_and_deletes(self):
+        """Test that created, updated and deleted items are merged."""
+        # Arrange
+        store = SyncStore(self.temp_dir, space_id='space')
+        store.apply([make_raw_entry('a', 'blogPage', {'title': {'en-US': 'A'}})], 'tok-1')
+
+        # Act
+        counts = store.apply([
+            make_raw_entry('a', 'blogPage', {'title': {'en-US': 'A2'}}),
+            {'sys': {'id': 'a', 'type': 'DeletedEntry'}},
+            {'sys': {'id': 'img', 'type': 'Asset'}, 'fields': {}}
+        ], 'tok-2')
+
+        # Assert
+        assert counts == {'upserted': 2, 'deleted': 1}
+        assert 'a' not in store.entries
+        assert 'img' in store.assets
+        assert store.next_sync_token == 'tok-2'
+
+    def test_save_and_load_roundtrip(self):
+        """Test that token and snapshot survive a save/load cycle."""
+        # Arrange
+        store = SyncStore(self.temp_dir, space_id='space')
+        store.apply([make_raw_entry('a', 'blogPage', {'title': {'en-US': 'A'}})], 'tok-1')
+        store.save()
+
+        # Act
+        reloaded = SyncStore(self.temp_dir, space_id='space')
+        loaded = reloaded.load()
+
+        # Assert
+        assert loaded is True
+        assert reloaded.next_sync_token == 'tok-1'
+        assert 'a' in reloaded.entries
+
+    def test_load_rejects_other_space(self):
+        """Test that a snapshot from another space is ignored."""
+        # Arrange
+        store = SyncStore(self.temp_dir, space_id='space')
+        store.apply([], 'tok-1')
+        store.save()
+
+        # Act
+        other = SyncStore(self.temp_dir, space_id='other-space')
+
+        # Assert
+        assert other.load() is False
+        assert other.next_sync_token is None
+
+    def test_load_missing_file(self):
+        """Test that a missing state file means initial sync."""
+        store = SyncStore(os.path.join(self.temp_dir, 'nope'), space_id='space')
+
+        assert store.load() is False
+
+
+class TestLocalization:
+    """Test suite for locale demultiplexing."""
+
+    def test_fallback_chain(self):
+        """Test that the chain follows fallbacks and ends at the default locale."""
+        assert get_fallback_chain('es', {'es': 'en-US'}) == ['es', 'en-US']
+        assert get_fallback_chain('en-US', {}) == ['en-US']
+
+    def test_localize_item_uses_fallback(self):
+        """Test that missing translations fall back to the default locale."""
+        # Arrange
+        item = make_raw_entry('a', 'blogPage', {
+            'title': {'en-US': 'Hello', 'es': 'Hola'},
+            'author': {'en-US': 'Jane'}
+        })
+
+        # Act
+        localized = localize_item(item, 'es', {'es': 'en-US'})
+
+        # Assert
+        assert localized['fields'] == {'title': 'Hola', 'author': 'Jane'}
+        assert localized['sys']['locale'] == 'es'
+        assert item['fields']['title'] == {'en-US': 'Hello', 'es': 'Hola'}
+
+
+class TestClientSyncMode:
+    """Test suite for ContentfulClient sync mode."""
+
+    def setup_method(self):
+        """Create client with a mocked SDK."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.sdk = Mock()
+        self.sdk.default_locale = 'en-US'
+        self.store = SyncStore(self.temp_dir, space_id='space')
+
+        self.session = Mock()
+
+        with patch.object(ContentfulClient, '_initialize_client', return_value=self.sdk):
+            self.client = ContentfulClient(
+                'space',
+                'token',
+                sync_store=self.store,
+                rate_limiter=RateLimiter(rate=1000, sleep=lambda seconds: None)
+            )
+        self.client._session = self.session
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_initial_sync_follows_pages(self):
+        """Test that initial sync pages through nextPageUrl."""
+        # Arrange
+        self.session.get.side_effect = [
+            make_response(make_sync_body([make_raw_entry('a', 'blogPage', {})], next_page_url='https://cdn/sync?sync_token=page-2')),
+            make_response(make_sync_body([make_raw_entry('b', 'blogPage', {})]))
+        ]
+
+        # Act
+        stats = self.client.sync()
+
+        # Assert
+        assert stats == {'pages': 2, 'upserted': 2, 'deleted': 0}
+        assert self.session.get.call_args_list[0][1]['params'] == {'initial': 'true'}
+        assert self.session.get.call_args_list[1][1]['params'] == {'sync_token': 'page-2'}
+        self.sdk.sync.assert_not_called()
+        assert self.store.next_sync_token == 'tok-2'
+
+    def test_delta_sync_uses_stored_token(self):
+        """Test that later runs only request changes since the stored token."""
+        # Arrange
+        self.store.next_sync_token = 'tok-1'
+        self.session.get.return_value = make_response(make_sync_body([]))
+
+        # Act
+        self.client.sync()
+
+        # Assert
+        assert self.session.get.call_args[1]['params'] == {'sync_token': 'tok-1'}
+
+    def test_get_entries_served_from_snapshot(self):
+        """Test that entries resolve links from the snapshot without API calls."""
+        # Arrange
+        self.store.apply([
+            make_raw_entry('post', 'blogPage', {
+                'title': {'en-US': 'Hello', 'es': 'Hola'},
+                'seo': {'en-US': {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'seo'}}}
+            }),
+            make_raw_entry('seo', 'seo', {'title': {'en-US': 'SEO'}})
+        ], 'tok-1')
+
+        # Act
+        entries = self.client.get_entries('blogPage', locale='es', include=2)
+
+        # Assert
+        assert len(entries) == 1
+        fields = entries[0].fields()
+        assert fields['title'] == 'Hola'
+        assert fields['seo'].fields()['title'] == 'SEO'
+        self.sdk.entries.assert_not_called()
+
+
+class TestRichTextSnapshot:
+    """Test suite for saving rich-text sync items."""
+
+    def setup_method(self):
+        """Register the blogPage content type with the SDK (as a real client does)."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.content_type = ContentType({
+            'sys': {'id': 'blogPage', 'type': 'ContentType'},
+            'name': 'Blog Page',
+            'fields': [{'id': 'text', 'name': 'Text', 'type': 'RichText'}]
+        })
+        ContentTypeCache.__CACHE__.append(self.content_type)
+
+    def teardown_method(self):
+        """Unregister the content type and clean up."""
+        ContentTypeCache.__CACHE__.remove(self.content_type)
+        shutil.rmtree(self.temp_dir)
+
+    def test_sdk_hydrated_items_fail_with_ioerror(self):
+        """Test that items hydrated by a real SDK SyncPage raise IOError, not TypeError."""
+        # Arrange
+        page = SyncPage(make_sync_body([make_rich_text_entry()]), default_locale='en-US', localized=True)
+        store = SyncStore(self.temp_dir, space_id='space')
+        store.apply(page.raw['items'], page.next_sync_token)
+
+        # Act & Assert
+        with pytest.raises(IOError):
+            store.save()
+        assert not [name for name in os.listdir(self.temp_dir) if name.endswith('.tmp')]
+
+    def test_client_sync_snapshot_saved(self):
+        """Test that a client sync keeps rich-text links as JSON and saves the snapshot."""
+        # Arrange
+        sdk = Mock()
+        sdk.default_locale = 'en-US'
+        store = SyncStore(self.temp_dir, space_id='space')
+        with patch.object(ContentfulClient, '_initialize_client', return_value=sdk):
+            client = ContentfulClient(
+                'space',
+                'token',
+                sync_store=store,
+                rate_limiter=RateLimiter(rate=1000, sleep=lambda seconds: None)
+            )
+        client._session = Mock()
+        client._session.get.return_value = make_response(make_sync_body([make_rich_text_entry()]))
+
+        # Act
+        client.sync()
+        store.save()
+
+        # Assert
+        reloaded = SyncStore(self.temp_dir, space_id='space')
+        assert reloaded.load()
+        target = reloaded.entries['post']['fields']['text']['en-US']['content'][0]['data']['target']
+        assert target == {'sys': {'type': 'Link', 'linkType': 'Entry', 'id': 'code-1'}}
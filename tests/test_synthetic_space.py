@@ -0,0 +1,151 @@
+"""
+Unit tests for the synthetic space generator.
+Tests schema conformance, link integrity, determinism, and loading the
+snapshot into SyncStore and the stand-in server.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+from scripts.contentful_client.schema_projection import get_schema_registry
+from scripts.contentful_client.sync_store import SyncStore
+from scripts.stand_in_server import SpaceData, query_entries
+from scripts.synthetic_space import BLOCK_TYPES, SpaceGenerator, build_snapshot
+
+
+def iter_links(value):
+    """Yield every link nested anywhere in a value."""
+    if isinstance(value, dict):
+        if value.get('sys', {}).get('type') == 'Link':
+            yield value['sys']
+        for child in value.values():
+            yield from iter_links(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from iter_links(child)
+
+
+class TestSpaceGenerator:
+    """Test suite for SpaceGenerator."""
+
+    def test_counts_scale_with_options(self):
+        """Test that the graph contains the requested roots and pools."""
+        # Arrange
+        generator = SpaceGenerator(posts=20, assets=10, menu_items=4, paragraphs=2)
+
+        # Act
+        space = generator.generate()
+
+        # Assert
+        types = [e['sys']['contentType']['sys']['id'] for e in space['entries'].values()]
+        assert types.count('blogPage') == 20
+        assert types.count('seo') == 22
+        assert types.count('heroBanner') == 3
+        assert types.count('mlMenuItem') == 4
+        assert types.count('homePage') == 1
+        assert types.count('profile') == 1
+        assert len(space['assets']) == 10
+
+    def test_every_link_resolves(self):
+        """Test that all entry and asset links point at generated items."""
+        # Arrange
+        space = SpaceGenerator(posts=10, assets=5, paragraphs=3).generate()
+
+        # Act
+        missing = [
+            link['id']
+            for item in space['entries'].values()
+            for link in iter_links(item['fields'])
+            if link['id'] not in (space['entries'] if link['linkType'] == 'Entry' else space['assets'])
+        ]
+
+        # Assert
+        assert missing == []
+
+    def test_fields_follow_schema_localization(self):
+        """Test that fields exist in the schema and localized ones cover every locale."""
+        # Arrange
+        registry = get_schema_registry()
+        space = SpaceGenerator(posts=3, locales=['en-US', 'es', 'fr']).generate()
+
+        # Act / Assert
+        for item in space['entries'].values():
+            content_type = item['sys']['contentType']['sys']['id']
+            for field_id, values in item['fields'].items():
+                field = registry.field(content_type, field_id)
+                assert field is not None, f"{content_type}.{field_id}"
+                if field.get('localized') and field['type'] != 'Link':
+                    assert set(values) == {'en-US', 'es', 'fr'}
+                else:
+                    assert set(values) == {'en-US'}
+
+    def test_homepage_blocks_cycle_block_types(self):
+        """Test that homepage blocks link every block type in order."""
+        # Arrange
+        space = SpaceGenerator(posts=1, blocks=len(BLOCK_TYPES)).generate()
+
+        # Act
+        homepage = space['entries']['homePage-1']
+        blocks = homepage['fields']['blocks']['en-US']
+        block_types = [
+            space['entries'][link['sys']['id']]['sys']['contentType']['sys']['id']
+            for link in blocks
+        ]
+
+        # Assert
+        assert block_types == BLOCK_TYPES
+
+    def test_same_seed_is_deterministic(self):
+        """Test that a seed always produces the same space."""
+        # Act
+        first = SpaceGenerator(posts=5, seed=3).generate()
+        second = SpaceGenerator(posts=5, seed=3).generate()
+        other = SpaceGenerator(posts=5, seed=4).generate()
+
+        # Assert
+        assert json.dumps(first, sort_keys=True) == json.dumps(second, sort_keys=True)
+        assert json.dumps(first, sort_keys=True) != json.dumps(other, sort_keys=True)
+
+
+class TestSnapshot:
+    """Test suite for consuming generated snapshots."""
+
+    def setup_method(self):
+        """Create temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_snapshot_loads_into_sync_store(self):
+        """Test that the snapshot is accepted as sync state for its space."""
+        # Arrange
+        space = SpaceGenerator(posts=4).generate()
+        with open(os.path.join(self.temp_dir, 'sync-state.json'), 'w', encoding='utf-8') as f:
+            json.dump(build_snapshot(space, 'synthetic'), f)
+        store = SyncStore(self.temp_dir, space_id='synthetic')
+
+        # Act
+        loaded = store.load()
+
+        # Assert
+        assert loaded is True
+        assert len(store.entries) == len(space['entries'])
+
+    def test_stand_in_serves_posts_with_includes(self):
+        """Test that the stand-in resolves post links without errors."""
+        # Arrange
+        data = SpaceData.from_dict(build_snapshot(SpaceGenerator(posts=4).generate(), 'synthetic'))
+
+        # Act
+        body = query_entries(data, {'content_type': 'blogPage', 'locale': 'es', 'include': '2'})
+
+        # Assert
+        assert body['total'] == 4
+        assert 'errors' not in body
+        assert body['items'][0]['fields']['title'].startswith('[es]')
+        included = {e['sys']['contentType']['sys']['id'] for e in body['includes']['Entry']}
+        assert included == {'seo', 'heroBanner'}